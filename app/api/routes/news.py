@@ -2,8 +2,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from ...db.session import get_db
-from ...schemas.news import News, NewsSearchParams, NewsSearchResponse
-from ...services.news_service import get_news, get_user_news, search_news
+from ...schemas.news import News, NewsSearchParams, NewsSearchResponse, RelatedNewsResponse
+from ...services.news_service import get_news, get_user_news, search_news, get_related_news
 from ...core.auth import get_current_user
 from ...db.models import User
 
@@ -18,10 +18,11 @@ async def search_news_endpoint(
     """
     키워드로 뉴스를 검색합니다.
     """
-    results = await search_news(db, params, current_user.id)
+    results, source_timings = await search_news(db, params, current_user.id)
     return NewsSearchResponse(
         total_count=len(results),
-        results=results
+        results=results,
+        source_timings=source_timings
     )
 
 @router.get("/{news_id}", response_model=News)
@@ -40,6 +41,28 @@ def get_news_endpoint(
         raise HTTPException(status_code=403, detail="Not authorized to access this news")
     return news
 
+@router.get("/{news_id}/related", response_model=RelatedNewsResponse)
+def get_related_news_endpoint(
+    news_id: int,
+    k: int = 10,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    의미상 관련된 뉴스와 거의 같은 뉴스를 조회합니다.
+    """
+    news = get_news(db, news_id)
+    if not news:
+        raise HTTPException(status_code=404, detail="News not found")
+    if news.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this news")
+    
+    result = get_related_news(db, news, current_user.id, k)
+    return RelatedNewsResponse(
+        related=[{"news": row, "score": score} for row, score in result["related"]],
+        duplicates=[{"news": row, "score": score} for row, score in result["duplicates"]]
+    )
+
 @router.get("/", response_model=List[News])
 def get_user_news_endpoint(
     skip: int = 0,
@@ -35,4 +35,14 @@ class NewsSearchParams(BaseModel):
 
 class NewsSearchResponse(BaseModel):
     total_count: int
-    results: list[News] 
\ No newline at end of file
+    results: list[News]
+    source_timings: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+class ScoredNews(BaseModel):
+    news: News
+    score: float
+
+class RelatedNewsResponse(BaseModel):
+    related: list[ScoredNews]
+    duplicates: list[ScoredNews]
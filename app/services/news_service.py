@@ -1,6 +1,11 @@
-from typing import List, Optional
+import logging
+from typing import Dict, List, Optional, Tuple
+from functools import partial
 from sqlalchemy.orm import Session
 from datetime import datetime
+from src.scrapers.source_orchestrator import SourceOrchestrator
+from src.scrapers.dedup import ResultDeduplicator
+from src.analyzers.article_index import get_article_index
 from ..db.models import NewsData, APIUsage
 from ..schemas.news import NewsCreate, NewsSearchParams
 from .search_service import GoogleSearchService, NaverSearchService
@@ -19,11 +24,67 @@ def create_news(db: Session, news: NewsCreate, user_id: int) -> NewsData:
     db.add(db_news)
     db.commit()
     db.refresh(db_news)
+    
+    # 유사 기사 색인 갱신 (실패해도 저장은 유지)
+    try:
+        get_article_index().add(db_news.id, f"{db_news.title or ''}\n{db_news.content or ''}")
+    except Exception as e:
+        logging.error(f"기사 색인 갱신 중 오류: {str(e)}")
+    
     return db_news
 
+def rebuild_article_index(db: Session, batch_size: int = 500) -> int:
+    """
+    DB에 저장된 기사 중 색인에 없는 기사를 색인에 추가합니다. (다른 경로로 저장되었거나 색인 도입 전 기사)
+    
+    Args:
+        db (Session): DB 세션
+        batch_size (int): 한 번에 읽을 행 수
+    
+    Returns:
+        int: 새로 색인된 기사 수
+    """
+    rows = db.query(NewsData.id, NewsData.title, NewsData.content)\
+        .order_by(NewsData.id)\
+        .yield_per(batch_size)
+    index = get_article_index()
+    added = index.backfill((row.id, f"{row.title or ''}\n{row.content or ''}") for row in rows)
+    index.save()
+    return added
+
 def get_news(db: Session, news_id: int) -> Optional[NewsData]:
     return db.query(NewsData).filter(NewsData.id == news_id).first()
 
+def get_related_news(
+    db: Session,
+    news: NewsData,
+    user_id: int,
+    k: int = 10,
+    duplicate_threshold: float = 0.8
+) -> Dict[str, List[Tuple[NewsData, float]]]:
+    """
+    색인에서 기사와 의미상 관련된 기사와 거의 같은 기사를 찾습니다. (사용자 본인의 기사만 반환)
+    """
+    index = get_article_index()
+    text = f"{news.title or ''}\n{news.content or ''}"
+    
+    # 공용 색인이므로 사용자 본인의 기사 중에서 상위 k개를 고름
+    own_ids = [row.id for row in db.query(NewsData.id).filter(NewsData.user_id == user_id)]
+    related = index.related(text=text, article_id=news.id, k=k, allowed_ids=own_ids)
+    duplicates = index.near_duplicates(text, duplicate_threshold, exclude=news.id)
+    
+    ids = {article_id for article_id, _ in related + duplicates}
+    rows = {
+        row.id: row for row in db.query(NewsData)
+        .filter(NewsData.id.in_(ids), NewsData.user_id == user_id)
+        .all()
+    } if ids else {}
+    
+    return {
+        "related": [(rows[i], score) for i, score in related if i in rows],
+        "duplicates": [(rows[i], score) for i, score in duplicates if i in rows]
+    }
+
 def get_user_news(
     db: Session,
     user_id: int,
@@ -46,91 +107,53 @@ def update_api_usage(db: Session, user_id: int, endpoint: str) -> None:
     db.add(usage)
     db.commit()
 
+# 출처별 검색 서비스와 API 사용량 기록용 엔드포인트 이름
+SEARCH_SERVICES = {
+    "google": (GoogleSearchService, "google_search"),
+    "naver": (NaverSearchService, "naver_search"),
+    "sk_hynix": (SKHynixNewsService, "sk_hynix_search"),
+    "samsung_semiconductor": (SamsungSemiconNewsService, "samsung_semiconductor_search")
+}
+
 async def search_news(
     db: Session,
     params: NewsSearchParams,
     user_id: int
-) -> List[NewsData]:
-    results = []
-    
-    if "google" in params.sources:
-        google_service = GoogleSearchService()
-        google_results = await google_service.search(
-            keyword=params.keyword,
-            num_results=params.num_results,
-            date_range=params.date_range
-        )
-        for result in google_results:
-            news = NewsCreate(
-                source="google",
-                title=result["title"],
-                content=result.get("content", ""),
-                url=result["url"],
-                published_date=result.get("published_date"),
-                metadata=result
+) -> Tuple[List[NewsData], Dict[str, Dict]]:
+    tasks = {}
+    for source, (service_class, _) in SEARCH_SERVICES.items():
+        if source in params.sources:
+            tasks[source] = partial(
+                service_class().search,
+                keyword=params.keyword,
+                num_results=params.num_results,
+                date_range=params.date_range
             )
-            db_news = create_news(db, news, user_id)
-            results.append(db_news)
-        update_api_usage(db, user_id, "google_search")
     
-    if "naver" in params.sources:
-        naver_service = NaverSearchService()
-        naver_results = await naver_service.search(
-            keyword=params.keyword,
-            num_results=params.num_results,
-            date_range=params.date_range
-        )
-        for result in naver_results:
-            news = NewsCreate(
-                source="naver",
-                title=result["title"],
-                content=result.get("content", ""),
-                url=result["url"],
-                published_date=result.get("published_date"),
-                metadata=result
-            )
-            db_news = create_news(db, news, user_id)
-            results.append(db_news)
-        update_api_usage(db, user_id, "naver_search")
+    # 출처별 동시 검색 (느리거나 실패한 출처는 빈 결과로 처리)
+    source_results = await SourceOrchestrator().run(tasks)
     
-    if "sk_hynix" in params.sources:
-        sk_service = SKHynixNewsService()
-        sk_results = await sk_service.search(
-            keyword=params.keyword,
-            num_results=params.num_results,
-            date_range=params.date_range
-        )
-        for result in sk_results:
-            news = NewsCreate(
-                source="sk_hynix",
-                title=result["title"],
-                content=result.get("content", ""),
-                url=result["url"],
-                published_date=result.get("published_date"),
-                metadata=result
-            )
-            db_news = create_news(db, news, user_id)
-            results.append(db_news)
-        update_api_usage(db, user_id, "sk_hynix_search")
+    # 여러 출처에 실린 같은 기사는 하나로 병합하여 한 번만 저장
+    deduplicator = ResultDeduplicator()
+    for source, source_result in source_results.items():
+        for result in source_result.results:
+            deduplicator.add({**result, "source": result.get("source", source)})
+        if source_result.status == "ok":
+            update_api_usage(db, user_id, SEARCH_SERVICES[source][1])
     
-    if "samsung_semiconductor" in params.sources:
-        samsung_service = SamsungSemiconNewsService()
-        samsung_results = await samsung_service.search(
-            keyword=params.keyword,
-            num_results=params.num_results,
-            date_range=params.date_range
+    # DB 세션은 스레드 간에 공유할 수 없으므로 저장은 순차적으로 수행
+    results = []
+    for result in deduplicator.results():
+        news = NewsCreate(
+            source=result["source"],
+            title=result["title"],
+            content=result.get("content", ""),
+            url=result["url"],
+            published_date=result.get("published_date"),
+            metadata=result
         )
-        for result in samsung_results:
-            news = NewsCreate(
-                source="samsung_semiconductor",
-                title=result["title"],
-                content=result.get("content", ""),
-                url=result["url"],
-                published_date=result.get("published_date"),
-                metadata=result
-            )
-            db_news = create_news(db, news, user_id)
-            results.append(db_news)
-        update_api_usage(db, user_id, "samsung_semiconductor_search")
+        db_news = create_news(db, news, user_id)
+        results.append(db_news)
     
-    return results 
\ No newline at end of file
+    source_timings = {source: result.to_dict() for source, result in source_results.items()}
+    return results, source_timings
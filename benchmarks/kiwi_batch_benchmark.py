@@ -0,0 +1,64 @@
+"""
+Kiwi 형태소 분석 처리량 벤치마크
+
+기존 방식(분석기마다 Kiwi 생성, 텍스트를 하나씩 analyze)과
+공용 Kiwi + 일괄 tokenize 방식의 초당 처리 문서 수를 비교합니다.
+
+사용법:
+    python benchmarks/kiwi_batch_benchmark.py [--csv data/skhynix/leadership_press.csv] [--limit 200]
+"""
+import os
+import sys
+import time
+import argparse
+import pandas as pd
+from kiwipiepy import Kiwi
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.text_preprocessing import TextPreprocessor
+from src.utils.kiwi_registry import tokenize_many
+
+def load_texts(csv_path: str, limit: int) -> list:
+    df = pd.read_csv(csv_path)
+    texts = df['content'].dropna().astype(str).tolist()
+    return texts[:limit] if limit else texts
+
+def run_sequential(texts: list) -> tuple:
+    """기존 방식: 요청마다 Kiwi를 두 번(TextAnalyzer, TextPreprocessor) 로드하고 텍스트를 하나씩 분석"""
+    started = time.perf_counter()
+    kiwi = Kiwi()
+    Kiwi()
+    loaded = time.perf_counter()
+    for text in texts:
+        kiwi.analyze(text)
+    return loaded - started, time.perf_counter() - loaded
+
+def run_batched(texts: list, num_workers: int) -> tuple:
+    """변경 방식: 공용 Kiwi를 프로세스당 한 번 로드하고 전체 텍스트를 일괄 분석"""
+    started = time.perf_counter()
+    kiwi = Kiwi(num_workers=num_workers)
+    loaded = time.perf_counter()
+    tokenize_many(texts, kiwi)
+    return loaded - started, time.perf_counter() - loaded
+
+def main():
+    parser = argparse.ArgumentParser(description="Kiwi 일괄 분석 벤치마크")
+    parser.add_argument('--csv', default=os.path.join("data", "skhynix", "leadership_press.csv"))
+    parser.add_argument('--limit', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    preprocessor = TextPreprocessor()
+    texts = [preprocessor.preprocess(text) for text in load_texts(args.csv, args.limit)]
+    print(f"문서 수: {len(texts)}, 평균 길이: {sum(map(len, texts)) / max(len(texts), 1):.0f}자")
+
+    print(f"{'':45s} {'load':>8s} {'analyze':>8s} {'docs/sec':>10s}")
+    for name, (load_time, elapsed) in [
+        ("sequential (per-text analyze)", run_sequential(texts)),
+        (f"batched tokenize (num_workers={args.workers})", run_batched(texts, args.workers))
+    ]:
+        print(f"{name:45s} {load_time:7.2f}s {elapsed:7.2f}s {len(texts) / elapsed:10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
+import logging
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.routes import news, users, analysis
-from app.db.session import engine
+from app.db.session import engine, SessionLocal
 from app.db.models import Base
+from app.services.news_service import rebuild_article_index
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
@@ -28,6 +31,21 @@ app.include_router(users.router, prefix=settings.API_V1_STR, tags=["users"])
 app.include_router(news.router, prefix=settings.API_V1_STR, tags=["news"])
 app.include_router(analysis.router, prefix=settings.API_V1_STR, tags=["analysis"])
 
+def _rebuild_article_index():
+    db = SessionLocal()
+    try:
+        added = rebuild_article_index(db)
+        logging.info(f"기사 색인에 {added}건 추가")
+    except Exception as e:
+        logging.error(f"기사 색인 재구성 중 오류: {str(e)}")
+    finally:
+        db.close()
+
+@app.on_event("startup")
+async def startup_event():
+    # 색인에 빠진 기존 기사를 백그라운드에서 채움 (서버 시작을 막지 않음)
+    threading.Thread(target=_rebuild_article_index, name="article-index-rebuild", daemon=True).start()
+
 @app.get("/")
 async def root():
     return {
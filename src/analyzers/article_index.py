@@ -0,0 +1,385 @@
+import os
+import json
+import atexit
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from ..scrapers.dedup import normalize_text
+
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+class SentenceEncoder:
+    """sentence-transformers 임베딩 (CPU, 첫 호출 시 모델 로드)"""
+
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL, batch_size: int = 32):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+        ).astype(np.float32)
+
+class MinHashLSH:
+    """문자 n-gram MinHash 서명과 밴드 해시 테이블로 유사 중복 후보를 찾습니다."""
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 5, seed: int = 42):
+        """
+        Args:
+            num_perm (int): 서명 길이
+            bands (int): 밴드 수 (num_perm 의 약수, 많을수록 낮은 유사도도 후보가 됨)
+            shingle_size (int): 문자 n-gram 길이
+            seed (int): 해시 함수 난수 시드
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm 은 bands 의 배수여야 합니다.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        self.signatures: Dict[int, np.ndarray] = {}
+        self._tables: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def signature(self, text: str) -> np.ndarray:
+        compact = normalize_text(text).replace(' ', '')
+        if len(compact) <= self.shingle_size:
+            shingles = {compact}
+        else:
+            shingles = {compact[i:i + self.shingle_size] for i in range(len(compact) - self.shingle_size + 1)}
+
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        permuted = (hashes[:, None] * self._a[None, :] + self._b[None, :]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+    def add(self, key: int, signature: np.ndarray) -> None:
+        self.signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._tables[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray, threshold: float = 0.8) -> List[Tuple[int, float]]:
+        """
+        추정 Jaccard 유사도가 threshold 이상인 항목을 반환합니다.
+
+        Returns:
+            List[Tuple[int, float]]: (키, 추정 유사도) 리스트 (유사도 내림차순)
+        """
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._tables[band].get(band_key, []))
+
+        matches = []
+        for key in candidates:
+            similarity = float(np.mean(self.signatures[key] == signature))
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+class ArticleIndex:
+    """
+    저장된 기사 유사도 색인.
+    MinHash LSH로 유사 중복 기사를, 문장 임베딩 벡터로 의미상 관련 기사를 찾습니다.
+    임베딩은 추가된 기사를 모아 두었다가 백그라운드 스레드에서 일괄 계산하므로
+    add() 는 MinHash 계산만 하고 바로 반환합니다. related() 는 임베딩이 끝난 기사만 검색합니다.
+    색인은 디스크(index.npz)에 저장됩니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = os.path.join("data", "index", "articles"),
+        encoder: Optional[Callable[[List[str]], np.ndarray]] = None,
+        embed_batch_size: int = 32,
+        autosave_every: int = 100
+    ):
+        """
+        Args:
+            path (Optional[str]): 저장 디렉토리 (None이면 저장하지 않음)
+            encoder (Optional[Callable]): 텍스트 리스트 -> 정규화된 임베딩 행렬 (기본값: SentenceEncoder)
+            embed_batch_size (int): 이만큼 기사가 쌓이면 백그라운드에서 임베딩을 계산
+            autosave_every (int): 이만큼 기사가 추가될 때마다 백그라운드에서 디스크에 저장
+        """
+        self.path = path
+        self.encoder = encoder or SentenceEncoder()
+        self.embed_batch_size = embed_batch_size
+        self.autosave_every = autosave_every
+
+        self.lsh = MinHashLSH()
+        self._ids: List[int] = []
+        self._rows: Dict[int, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._pending: List[Tuple[int, str]] = []
+        self._embedding: List[Tuple[int, str]] = []  # 임베딩 계산 중인 기사
+        self._unsaved = 0
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="article-index")
+        self._flush_scheduled = False
+
+        if path and os.path.exists(os.path.join(path, "index.npz")):
+            self.load()
+            # 지난 실행에서 임베딩하지 못한 기사
+            self._schedule_flush()
+
+    def __len__(self) -> int:
+        return len(self.lsh.signatures)
+
+    def add(self, article_id: int, text: str) -> None:
+        """
+        기사를 색인에 추가합니다. 같은 ID가 이미 있으면 무시합니다.
+
+        Args:
+            article_id (int): 기사 ID (NewsData.id)
+            text (str): 제목과 본문
+        """
+        signature = self.lsh.signature(text)
+        with self._lock:
+            if article_id in self.lsh.signatures:
+                return
+            self.lsh.add(article_id, signature)
+            self._pending.append((article_id, text))
+            self._unsaved += 1
+
+            due = len(self._pending) >= self.embed_batch_size or (self.path and self._unsaved >= self.autosave_every)
+        if due:
+            self._schedule_flush()
+
+    def backfill(self, articles: Iterable[Tuple[int, str]]) -> int:
+        """
+        기존 기사를 색인에 추가합니다. 이미 색인된 기사는 건너뜁니다.
+
+        Args:
+            articles (Iterable[Tuple[int, str]]): (기사 ID, 제목과 본문) 스트림
+
+        Returns:
+            int: 새로 추가된 기사 수
+        """
+        added = 0
+        for article_id, text in articles:
+            if article_id not in self.lsh.signatures:
+                self.add(article_id, text)
+                added += 1
+        # 배치 크기에 못 미친 나머지도 임베딩
+        self._schedule_flush()
+        return added
+
+    def flush(self) -> None:
+        """쌓인 기사의 임베딩 계산이 끝날 때까지 기다립니다. (진행 중인 백그라운드 계산 포함)"""
+        self._executor.submit(self._flush_all).result()
+
+    def near_duplicates(self, text: str, threshold: float = 0.8, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        본문이 거의 같은 기사를 찾습니다.
+
+        Args:
+            text (str): 기준 텍스트
+            threshold (float): 최소 추정 Jaccard 유사도
+            exclude (Optional[int]): 결과에서 제외할 기사 ID
+
+        Returns:
+            List[Tuple[int, float]]: (기사 ID, 유사도) 리스트
+        """
+        with self._lock:
+            matches = self.lsh.query(self.lsh.signature(text), threshold)
+        return [(article_id, score) for article_id, score in matches if article_id != exclude]
+
+    def related(
+        self,
+        text: Optional[str] = None,
+        article_id: Optional[int] = None,
+        k: int = 10,
+        allowed_ids: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        의미상 관련된 기사 k개를 찾습니다. 색인에 있는 기사는 ID로, 새 텍스트는 text로 질의합니다.
+        아직 임베딩되지 않은 기사는 검색 대상에서 빠집니다.
+
+        Args:
+            text (Optional[str]): 기준 텍스트
+            article_id (Optional[int]): 기준 기사 ID (임베딩되어 있지 않으면 text로 질의)
+            k (int): 반환할 기사 수
+            allowed_ids (Optional[Iterable[int]]): 이 기사들 중에서만 검색 (예: 사용자 본인의 기사)
+
+        Returns:
+            List[Tuple[int, float]]: (기사 ID, 코사인 유사도) 리스트 (유사도 내림차순, 기준 기사 제외)
+        """
+        # 모델 호출 중에는 잠금을 잡지 않도록 질의 텍스트를 먼저 임베딩
+        text_query = None
+        if text is not None and article_id not in self._rows:
+            text_query = np.asarray(self.encoder([text]), dtype=np.float32)[0]
+        allowed = None if allowed_ids is None else list(allowed_ids)
+
+        with self._lock:
+            if self._vectors is None or not self._ids:
+                return []
+
+            if article_id is not None and article_id in self._rows:
+                query = self._vectors[self._rows[article_id]]
+            elif text_query is not None:
+                query = text_query
+            else:
+                raise KeyError(f"색인에 없는 기사입니다: {article_id}")
+
+            if allowed is None:
+                rows = np.arange(len(self._ids))
+            else:
+                rows = np.array([self._rows[i] for i in allowed if i in self._rows], dtype=np.int64)
+            if article_id in self._rows:
+                rows = rows[rows != self._rows[article_id]]
+
+            k = min(k, len(rows))
+            if k <= 0:
+                return []
+            scores = self._vectors[rows] @ query
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def save(self) -> None:
+        """색인을 디스크에 저장합니다. 아직 임베딩되지 않은 기사는 원문을 함께 저장하여 다음 실행 때 계산합니다."""
+        if not self.path:
+            return
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            keys = list(self.lsh.signatures)
+            dim = self._vectors.shape[1] if self._vectors is not None else 0
+            temp_path = os.path.join(self.path, "index.tmp.npz")
+            np.savez(
+                temp_path,
+                signature_ids=np.array(keys, dtype=np.int64),
+                signatures=np.array([self.lsh.signatures[key] for key in keys], dtype=np.uint64).reshape(len(keys), -1),
+                vector_ids=np.array(self._ids, dtype=np.int64),
+                vectors=self._vectors[:len(self._ids)] if self._vectors is not None else np.zeros((0, dim), np.float32),
+                pending=np.frombuffer(
+                    json.dumps(self._embedding + self._pending, ensure_ascii=False).encode('utf-8'), dtype=np.uint8
+                )
+            )
+            os.replace(temp_path, os.path.join(self.path, "index.npz"))
+            self._unsaved = 0
+
+    def load(self) -> None:
+        """디스크에 저장된 색인을 불러옵니다."""
+        with self._lock:
+            data = np.load(os.path.join(self.path, "index.npz"))
+            for key, signature in zip(data['signature_ids'].tolist(), data['signatures']):
+                self.lsh.add(key, signature)
+            self._ids = data['vector_ids'].tolist()
+            self._rows = {article_id: row for row, article_id in enumerate(self._ids)}
+            self._vectors = data['vectors'] if len(self._ids) else None
+            if 'pending' in data:
+                self._pending = [(article_id, text) for article_id, text in json.loads(data['pending'].tobytes().decode('utf-8'))]
+
+    def _schedule_flush(self) -> None:
+        """쌓인 기사가 있으면 백그라운드 임베딩을 예약합니다. (이미 예약되어 있으면 무시)"""
+        with self._lock:
+            if self._flush_scheduled or not (self._pending or (self.path and self._unsaved >= self.autosave_every)):
+                return
+            self._flush_scheduled = True
+        # 모델 로딩/임베딩/저장은 요청 스레드를 막지 않도록 백그라운드에서 수행
+        self._executor.submit(self._background_flush)
+
+    def _background_flush(self) -> None:
+        failed = False
+        try:
+            self._flush_all()
+            if self.path and self._unsaved >= self.autosave_every:
+                self.save()
+        except Exception as e:
+            failed = True
+            logging.error(f"기사 색인 임베딩 계산 중 오류: {str(e)}")
+        finally:
+            with self._lock:
+                # 마지막 배치를 계산하는 동안 추가된 기사는 다시 예약 (오류 시에는 다음 add() 까지 대기)
+                resubmit = bool(self._pending) and not failed
+                self._flush_scheduled = resubmit
+        if resubmit:
+            self._executor.submit(self._background_flush)
+
+    def _flush_all(self) -> None:
+        """쌓인 기사가 없을 때까지 배치 단위로 임베딩합니다."""
+        while self._flush_pending():
+            pass
+
+    def _flush_pending(self) -> bool:
+        """
+        쌓인 기사 한 배치의 임베딩을 계산하여 벡터 색인에 추가합니다. 임베딩 계산 중에는 잠금을 풀어 둡니다.
+
+        Returns:
+            bool: 임베딩한 기사가 있는지 여부
+        """
+        with self._lock:
+            if not self._pending:
+                return False
+            pending, self._pending = self._pending[:self.embed_batch_size], self._pending[self.embed_batch_size:]
+            self._embedding.extend(pending)
+        try:
+            vectors = np.asarray(self.encoder([text for _, text in pending]), dtype=np.float32)
+        except Exception:
+            with self._lock:
+                self._finish_embedding(pending)
+                self._pending = pending + self._pending
+            raise
+
+        with self._lock:
+            self._finish_embedding(pending)
+            self._append_vectors(pending, vectors)
+        return True
+
+    def _finish_embedding(self, pending: List[Tuple[int, str]]) -> None:
+        done = {article_id for article_id, _ in pending}
+        self._embedding = [item for item in self._embedding if item[0] not in done]
+
+    def _append_vectors(self, pending: List[Tuple[int, str]], vectors: np.ndarray) -> None:
+        count = len(self._ids)
+        if self._vectors is None:
+            self._vectors = np.empty((max(len(pending), 1024), vectors.shape[1]), dtype=np.float32)
+        elif count + len(pending) > self._vectors.shape[0]:
+            grown = np.empty((max(self._vectors.shape[0] * 2, count + len(pending)), vectors.shape[1]), dtype=np.float32)
+            grown[:count] = self._vectors[:count]
+            self._vectors = grown
+
+        self._vectors[count:count + len(pending)] = vectors
+        for offset, (article_id, _) in enumerate(pending):
+            self._rows[article_id] = count + offset
+            self._ids.append(article_id)
+
+_index: Optional[ArticleIndex] = None
+_index_lock = threading.Lock()
+
+def get_article_index() -> ArticleIndex:
+    """
+    프로세스 공용 기사 색인을 반환합니다.
+    저장 경로는 ARTICLE_INDEX_PATH, 임베딩 모델은 ARTICLE_EMBEDDING_MODEL 환경 변수로 지정합니다.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ArticleIndex(
+                    path=os.getenv("ARTICLE_INDEX_PATH", os.path.join("data", "index", "articles")),
+                    encoder=SentenceEncoder(os.getenv("ARTICLE_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL))
+                )
+                # 종료 시 마지막 변경분 저장
+                atexit.register(_index.save)
+    return _index
@@ -0,0 +1,129 @@
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+WINDOWS = ('document', 'paragraph', 'sentence')
+MEASURES = ('count', 'pmi', 'npmi')
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+def split_windows(text: str, window: str = 'document') -> List[str]:
+    """
+    텍스트를 동시 출현을 셀 단위(문서/문단/문장)로 나눕니다.
+
+    Args:
+        text (str): 원문
+        window (str): 'document', 'paragraph' (빈 줄 기준), 'sentence' (문장부호/줄바꿈 기준)
+
+    Returns:
+        List[str]: 단위별 텍스트 (빈 단위 제외)
+    """
+    if window == 'document':
+        units = [text]
+    elif window == 'paragraph':
+        units = _PARAGRAPH_BREAK.split(text)
+    elif window == 'sentence':
+        units = _SENTENCE_BREAK.split(text)
+    else:
+        raise ValueError(f"지원하지 않는 동시 출현 단위입니다: {window}")
+    return [unit for unit in units if unit.strip()]
+
+def build_incidence_matrix(
+    texts: Iterable[str],
+    keywords: Sequence[str],
+    window: str = 'document'
+) -> Tuple[sparse.csr_matrix, Dict[str, int]]:
+    """
+    단위(문서/문단/문장) x 키워드 희소 출현 행렬을 만듭니다. 단위에 키워드 토큰이 있으면 1입니다.
+
+    Args:
+        texts (Iterable[str]): 텍스트 리스트 (공백으로 토큰 구분)
+        keywords (Sequence[str]): 키워드 리스트 (중복은 하나로 합침)
+        window (str): 동시 출현 단위 ('document', 'paragraph', 'sentence')
+
+    Returns:
+        Tuple[sparse.csr_matrix, Dict[str, int]]: 단위 x 키워드 행렬, 키워드 -> 열 번호
+    """
+    vocabulary = {keyword: column for column, keyword in enumerate(dict.fromkeys(keywords))}
+    indptr = [0]
+    indices = []
+    for text in texts:
+        for unit in split_windows(text, window):
+            columns = {vocabulary[token] for token in unit.split() if token in vocabulary}
+            indices.extend(sorted(columns))
+            indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, len(vocabulary))
+    )
+    return matrix, vocabulary
+
+def cooccurrence_matrix(incidence: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    키워드 동시 출현 행렬(XᵀX)을 계산합니다. (i, j) 는 두 키워드가 함께 나온 단위 수, 대각선은 키워드가 나온 단위 수입니다.
+
+    Args:
+        incidence (sparse.csr_matrix): build_incidence_matrix 결과
+
+    Returns:
+        sparse.csr_matrix: 키워드 x 키워드 행렬
+    """
+    return (incidence.T @ incidence).tocsr()
+
+def pmi_matrix(cooccurrence: sparse.csr_matrix, num_units: int, normalized: bool = False) -> sparse.csr_matrix:
+    """
+    동시 출현 횟수를 PMI 또는 NPMI로 변환합니다. 함께 나온 적이 없는 쌍은 0(희소)으로 남습니다.
+
+    Args:
+        cooccurrence (sparse.csr_matrix): cooccurrence_matrix 결과
+        num_units (int): 전체 단위 수 (incidence.shape[0])
+        normalized (bool): True이면 NPMI (-1 ~ 1)
+
+    Returns:
+        sparse.csr_matrix: PMI/NPMI 행렬
+    """
+    coo = cooccurrence.tocoo()
+    marginals = cooccurrence.diagonal().astype(np.float64)
+    joint = coo.data.astype(np.float64) / num_units
+    pmi = np.log(joint / (marginals[coo.row] / num_units * marginals[coo.col] / num_units))
+    if normalized:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 모든 단위에 함께 나온 경우(p=1)는 완전한 동시 출현으로 보고 1
+            pmi = np.where(joint < 1, pmi / -np.log(joint), 1.0)
+    return sparse.csr_matrix((pmi.astype(np.float32), (coo.row, coo.col)), shape=cooccurrence.shape)
+
+def keyword_cooccurrence(
+    texts: Iterable[str],
+    keywords: Sequence[str],
+    window: str = 'document',
+    measure: str = 'count'
+) -> pd.DataFrame:
+    """
+    키워드 동시 출현 표를 계산합니다. 계산은 희소 행렬로 하고 마지막에만 DataFrame으로 변환합니다.
+
+    Args:
+        texts (Iterable[str]): 텍스트 리스트
+        keywords (Sequence[str]): 키워드 리스트
+        window (str): 동시 출현 단위 ('document', 'paragraph', 'sentence')
+        measure (str): 'count' (함께 나온 단위 수), 'pmi', 'npmi'
+
+    Returns:
+        pd.DataFrame: 키워드 x 키워드 표 (대각선은 0)
+    """
+    if measure not in MEASURES:
+        raise ValueError(f"지원하지 않는 측정 방식입니다: {measure}")
+
+    incidence, vocabulary = build_incidence_matrix(texts, keywords, window)
+    matrix = cooccurrence_matrix(incidence)
+    if measure != 'count':
+        matrix = pmi_matrix(matrix, incidence.shape[0], normalized=(measure == 'npmi'))
+
+    dense = matrix.toarray()
+    np.fill_diagonal(dense, 0)
+    if measure == 'count':
+        dense = dense.astype(np.int64)
+    return pd.DataFrame(dense, index=list(vocabulary), columns=list(vocabulary))
@@ -0,0 +1,182 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from ..utils.keyword_matcher import KeywordMatcher
+
+PERIODS = {'year': 'Y', 'quarter': 'Q', 'month': 'M'}
+
+def build_match_matrix(texts: Iterable[str], matcher: KeywordMatcher) -> Tuple[sparse.csr_matrix, List[str]]:
+    """
+    문서 x 키워드 희소 출현 행렬을 만듭니다. 문서에 키워드가 한 번 이상 나오면 1입니다.
+
+    Args:
+        texts (Iterable[str]): 텍스트 리스트
+        matcher (KeywordMatcher): 키워드 검색기
+
+    Returns:
+        Tuple[sparse.csr_matrix, List[str]]: 문서 x 키워드 행렬, 열 순서의 키워드 리스트
+    """
+    columns = {keyword: column for column, keyword in enumerate(matcher.keywords)}
+    indptr = [0]
+    indices = []
+    for text in texts:
+        if isinstance(text, str):
+            indices.extend(sorted(columns[keyword] for keyword in matcher.keywords_in(text)))
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, len(columns))
+    )
+    return matrix, list(matcher.keywords)
+
+def _period_values(df: pd.DataFrame, period: str, date_column: str) -> pd.Series:
+    if period not in PERIODS:
+        raise ValueError(f"지원하지 않는 기간 단위입니다: {period}")
+    # 연도 컬럼이 이미 있으면 그대로 사용
+    if period == 'year' and 'year' in df.columns:
+        return df['year']
+    dates = pd.to_datetime(df[date_column], errors='coerce')
+    if period == 'year':
+        return dates.dt.year
+    return dates.dt.to_period(PERIODS[period])
+
+def keyword_trends(
+    df: pd.DataFrame,
+    matcher: KeywordMatcher,
+    text_column: str = 'processed_content',
+    period: str = 'year',
+    date_column: str = 'date',
+    by: Sequence[str] = ()
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    기간(및 추가 그룹)별 키워드 등장 문서 수를 계산합니다.
+    문서를 한 번씩만 검색하여 출현 행렬을 만들고, 그룹 지시 행렬과의 곱 한 번으로 집계합니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        matcher (KeywordMatcher): 키워드 검색기
+        text_column (str): 텍스트 컬럼명
+        period (str): 'year', 'quarter', 'month'
+        date_column (str): 날짜 컬럼명 ('year' 컬럼이 없거나 분기/월 단위일 때 사용)
+        by (Sequence[str]): 추가 그룹 컬럼 (예: ['source'])
+
+    Returns:
+        Tuple[pd.DataFrame, pd.Series]: (그룹 x 키워드 문서 수 표, 그룹별 전체 문서 수)
+            인덱스는 by 컬럼들과 기간 순서이며, 기간이 없는 문서는 제외됩니다.
+    """
+    keys = {column: df[column].to_numpy() for column in by}
+    keys[period] = _period_values(df, period, date_column).to_numpy()
+    grouped = pd.DataFrame(keys).groupby(list(keys), sort=True)
+    codes = grouped.ngroup().to_numpy()
+    documents = grouped.size()
+
+    matrix, keywords = build_match_matrix(df[text_column], matcher)
+    rows = np.flatnonzero(codes >= 0)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (codes[rows], rows)),
+        shape=(len(documents), matrix.shape[0])
+    )
+    counts = pd.DataFrame((indicator @ matrix).toarray(), index=documents.index, columns=keywords)
+    return counts, documents.rename('documents')
+
+def fill_missing_periods(counts: pd.DataFrame, by: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    문서가 없는 기간을 0으로 채워 모든 그룹이 전체 기간(처음 ~ 마지막)을 빠짐없이 갖도록 합니다.
+
+    Args:
+        counts (pd.DataFrame): keyword_trends 결과 (마지막 인덱스 레벨이 기간)
+        by (Sequence[str]): keyword_trends 에 사용한 추가 그룹 컬럼
+
+    Returns:
+        pd.DataFrame: 기간이 연속된 표
+    """
+    if counts.empty:
+        return counts
+    periods = counts.index.get_level_values(-1)
+    if isinstance(periods[0], pd.Period):
+        full = pd.period_range(periods.min(), periods.max(), freq=periods[0].freq)
+    else:
+        full = pd.Index(range(int(periods.min()), int(periods.max()) + 1))
+
+    if not by:
+        index = pd.Index(full, name=counts.index.names[-1])
+    else:
+        groups = counts.index.droplevel(-1).unique()
+        index = pd.MultiIndex.from_tuples(
+            [(*(group if isinstance(group, tuple) else (group,)), period) for group in groups for period in full],
+            names=counts.index.names
+        )
+    return counts.reindex(index, fill_value=0)
+
+def rolling_trend(counts: pd.DataFrame, window: int = 3, by: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    기간 순서로 이동 평균을 계산합니다. by 가 있으면 그룹마다 따로 계산합니다.
+    빠진 기간은 0으로 채운 뒤 계산하므로 결과에는 전체 기간이 포함됩니다.
+
+    Args:
+        counts (pd.DataFrame): keyword_trends 결과
+        window (int): 이동 평균에 사용할 기간 수
+        by (Sequence[str]): keyword_trends 에 사용한 추가 그룹 컬럼
+
+    Returns:
+        pd.DataFrame: 이동 평균 표
+    """
+    counts = fill_missing_periods(counts, by)
+    if not by:
+        return counts.rolling(window, min_periods=1).mean()
+    return counts.groupby(level=list(by), group_keys=False).apply(
+        lambda group: group.rolling(window, min_periods=1).mean()
+    )
+
+def growth_rate(counts: pd.DataFrame, by: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    직전 기간 대비 증가율을 계산합니다. 빠진 기간은 0으로 채우며, 직전 기간 값이 0이면 NaN입니다.
+
+    Args:
+        counts (pd.DataFrame): keyword_trends 결과 (또는 rolling_trend 결과)
+        by (Sequence[str]): keyword_trends 에 사용한 추가 그룹 컬럼
+
+    Returns:
+        pd.DataFrame: 증가율 표 (0.5 = 50% 증가)
+    """
+    counts = fill_missing_periods(counts, by)
+    grouped = counts.groupby(level=list(by)) if by else counts
+    return grouped.pct_change(fill_method=None).replace([np.inf, -np.inf], np.nan)
+
+def keyword_trend_report(
+    df: pd.DataFrame,
+    matcher: KeywordMatcher,
+    text_column: str = 'processed_content',
+    period: str = 'year',
+    date_column: str = 'date',
+    by: Sequence[str] = (),
+    rolling_window: Optional[int] = 3
+) -> Dict[str, pd.DataFrame]:
+    """
+    키워드 추이 보고서에 필요한 표를 한 번에 계산합니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        matcher (KeywordMatcher): 키워드 검색기
+        text_column (str): 텍스트 컬럼명
+        period (str): 'year', 'quarter', 'month'
+        date_column (str): 날짜 컬럼명
+        by (Sequence[str]): 추가 그룹 컬럼
+        rolling_window (Optional[int]): 이동 평균 기간 수
+
+    Returns:
+        Dict[str, pd.DataFrame]: counts (문서 수), documents (기간별 전체 문서 수), share (문서 비율),
+            rolling (이동 평균, rolling_window 가 None이면 없음), growth (증가율)
+    """
+    counts, documents = keyword_trends(df, matcher, text_column, period, date_column, by)
+    report = {
+        'counts': counts,
+        'documents': documents,
+        'share': counts.div(documents, axis=0),
+        'growth': growth_rate(counts, by)
+    }
+    if rolling_window:
+        report['rolling'] = rolling_trend(counts, rolling_window, by)
+    return report
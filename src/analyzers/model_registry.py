@@ -0,0 +1,198 @@
+import os
+import re
+import json
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+from gensim import corpora, models
+from .topic_modeling import TopicModeler
+
+_VERSION_DIR = re.compile(r'^v(\d+)$')
+
+class ModelRegistry:
+    """
+    학습된 토픽 모델 저장소.
+    모델은 <root>/<name>/v<N>/ 아래 gensim 형식(model.lda, dictionary.dict, meta.json)으로 저장되며,
+    추론용으로 불러올 때는 큰 배열을 메모리 매핑합니다.
+    """
+
+    def __init__(self, root: str = os.path.join("data", "models"), max_loaded: int = 8):
+        """
+        Args:
+            root (str): 저장 디렉토리
+            max_loaded (int): 메모리에 유지할 최대 모델 수
+        """
+        self.root = root
+        self.max_loaded = max_loaded
+        self._loaded: "OrderedDict[str, TopicModeler]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, name: str, modeler: TopicModeler, metadata: Optional[Dict] = None) -> str:
+        """
+        학습된 모델과 사전을 새 버전으로 저장합니다.
+
+        Args:
+            name (str): 모델 이름
+            modeler (TopicModeler): 학습이 끝난 모델
+            metadata (Optional[Dict]): 함께 저장할 정보
+
+        Returns:
+            str: 저장된 버전 키 (예: 'news/v3')
+        """
+        if modeler.model is None or modeler.dictionary is None:
+            raise ValueError("모델을 먼저 학습해야 합니다.")
+        self._validate_name(name)
+
+        with self._lock:
+            version = (self._latest_version(name) or 0) + 1
+            version_dir = self._version_dir(name, version)
+            os.makedirs(version_dir)
+
+        # 큰 배열은 별도 파일(.npy)로 저장하여 불러올 때 메모리 매핑되도록 함
+        modeler.model.save(os.path.join(version_dir, "model.lda"), sep_limit=0)
+        modeler.dictionary.save(os.path.join(version_dir, "dictionary.dict"))
+        with open(os.path.join(version_dir, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump(dict(
+                metadata or {},
+                name=name,
+                version=version,
+                num_topics=modeler.model.num_topics,
+                num_terms=len(modeler.dictionary),
+                created_at=datetime.now().isoformat()
+            ), f, ensure_ascii=False, indent=2)
+
+        return f"{name}/v{version}"
+
+    def load(self, name: str, version: Optional[int] = None) -> TopicModeler:
+        """
+        저장된 모델을 추론용으로 불러옵니다. 한 번 불러온 모델은 메모리에 유지됩니다.
+
+        Args:
+            name (str): 모델 이름
+            version (Optional[int]): 버전 (기본값: 최신)
+
+        Returns:
+            TopicModeler: 모델과 사전이 설정된 TopicModeler (get_document_topics 사용 가능)
+        """
+        self._validate_name(name)
+        version = version or self._latest_version(name)
+        if version is None:
+            raise KeyError(f"등록된 모델이 없습니다: {name}")
+
+        key = f"{name}/v{version}"
+        with self._lock:
+            modeler = self._loaded.get(key)
+            if modeler is not None:
+                self._loaded.move_to_end(key)
+                return modeler
+
+        modeler = self._load_modeler(name, version, mmap='r')
+        with self._lock:
+            self._loaded[key] = modeler
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return modeler
+
+    def infer(self, name: str, texts: List[str], version: Optional[int] = None) -> List[List[Dict]]:
+        """
+        새 문서들의 토픽 분포를 계산합니다.
+
+        Args:
+            name (str): 모델 이름
+            texts (List[str]): 문서 리스트
+            version (Optional[int]): 버전 (기본값: 최신)
+
+        Returns:
+            List[List[Dict]]: 문서별 토픽 분포 리스트
+        """
+        modeler = self.load(name, version)
+        return [
+            [{'topic_id': topic_id, 'probability': float(prob)}
+             for topic_id, prob in modeler.model.get_document_topics(modeler.dictionary.doc2bow(tokens))]
+            for tokens in modeler.preprocessor.morphemes_many(texts)
+        ]
+
+    def update(self, name: str, texts: List[str], passes: int = 1, version: Optional[int] = None) -> str:
+        """
+        기존 모델에 새 문서를 추가 학습(LdaModel.update)하여 새 버전으로 저장합니다.
+        사전에 없는 단어는 무시됩니다.
+
+        Args:
+            name (str): 모델 이름
+            texts (List[str]): 추가 학습할 문서 리스트
+            passes (int): 추가 학습 반복 횟수
+            version (Optional[int]): 기준 버전 (기본값: 최신)
+
+        Returns:
+            str: 저장된 새 버전 키
+        """
+        self._validate_name(name)
+        base_version = version or self._latest_version(name)
+        if base_version is None:
+            raise KeyError(f"등록된 모델이 없습니다: {name}")
+
+        # 학습 중 배열을 수정하므로 메모리 매핑 없이 불러옴
+        modeler = self._load_modeler(name, base_version, mmap=None)
+        tokenized_texts = modeler.preprocessor.morphemes_many(texts)
+        modeler.model.update([modeler.dictionary.doc2bow(tokens) for tokens in tokenized_texts], passes=passes)
+
+        return self.save(name, modeler, {'parent_version': base_version, 'update_docs': len(texts)})
+
+    def list_models(self) -> List[Dict]:
+        """저장된 모델 버전별 정보를 반환합니다."""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for name in sorted(os.listdir(self.root)):
+            for version in self._versions(name):
+                meta_path = os.path.join(self._version_dir(name, version), "meta.json")
+                if os.path.exists(meta_path):
+                    with open(meta_path, encoding='utf-8') as f:
+                        entries.append(json.load(f))
+        return entries
+
+    def delete(self, name: str, version: int) -> None:
+        self._validate_name(name)
+        with self._lock:
+            self._loaded.pop(f"{name}/v{version}", None)
+            shutil.rmtree(self._version_dir(name, version), ignore_errors=True)
+
+    def _load_modeler(self, name: str, version: int, mmap: Optional[str]) -> TopicModeler:
+        version_dir = self._version_dir(name, version)
+        modeler = TopicModeler()
+        modeler.dictionary = corpora.Dictionary.load(os.path.join(version_dir, "dictionary.dict"))
+        modeler.model = models.LdaModel.load(os.path.join(version_dir, "model.lda"), mmap=mmap)
+        return modeler
+
+    def _version_dir(self, name: str, version: int) -> str:
+        return os.path.join(self.root, name, f"v{version}")
+
+    def _versions(self, name: str) -> List[int]:
+        model_dir = os.path.join(self.root, name)
+        if not os.path.isdir(model_dir):
+            return []
+        versions = [_VERSION_DIR.match(entry) for entry in os.listdir(model_dir)]
+        return sorted(int(match.group(1)) for match in versions if match)
+
+    def _latest_version(self, name: str) -> Optional[int]:
+        versions = self._versions(name)
+        return versions[-1] if versions else None
+
+    @staticmethod
+    def _validate_name(name: str) -> None:
+        if not re.fullmatch(r'[\w\-]+', name):
+            raise ValueError(f"모델 이름에는 영문/숫자/밑줄/하이픈만 사용할 수 있습니다: {name}")
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """프로세스 공용 모델 저장소를 반환합니다. (경로: 환경 변수 MODEL_REGISTRY_PATH)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry(os.getenv("MODEL_REGISTRY_PATH", os.path.join("data", "models")))
+    return _registry
@@ -0,0 +1,220 @@
+from collections import Counter
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+
+MODES = ('exact', 'sketch')
+
+_UINT64_MASK = (1 << 64) - 1
+
+GroupKey = Optional[Tuple[str, Hashable]]
+
+class CountMinSketch:
+    """
+    고정 크기 빈도 추정 테이블. 추정값은 실제 빈도 이상이며, 오차는 전체 빈도 / width 정도입니다.
+    """
+
+    def __init__(self, width: int = 2 ** 18, depth: int = 4, seed: int = 42):
+        """
+        Args:
+            width (int): 행당 칸 수 (2의 거듭제곱)
+            depth (int): 해시 함수 수
+            seed (int): 해시 함수 난수 시드
+        """
+        if width < 2 or width & (width - 1):
+            raise ValueError("width 는 2 이상의 2의 거듭제곱이어야 합니다.")
+        self.width = width
+        self.depth = depth
+        # multiply-shift 해시: 상위 log2(width) 비트를 칸 번호로 사용
+        self._shift = np.uint64(65 - width.bit_length())
+        rng = np.random.RandomState(seed)
+        self._multipliers = rng.randint(1, 1 << 62, size=depth, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+
+    def _columns(self, keys: np.ndarray) -> np.ndarray:
+        return ((self._multipliers[:, None] * keys[None, :]) >> self._shift).astype(np.intp)
+
+    def add(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        columns = self._columns(keys)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], counts)
+
+    def query(self, keys: np.ndarray) -> np.ndarray:
+        columns = self._columns(keys)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+class _SketchGroup:
+    """한 그룹의 빈도 추정 테이블과 상위 n-gram 후보"""
+
+    def __init__(self, top_k: int, width: int, depth: int):
+        self.top_k = top_k
+        self.sketch = CountMinSketch(width, depth)
+        self.candidates: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+        self.threshold = 0
+
+    def add(self, keys: np.ndarray, counts: np.ndarray, ngrams: List[Tuple[int, ...]]) -> None:
+        self.sketch.add(keys, counts)
+        estimates = self.sketch.query(keys)
+        for key, estimate, ngram in zip(keys.tolist(), estimates.tolist(), ngrams):
+            if key in self.candidates or estimate >= self.threshold:
+                self.candidates[key] = (estimate, ngram)
+
+        # 후보가 2배로 늘면 상위 top_k 개만 남기고 그 최솟값을 새 진입 기준으로 사용
+        if len(self.candidates) > 2 * self.top_k:
+            kept = sorted(self.candidates.items(), key=lambda item: -item[1][0])[:self.top_k]
+            self.candidates = dict(kept)
+            self.threshold = kept[-1][1][0]
+
+class NgramCounter:
+    """
+    문서를 한 번만 읽으면서 전체 및 그룹별(연도, 출처, 카테고리 등) n-gram 빈도를 동시에 셉니다.
+    n-gram은 정수 ID로 다룹니다.
+
+    - exact: 모든 n-gram의 정확한 빈도 (n-gram 종류 수에 비례하는 메모리)
+    - sketch: 그룹별 Count-Min Sketch 와 상위 top_k 후보만 유지 (그룹 수에만 비례하는 고정 메모리, 빈도는 추정값)
+    """
+
+    def __init__(
+        self,
+        n_range: Tuple[int, int] = (2, 2),
+        mode: str = 'exact',
+        top_k: int = 1000,
+        width: int = 2 ** 18,
+        depth: int = 4
+    ):
+        """
+        Args:
+            n_range (Tuple[int, int]): n-gram 길이 범위 (최소, 최대)
+            mode (str): 'exact' 또는 'sketch'
+            top_k (int): sketch 모드에서 그룹별로 유지할 상위 n-gram 수
+            width (int): sketch 모드의 Count-Min Sketch 너비 (2의 거듭제곱)
+            depth (int): sketch 모드의 Count-Min Sketch 해시 함수 수
+        """
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.min_n, self.max_n = n_range
+        self.mode = mode
+        self.top_k = top_k
+        self.width = width
+        self.depth = depth
+        self.num_documents = 0
+
+        self._tokens: Dict[str, int] = {}
+        self._token_names: List[str] = []
+        # exact 모드: n-gram -> ID, 그룹별 ID 빈도, 전체 문서 빈도
+        self._ngram_ids: Dict[Tuple[int, ...], int] = {}
+        self._ngram_names: List[Tuple[int, ...]] = []
+        self._counts: Dict[GroupKey, Counter] = {}
+        self._document_frequency = Counter()
+        # sketch 모드: 그룹별 추정 테이블
+        self._sketches: Dict[GroupKey, _SketchGroup] = {}
+
+    def add(self, tokens: Sequence[str], groups: Optional[Dict[str, Hashable]] = None) -> None:
+        """
+        문서 하나의 n-gram을 전체와 각 그룹에 더합니다.
+
+        Args:
+            tokens (Sequence[str]): 문서 토큰
+            groups (Optional[Dict[str, Hashable]]): 그룹 이름 -> 값 (예: {'year': 2023, 'source': 'naver'})
+        """
+        self.num_documents += 1
+        token_ids = [self._token_id(token) for token in tokens]
+
+        ngrams = [
+            tuple(token_ids[i:i + n])
+            for n in range(self.min_n, self.max_n + 1)
+            for i in range(len(token_ids) - n + 1)
+        ]
+        group_keys = [None] + [(name, value) for name, value in (groups or {}).items()]
+
+        if self.mode == 'exact':
+            ids = [self._ngram_id(ngram) for ngram in ngrams]
+            for key in group_keys:
+                self._counts.setdefault(key, Counter()).update(ids)
+            self._document_frequency.update(set(ids))
+        else:
+            counts = Counter(ngrams)
+            unique = list(counts)
+            keys = np.array([hash(ngram) & _UINT64_MASK for ngram in unique], dtype=np.uint64)
+            values = np.array([counts[ngram] for ngram in unique], dtype=np.uint32)
+            for key in group_keys:
+                group = self._sketches.get(key)
+                if group is None:
+                    group = self._sketches[key] = _SketchGroup(self.top_k, self.width, self.depth)
+                group.add(keys, values, unique)
+
+    def add_dataframe(
+        self,
+        df,
+        text_column: str = 'processed_content',
+        group_columns: Sequence[str] = ('year',)
+    ) -> 'NgramCounter':
+        """
+        DataFrame 의 모든 행을 한 번씩 읽어 전체와 group_columns 별 빈도를 셉니다. 토큰은 공백으로 구분합니다.
+
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            text_column (str): 텍스트 컬럼명
+            group_columns (Sequence[str]): 그룹 컬럼명 리스트 (예: ('year', 'source'))
+
+        Returns:
+            NgramCounter: self
+        """
+        columns = [df[column] for column in group_columns]
+        for text, *values in zip(df[text_column], *columns):
+            self.add(text.split() if isinstance(text, str) else [], dict(zip(group_columns, values)))
+        return self
+
+    def groups(self, name: str) -> List[Hashable]:
+        """그룹 이름(예: 'year')의 값들을 처음 나온 순서로 반환합니다."""
+        keys = self._counts if self.mode == 'exact' else self._sketches
+        return [key[1] for key in keys if key is not None and key[0] == name]
+
+    def most_common(
+        self,
+        n: Optional[int] = None,
+        group: GroupKey = None,
+        min_df: int = 1
+    ) -> List[Tuple[str, int]]:
+        """
+        빈도가 높은 n-gram을 반환합니다. (같은 빈도는 처음 나온 순서, sketch 모드에서는 추정 빈도)
+
+        Args:
+            n (Optional[int]): 반환할 개수 (None이면 전체, sketch 모드는 최대 top_k)
+            group (GroupKey): (그룹 이름, 값) (None이면 전체)
+            min_df (int): 최소 문서 빈도 (exact 모드의 전체 빈도에만 사용 가능)
+
+        Returns:
+            List[Tuple[str, int]]: (공백으로 이은 n-gram, 빈도) 리스트
+        """
+        if self.mode == 'exact':
+            counts = self._counts.get(group, Counter())
+            if min_df > 1:
+                if group is not None:
+                    raise ValueError("min_df 는 전체 빈도에만 사용할 수 있습니다.")
+                counts = Counter({key: count for key, count in counts.items() if self._document_frequency[key] >= min_df})
+            return [(self._decode(self._ngram_names[key]), count) for key, count in counts.most_common(n)]
+
+        if min_df > 1:
+            raise ValueError("sketch 모드에서는 min_df 를 사용할 수 없습니다.")
+        sketch_group = self._sketches.get(group)
+        if sketch_group is None:
+            return []
+        ranked = sorted(sketch_group.candidates.values(), key=lambda item: -item[0])[:min(n or self.top_k, self.top_k)]
+        return [(self._decode(ngram), int(count)) for count, ngram in ranked]
+
+    def _token_id(self, token: str) -> int:
+        token_id = self._tokens.get(token)
+        if token_id is None:
+            token_id = self._tokens[token] = len(self._token_names)
+            self._token_names.append(token)
+        return token_id
+
+    def _ngram_id(self, ngram: Tuple[int, ...]) -> int:
+        ngram_id = self._ngram_ids.get(ngram)
+        if ngram_id is None:
+            ngram_id = self._ngram_ids[ngram] = len(self._ngram_names)
+            self._ngram_names.append(ngram)
+        return ngram_id
+
+    def _decode(self, ngram: Tuple[int, ...]) -> str:
+        return ' '.join(self._token_names[token_id] for token_id in ngram)
@@ -0,0 +1,146 @@
+from typing import Dict, Iterator, List, Sequence, Tuple
+import numpy as np
+from scipy import sparse
+
+METRICS = ('jaccard', 'cosine')
+
+def build_term_matrix(token_lists: Sequence[List[str]], weighting: str = 'binary') -> Tuple[sparse.csr_matrix, Dict[str, int]]:
+    """
+    문서별 토큰으로 희소 문서-단어 행렬을 만듭니다.
+
+    Args:
+        token_lists (Sequence[List[str]]): 문서별 토큰 리스트
+        weighting (str): 'binary' (단어 포함 여부) 또는 'tfidf' (행 단위 L2 정규화)
+
+    Returns:
+        Tuple[sparse.csr_matrix, Dict[str, int]]: 문서 x 단어 행렬, 단어 -> 열 번호
+    """
+    vocabulary: Dict[str, int] = {}
+    indptr = [0]
+    indices = []
+    data = []
+    for tokens in token_lists:
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            column = vocabulary.setdefault(token, len(vocabulary))
+            counts[column] = counts.get(column, 0) + 1
+        indices.extend(counts.keys())
+        data.extend(counts.values())
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(token_lists), len(vocabulary))
+    )
+
+    if weighting == 'binary':
+        matrix.data[:] = 1.0
+    elif weighting == 'tfidf':
+        # sklearn TfidfTransformer(smooth_idf=True)와 같은 idf
+        document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        idf = np.log((1 + matrix.shape[0]) / (1 + document_frequency)) + 1
+        matrix = matrix.multiply(idf.astype(np.float32)).tocsr()
+        matrix = _l2_normalize(matrix)
+    else:
+        raise ValueError(f"지원하지 않는 가중치 방식입니다: {weighting}")
+    return matrix, vocabulary
+
+def _l2_normalize(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1 / norms).dot(matrix).tocsr().astype(np.float32)
+
+def iter_similarity_chunks(
+    matrix: sparse.csr_matrix,
+    metric: str = 'jaccard',
+    chunk_size: int = 1000
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    전체 유사도 행렬을 행 묶음 단위로 계산합니다. 한 번에 chunk_size x N 크기만 메모리에 올립니다.
+
+    Args:
+        matrix (sparse.csr_matrix): build_term_matrix 결과
+            (jaccard 는 binary, cosine 은 어떤 가중치든 사용 가능)
+        metric (str): 'jaccard' 또는 'cosine'
+        chunk_size (int): 한 번에 계산할 행 수
+
+    Yields:
+        Tuple[int, np.ndarray]: (시작 행 번호, chunk_size x N 유사도 블록)
+    """
+    if metric not in METRICS:
+        raise ValueError(f"지원하지 않는 유사도입니다: {metric}")
+
+    if metric == 'jaccard':
+        binary = matrix.copy()
+        binary.data[:] = 1.0
+        sizes = np.asarray(binary.sum(axis=1), dtype=np.float32).ravel()
+        other = binary.T.tocsc()
+        for start in range(0, binary.shape[0], chunk_size):
+            block = binary[start:start + chunk_size]
+            intersection = block.dot(other).toarray()
+            union = sizes[start:start + chunk_size, None] + sizes[None, :] - intersection
+            with np.errstate(divide='ignore', invalid='ignore'):
+                similarity = np.where(union > 0, intersection / union, 0.0)
+            yield start, similarity.astype(np.float32)
+    else:
+        normalized = _l2_normalize(matrix)
+        other = normalized.T.tocsc()
+        for start in range(0, normalized.shape[0], chunk_size):
+            yield start, normalized[start:start + chunk_size].dot(other).toarray().astype(np.float32)
+
+def similarity_matrix(matrix: sparse.csr_matrix, metric: str = 'jaccard', chunk_size: int = 1000) -> np.ndarray:
+    """
+    N x N 유사도 행렬 전체를 계산합니다. (float32, 10k 문서 기준 약 400MB)
+
+    Args:
+        matrix (sparse.csr_matrix): build_term_matrix 결과
+        metric (str): 'jaccard' 또는 'cosine'
+        chunk_size (int): 한 번에 계산할 행 수
+
+    Returns:
+        np.ndarray: 유사도 행렬
+    """
+    result = np.empty((matrix.shape[0], matrix.shape[0]), dtype=np.float32)
+    for start, block in iter_similarity_chunks(matrix, metric, chunk_size):
+        result[start:start + block.shape[0]] = block
+    return result
+
+def top_k_similar(
+    matrix: sparse.csr_matrix,
+    k: int = 10,
+    metric: str = 'jaccard',
+    chunk_size: int = 1000
+) -> List[List[Tuple[int, float]]]:
+    """
+    문서별로 가장 유사한 문서 k개를 찾습니다. 전체 행렬을 저장하지 않습니다.
+
+    Args:
+        matrix (sparse.csr_matrix): build_term_matrix 결과
+        k (int): 문서별 이웃 수
+        metric (str): 'jaccard' 또는 'cosine'
+        chunk_size (int): 한 번에 계산할 행 수
+
+    Returns:
+        List[List[Tuple[int, float]]]: 문서별 (문서 번호, 유사도) 리스트 (유사도 내림차순, 자기 자신 제외)
+    """
+    num_docs = matrix.shape[0]
+    k = min(k, num_docs - 1)
+    if k <= 0:
+        return [[] for _ in range(num_docs)]
+
+    neighbors = []
+    for start, block in iter_similarity_chunks(matrix, metric, chunk_size):
+        rows = np.arange(block.shape[0])
+        block[rows, start + rows] = -np.inf  # 자기 자신 제외
+
+        candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        scores = block[rows[:, None], candidates]
+        order = np.argsort(-scores, axis=1)
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+
+        neighbors.extend(
+            [(int(index), float(score)) for index, score in zip(row_indices, row_scores)]
+            for row_indices, row_scores in zip(candidates, scores)
+        )
+    return neighbors
@@ -0,0 +1,189 @@
+import os
+import json
+import glob
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import pandas as pd
+from gensim import corpora
+from ..utils.text_preprocessing import TextPreprocessor
+
+def iter_csv_texts(path: str, column: str = 'content', chunksize: int = 1000) -> Iterator[str]:
+    """
+    CSV 파일에서 본문을 청크 단위로 읽어 하나씩 반환합니다.
+
+    Args:
+        path (str): CSV 파일 경로
+        column (str): 본문 컬럼 이름
+        chunksize (int): 한 번에 읽을 행 수
+
+    Yields:
+        str: 본문
+    """
+    for chunk in pd.read_csv(path, usecols=[column], chunksize=chunksize):
+        for text in chunk[column].dropna():
+            yield str(text)
+
+def iter_json_texts(path: str, field: str = 'content') -> Iterator[str]:
+    """
+    save_articles 로 저장된 JSON 파일(또는 디렉토리 내 모든 JSON 파일)에서 본문을 하나씩 반환합니다.
+    파일은 한 번에 하나씩만 읽습니다.
+
+    Args:
+        path (str): JSON 파일 또는 디렉토리 경로 (예: data/newsroom/sk_hynix)
+        field (str): 본문 필드 이름
+
+    Yields:
+        str: 본문
+    """
+    paths = sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path]
+    for file_path in paths:
+        with open(file_path, encoding='utf-8') as f:
+            articles = json.load(f)
+        # save_search_results 형식({"results": [...]})도 허용
+        if isinstance(articles, dict):
+            articles = articles.get('results', [])
+        for article in articles:
+            text = article.get(field)
+            if text:
+                yield text
+
+def iter_db_texts(
+    engine,
+    query: str = "SELECT content FROM news_data WHERE content IS NOT NULL ORDER BY id",
+    batch_size: int = 1000
+) -> Iterator[str]:
+    """
+    데이터베이스(news_data 테이블)에서 본문을 서버 측 커서로 나누어 읽어 하나씩 반환합니다.
+
+    Args:
+        engine: SQLAlchemy 엔진
+        query (str): 본문 한 컬럼을 반환하는 SQL
+        batch_size (int): 한 번에 가져올 행 수
+
+    Yields:
+        str: 본문
+    """
+    from sqlalchemy import text as sql_text
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(sql_text(query))
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                if row[0]:
+                    yield row[0]
+
+def _batched(texts: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    batch = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class TokenFile:
+    """한 줄에 문서 하나의 토큰 리스트(JSON)를 저장한 파일. 반복할 때마다 파일을 처음부터 읽습니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self) -> Iterator[List[str]]:
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+class BowStream:
+    """TokenFile을 사전으로 변환한 BoW 문서 스트림"""
+
+    def __init__(self, tokens: TokenFile, dictionary: corpora.Dictionary):
+        self.tokens = tokens
+        self.dictionary = dictionary
+
+    def __iter__(self):
+        for tokens in self.tokens:
+            yield self.dictionary.doc2bow(tokens)
+
+class StreamingCorpusBuilder:
+    """
+    문서를 한 번만 읽어 사전과 디스크 기반 코퍼스(MmCorpus)를 만듭니다.
+    메모리에는 배치 하나와 사전만 유지되므로 문서 수와 관계없이 일정한 메모리를 사용합니다.
+    """
+
+    def __init__(self, preprocessor: Optional[TextPreprocessor] = None, batch_size: int = 256):
+        """
+        Args:
+            preprocessor (Optional[TextPreprocessor]): 전처리/형태소 분석기
+            batch_size (int): 한 번에 형태소 분석할 문서 수
+        """
+        self.preprocessor = preprocessor or TextPreprocessor()
+        self.batch_size = batch_size
+
+    def build(
+        self,
+        texts: Iterable[str],
+        output_dir: str,
+        filter_extremes: Optional[Dict] = None
+    ) -> Tuple[corpora.Dictionary, corpora.MmCorpus, TokenFile]:
+        """
+        코퍼스를 만들어 output_dir 에 저장합니다. (tokens.jsonl, dictionary.dict, corpus.mm)
+
+        Args:
+            texts (Iterable[str]): 문서 스트림
+            output_dir (str): 저장 디렉토리
+            filter_extremes (Optional[Dict]): Dictionary.filter_extremes 인자 (예: {'no_below': 5, 'no_above': 0.5})
+
+        Returns:
+            Tuple[corpora.Dictionary, corpora.MmCorpus, TokenFile]: 사전, 디스크 코퍼스, 토큰 파일
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        tokens_path = os.path.join(output_dir, "tokens.jsonl")
+        dictionary_path = os.path.join(output_dir, "dictionary.dict")
+        corpus_path = os.path.join(output_dir, "corpus.mm")
+
+        # 1) 문서를 읽으면서 형태소 분석 결과를 파일에 쓰고 사전을 갱신
+        dictionary = corpora.Dictionary()
+        num_docs = 0
+        with open(tokens_path, 'w', encoding='utf-8') as f:
+            for batch in _batched(texts, self.batch_size):
+                tokenized = self.preprocessor.morphemes_many(batch)
+                dictionary.add_documents(tokenized)
+                for tokens in tokenized:
+                    f.write(json.dumps(tokens, ensure_ascii=False) + '\n')
+                num_docs += len(batch)
+
+        if filter_extremes:
+            dictionary.filter_extremes(**filter_extremes)
+        dictionary.save(dictionary_path)
+
+        # 2) 토큰 파일을 다시 읽어 BoW 코퍼스를 디스크에 직렬화
+        token_file = TokenFile(tokens_path)
+        corpora.MmCorpus.serialize(corpus_path, BowStream(token_file, dictionary))
+        logging.info(f"문서 {num_docs}개, 단어 {len(dictionary)}개 코퍼스가 {corpus_path}에 저장되었습니다.")
+
+        return dictionary, corpora.MmCorpus(corpus_path), token_file
+
+def save_corpus(
+    dictionary: corpora.Dictionary,
+    corpus: Iterable,
+    tokenized_texts: Iterable[List[str]],
+    output_dir: str
+) -> None:
+    """
+    메모리에 있는 사전/코퍼스/토큰을 StreamingCorpusBuilder 와 같은 형식으로 저장합니다.
+
+    Args:
+        dictionary (corpora.Dictionary): 사전
+        corpus (Iterable): BoW 코퍼스
+        tokenized_texts (Iterable[List[str]]): 문서별 토큰
+        output_dir (str): 저장 디렉토리
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "tokens.jsonl"), 'w', encoding='utf-8') as f:
+        for tokens in tokenized_texts:
+            f.write(json.dumps(tokens, ensure_ascii=False) + '\n')
+    dictionary.save(os.path.join(output_dir, "dictionary.dict"))
+    corpora.MmCorpus.serialize(os.path.join(output_dir, "corpus.mm"), corpus)
@@ -1,14 +1,16 @@
-from typing import List, Dict, Tuple
+import threading
+from typing import List, Dict, Tuple, Optional
 from collections import Counter
-from kiwipiepy import Kiwi
 import numpy as np
 from ..utils.text_preprocessing import TextPreprocessor
+from ..utils.kiwi_registry import get_kiwi
+from .similarity import build_term_matrix, similarity_matrix, top_k_similar
 
 class TextAnalyzer:
     """텍스트 분석을 수행하는 클래스"""
     
     def __init__(self):
-        self.kiwi = Kiwi()
+        self.kiwi = get_kiwi()
         self.preprocessor = TextPreprocessor()
     
     def analyze_texts(self, texts: List[str]) -> Dict:
@@ -21,14 +23,10 @@ class TextAnalyzer:
         Returns:
             Dict: 분석 결과
         """
-        # 텍스트 전처리
-        processed_texts = [self.preprocessor.preprocess(text) for text in texts]
-        
-        # 형태소 분석
+        # 텍스트 전처리 및 형태소 분석 (캐시에 없는 텍스트만 한 번에 병렬 처리)
         morphemes = []
-        for text in processed_texts:
-            result = self.kiwi.analyze(text)
-            morphemes.extend([token.form for token in result[0][0]])
+        for forms in self.preprocessor.morphemes_many(texts):
+            morphemes.extend(forms)
         
         # 빈도 분석
         word_freq = Counter(morphemes)
@@ -55,20 +53,62 @@ class TextAnalyzer:
         Returns:
             float: 유사도 점수 (0~1)
         """
-        # 텍스트 전처리
-        text1 = self.preprocessor.preprocess(text1)
-        text2 = self.preprocessor.preprocess(text2)
-        
-        # 형태소 분석
-        result1 = self.kiwi.analyze(text1)
-        result2 = self.kiwi.analyze(text2)
+        # 텍스트 전처리 및 형태소 분석
+        forms1, forms2 = self.preprocessor.morphemes_many([text1, text2])
         
         # 단어 집합 생성
-        words1 = set(token.form for token in result1[0][0])
-        words2 = set(token.form for token in result2[0][0])
+        words1 = set(forms1)
+        words2 = set(forms2)
         
         # Jaccard 유사도 계산
         intersection = len(words1.intersection(words2))
         union = len(words1.union(words2))
         
         return intersection / union if union > 0 else 0.0
+    
+    def get_similarity_matrix(self, texts: List[str], metric: str = 'jaccard', chunk_size: int = 1000) -> np.ndarray:
+        """
+        여러 텍스트 간의 유사도 행렬을 계산합니다. 각 텍스트는 한 번만 형태소 분석됩니다.
+        
+        Args:
+            texts (List[str]): 텍스트 리스트
+            metric (str): 'jaccard' (형태소 집합, get_similarity 와 동일) 또는 'cosine' (TF-IDF)
+            chunk_size (int): 한 번에 계산할 행 수
+            
+        Returns:
+            np.ndarray: N x N 유사도 행렬
+        """
+        return similarity_matrix(self._term_matrix(texts, metric), metric, chunk_size)
+    
+    def get_most_similar(self, texts: List[str], k: int = 10, metric: str = 'jaccard',
+                         chunk_size: int = 1000) -> List[List[Tuple[int, float]]]:
+        """
+        텍스트별로 가장 유사한 텍스트 k개를 찾습니다.
+        
+        Args:
+            texts (List[str]): 텍스트 리스트
+            k (int): 텍스트별 이웃 수
+            metric (str): 'jaccard' 또는 'cosine'
+            chunk_size (int): 한 번에 계산할 행 수
+            
+        Returns:
+            List[List[Tuple[int, float]]]: 텍스트별 (텍스트 번호, 유사도) 리스트
+        """
+        return top_k_similar(self._term_matrix(texts, metric), k, metric, chunk_size)
+    
+    def _term_matrix(self, texts: List[str], metric: str):
+        weighting = 'tfidf' if metric == 'cosine' else 'binary'
+        matrix, _ = build_term_matrix(self.preprocessor.morphemes_many(texts), weighting)
+        return matrix
+
+_analyzer: Optional[TextAnalyzer] = None
+_analyzer_lock = threading.Lock()
+
+def get_text_analyzer() -> TextAnalyzer:
+    """프로세스 공용 TextAnalyzer를 반환합니다. (상태가 없으므로 요청 간 공유)"""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = TextAnalyzer()
+    return _analyzer
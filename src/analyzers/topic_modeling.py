@@ -1,19 +1,84 @@
-from typing import List, Dict, Tuple
+import os
+import time
+import logging
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Tuple, Iterable, Optional, Sequence
 import numpy as np
 from gensim import corpora, models
 from gensim.models.coherencemodel import CoherenceModel
 from ..utils.text_preprocessing import TextPreprocessor
-from kiwipiepy import Kiwi
+from ..utils.kiwi_registry import get_kiwi
+from .streaming_corpus import StreamingCorpusBuilder, TokenFile, save_corpus
+
+def _train_sweep_model(corpus_dir: str, model_dir: str, num_topics: int, alpha, passes: int) -> Dict:
+    """
+    토픽 수 탐색용 작업 함수 (별도 프로세스에서 실행).
+    공유 코퍼스를 디스크에서 읽어 모델 하나를 학습하고 점수를 계산합니다.
+    """
+    started = time.perf_counter()
+    dictionary = corpora.Dictionary.load(os.path.join(corpus_dir, "dictionary.dict"))
+    corpus = corpora.MmCorpus(os.path.join(corpus_dir, "corpus.mm"))
+    texts = TokenFile(os.path.join(corpus_dir, "tokens.jsonl"))
+    
+    model = models.LdaModel(
+        corpus=corpus,
+        id2word=dictionary,
+        num_topics=num_topics,
+        alpha=alpha,
+        passes=passes,
+        random_state=42
+    )
+    coherence = CoherenceModel(
+        model=model, texts=texts, dictionary=dictionary, coherence='c_v', processes=1
+    ).get_coherence()
+    perplexity = model.log_perplexity(corpus)
+    
+    model_path = os.path.join(model_dir, f"lda_{num_topics}_{alpha}.model")
+    model.save(model_path)
+    
+    return {
+        'num_topics': num_topics,
+        'alpha': alpha,
+        'coherence': float(coherence),
+        'perplexity': float(perplexity),
+        'elapsed': round(time.perf_counter() - started, 4),
+        'model_path': model_path
+    }
 
 class TopicModeler:
     """토픽 모델링을 수행하는 클래스"""
     
-    def __init__(self):
-        self.kiwi = Kiwi()
+    def __init__(self, backend: str = "single", workers: Optional[int] = None):
+        """
+        Args:
+            backend (str): 학습 방식 ('single': LdaModel, 'multicore': LdaMulticore)
+            workers (Optional[int]): multicore 학습 및 coherence 계산에 사용할 프로세스 수 (기본값: CPU 코어 수 - 1)
+        """
+        if backend not in ("single", "multicore"):
+            raise ValueError(f"지원하지 않는 학습 방식입니다: {backend}")
+        
+        self.kiwi = get_kiwi()
         self.preprocessor = TextPreprocessor()
+        self.backend = backend
+        self.workers = workers or max((os.cpu_count() or 1) - 1, 1)
         self.dictionary = None
         self.corpus = None
+        self.corpus_dir = None  # 디스크에 저장된 코퍼스 디렉토리
+        self.tokenized_texts = None
         self.model = None
+        self.timings: Dict[str, float] = {}  # 단계별 소요 시간(초)
+    
+    @contextmanager
+    def _timed(self, phase: str):
+        """단계별 소요 시간을 self.timings 에 기록합니다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = round(time.perf_counter() - started, 4)
     
     def prepare_corpus(self, texts: List[str]) -> None:
         """
@@ -22,21 +87,52 @@ class TopicModeler:
         Args:
             texts (List[str]): 분석할 텍스트 리스트
         """
-        # 텍스트 전처리
-        processed_texts = [self.preprocessor.preprocess(text) for text in texts]
+        # 텍스트 전처리 및 형태소 분석 (캐시에 없는 텍스트만 한 번에 병렬 처리)
+        with self._timed('tokenize'):
+            tokenized_texts = self.preprocessor.morphemes_many(texts)
         
-        # 형태소 분석
-        tokenized_texts = []
-        for text in processed_texts:
-            result = self.kiwi.analyze(text)
-            tokens = [token.form for token in result[0][0]]
-            tokenized_texts.append(tokens)
+        with self._timed('corpus'):
+            # 사전 생성
+            self.dictionary = corpora.Dictionary(tokenized_texts)
+            
+            # 코퍼스 생성
+            self.corpus = [self.dictionary.doc2bow(text) for text in tokenized_texts]
+        self.tokenized_texts = tokenized_texts
+        self.corpus_dir = None
+    
+    def prepare_corpus_streaming(
+        self,
+        texts: Iterable[str],
+        output_dir: str,
+        filter_extremes: Optional[Dict] = None,
+        batch_size: int = 256
+    ) -> None:
+        """
+        문서를 스트리밍으로 읽어 디스크 기반 코퍼스를 준비합니다.
+        학습 시 코퍼스는 파일에서 순차적으로 읽히므로 문서 수와 관계없이 메모리 사용량이 일정합니다.
         
-        # 사전 생성
-        self.dictionary = corpora.Dictionary(tokenized_texts)
+        Args:
+            texts (Iterable[str]): 문서 스트림 (iter_csv_texts, iter_json_texts, iter_db_texts 등)
+            output_dir (str): 코퍼스 저장 디렉토리
+            filter_extremes (Optional[Dict]): Dictionary.filter_extremes 인자
+            batch_size (int): 한 번에 형태소 분석할 문서 수
+        """
+        builder = StreamingCorpusBuilder(self.preprocessor, batch_size=batch_size)
+        with self._timed('corpus'):
+            self.dictionary, self.corpus, self.tokenized_texts = builder.build(texts, output_dir, filter_extremes)
+        self.corpus_dir = output_dir
+    
+    def load_corpus(self, output_dir: str) -> None:
+        """
+        prepare_corpus_streaming 으로 저장한 코퍼스를 불러옵니다.
         
-        # 코퍼스 생성
-        self.corpus = [self.dictionary.doc2bow(text) for text in tokenized_texts]
+        Args:
+            output_dir (str): 코퍼스 저장 디렉토리
+        """
+        self.dictionary = corpora.Dictionary.load(os.path.join(output_dir, "dictionary.dict"))
+        self.corpus = corpora.MmCorpus(os.path.join(output_dir, "corpus.mm"))
+        self.tokenized_texts = TokenFile(os.path.join(output_dir, "tokens.jsonl"))
+        self.corpus_dir = output_dir
     
     def train_model(self, num_topics: int = 5, passes: int = 10) -> None:
         """
@@ -49,13 +145,135 @@ class TopicModeler:
         if self.corpus is None or self.dictionary is None:
             raise ValueError("코퍼스를 먼저 준비해야 합니다.")
         
-        self.model = models.LdaModel(
-            corpus=self.corpus,
-            id2word=self.dictionary,
-            num_topics=num_topics,
-            passes=passes,
-            random_state=42
-        )
+        with self._timed('train'):
+            if self.backend == "multicore":
+                self.model = models.LdaMulticore(
+                    corpus=self.corpus,
+                    id2word=self.dictionary,
+                    num_topics=num_topics,
+                    passes=passes,
+                    workers=self.workers,
+                    random_state=42
+                )
+            else:
+                self.model = models.LdaModel(
+                    corpus=self.corpus,
+                    id2word=self.dictionary,
+                    num_topics=num_topics,
+                    passes=passes,
+                    random_state=42
+                )
+    
+    def sweep_topics(
+        self,
+        topic_range: Sequence[int] = range(2, 31),
+        alphas: Sequence = ('symmetric',),
+        passes: int = 10,
+        patience: int = 3,
+        min_delta: float = 0.005,
+        work_dir: Optional[str] = None
+    ) -> Dict:
+        """
+        여러 토픽 수/alpha 조합으로 모델을 병렬 학습하고 coherence가 가장 높은 모델을 선택합니다.
+        모든 작업 프로세스는 디스크에 저장된 하나의 코퍼스와 사전을 공유합니다.
+        토픽 수를 늘려도 coherence가 patience 번 연속 min_delta 이상 오르지 않으면 탐색을 중단합니다.
+        
+        Args:
+            topic_range (Sequence[int]): 탐색할 토픽 수 (오름차순)
+            alphas (Sequence): 탐색할 alpha 값 ('symmetric', 'asymmetric' 또는 실수)
+            passes (int): 모델별 학습 반복 횟수
+            patience (int): coherence 개선이 없을 때 더 탐색할 토픽 수 개수
+            min_delta (float): 개선으로 인정할 최소 coherence 증가량
+            work_dir (Optional[str]): 코퍼스/모델 저장 디렉토리 (기본값: 임시 디렉토리)
+            
+        Returns:
+            Dict: best (최적 조합), curve (조합별 점수), stopped_early (조기 종료 여부)
+        """
+        if self.corpus is None or self.dictionary is None:
+            raise ValueError("코퍼스를 먼저 준비해야 합니다.")
+        
+        # work_dir 를 지정하지 않으면 임시 디렉토리를 쓰고, 최적 모델을 메모리에 불러온 뒤 삭제
+        temporary = work_dir is None
+        work_dir = work_dir or tempfile.mkdtemp(prefix="topic_sweep_")
+        try:
+            best, curve, stopped_early = self._run_sweep(
+                work_dir, list(topic_range), list(alphas), passes, patience, min_delta
+            )
+        finally:
+            if temporary:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        
+        if temporary:
+            # 임시 디렉토리가 삭제되었으므로 모델 경로는 반환하지 않음
+            for result in curve:
+                result.pop('model_path', None)
+        
+        return {
+            'best': best,
+            'curve': curve,
+            'stopped_early': stopped_early
+        }
+    
+    def _run_sweep(
+        self,
+        work_dir: str,
+        topic_range: List[int],
+        alphas: List,
+        passes: int,
+        patience: int,
+        min_delta: float
+    ) -> Tuple[Dict, List[Dict], bool]:
+        """sweep_topics 의 탐색 본체. work_dir 아래에 코퍼스와 후보 모델을 저장하고 최적 모델을 불러옵니다."""
+        corpus_dir = self.corpus_dir
+        if corpus_dir is None:
+            corpus_dir = os.path.join(work_dir, "corpus")
+            save_corpus(self.dictionary, self.corpus, self.tokenized_texts, corpus_dir)
+        model_dir = os.path.join(work_dir, "models")
+        os.makedirs(model_dir, exist_ok=True)
+        
+        configs = [(num_topics, alpha) for num_topics in sorted(topic_range) for alpha in alphas]
+        curve = []
+        best_coherence = float('-inf')
+        stale = 0
+        stopped_early = False
+        
+        with self._timed('sweep'):
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            try:
+                # 작업자 수만큼만 미리 제출하여 조기 종료 시 불필요한 학습을 줄임
+                pending = []
+                next_config = 0
+                while pending or next_config < len(configs):
+                    while next_config < len(configs) and len(pending) < self.workers:
+                        num_topics, alpha = configs[next_config]
+                        pending.append(executor.submit(
+                            _train_sweep_model, corpus_dir, model_dir, num_topics, alpha, passes
+                        ))
+                        next_config += 1
+                    
+                    result = pending.pop(0).result()
+                    curve.append(result)
+                    
+                    # 한 토픽 수의 모든 alpha 결과가 모이면 개선 여부 판단
+                    scores = [r['coherence'] for r in curve if r['num_topics'] == result['num_topics']]
+                    if len(scores) < len(alphas):
+                        continue
+                    if max(scores) > best_coherence + min_delta:
+                        best_coherence = max(scores)
+                        stale = 0
+                    else:
+                        stale += 1
+                    if stale >= patience and (pending or next_config < len(configs)):
+                        stopped_early = True
+                        logging.info(f"토픽 수 {result['num_topics']}에서 coherence 개선이 멈춰 탐색을 중단합니다.")
+                        break
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+        
+        best = max(curve, key=lambda r: r['coherence'])
+        self.model = models.LdaModel.load(best['model_path'])
+        
+        return best, curve, stopped_early
     
     def get_topics(self, num_words: int = 10) -> List[Dict]:
         """
@@ -94,9 +312,7 @@ class TopicModeler:
             raise ValueError("모델을 먼저 학습해야 합니다.")
         
         # 텍스트 전처리 및 토큰화
-        processed_text = self.preprocessor.preprocess(text)
-        result = self.kiwi.analyze(processed_text)
-        tokens = [token.form for token in result[0][0]]
+        tokens = self.preprocessor.morphemes_many([text])[0]
         
         # 문서 벡터 생성
         doc_bow = self.dictionary.doc2bow(tokens)
@@ -106,29 +322,41 @@ class TopicModeler:
         
         return [{'topic_id': topic_id, 'probability': prob} for topic_id, prob in topic_dist]
     
-    def evaluate_model(self) -> Dict:
+    def evaluate_model(self, coherence: str = 'c_v') -> Dict:
         """
         모델의 성능을 평가합니다.
         
+        Args:
+            coherence (str): coherence 측정 방식 ('c_v', 'u_mass', 'c_npmi' 등)
+            
         Returns:
-            Dict: 평가 결과
+            Dict: 평가 결과 (perplexity, coherence, timings)
         """
         if self.model is None:
             raise ValueError("모델을 먼저 학습해야 합니다.")
         
         # Perplexity 계산
-        perplexity = self.model.log_perplexity(self.corpus)
+        with self._timed('perplexity'):
+            perplexity = self.model.log_perplexity(self.corpus)
         
-        # Coherence 계산
-        coherence_model = CoherenceModel(
-            model=self.model,
-            texts=[[self.dictionary[word_id] for word_id, _ in doc] for doc in self.corpus],
-            dictionary=self.dictionary,
-            coherence='c_v'
-        )
-        coherence = coherence_model.get_coherence()
+        # Coherence 계산 (단어 순서가 보존된 원래 토큰을 사용하고 여러 프로세스로 계산)
+        with self._timed('coherence'):
+            texts = self.tokenized_texts
+            if texts is None:
+                texts = [[self.dictionary[word_id] for word_id, _ in doc] for doc in self.corpus]
+            
+            coherence_model = CoherenceModel(
+                model=self.model,
+                texts=texts,
+                corpus=self.corpus if coherence == 'u_mass' else None,
+                dictionary=self.dictionary,
+                coherence=coherence,
+                processes=self.workers
+            )
+            coherence_score = coherence_model.get_coherence()
         
         return {
             'perplexity': perplexity,
-            'coherence': coherence
+            'coherence': coherence_score,
+            'timings': dict(self.timings)
         }
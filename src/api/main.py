@@ -2,6 +2,7 @@ from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from .routes import search
 from .newsroom import router as newsroom_router
+from ..scrapers.driver_pool import get_driver_pool
 
 app = FastAPI(
     title="뉴스 스크래핑 및 텍스트 분석 API",
@@ -24,6 +25,16 @@ app.include_router(search.router, prefix="/api/v1", tags=["search"])
 router = APIRouter()
 router.include_router(newsroom_router, prefix="/api/v1", tags=["newsroom"])
 
+@app.on_event("startup")
+def warm_up_driver_pool():
+    """뉴스룸 스크래퍼용 웹드라이버 풀 워밍업"""
+    get_driver_pool().warm_up()
+
+@app.on_event("shutdown")
+def close_driver_pool():
+    """웹드라이버 풀 종료"""
+    get_driver_pool().close()
+
 @app.get("/")
 async def root():
     return {"message": "뉴스 스크래핑 및 텍스트 분석 API 서버가 실행 중입니다."}
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Optional
+from functools import partial
 from pydantic import BaseModel
 from ..scrapers.newsroom_scraper import SKHynixNewsScraper, SamsungSemiconNewsScraper
+from ..scrapers.driver_pool import get_driver_pool
+from ..scrapers.source_orchestrator import SourceOrchestrator
 
 router = APIRouter()
 
@@ -10,10 +13,24 @@ class NewsroomSearchRequest(BaseModel):
     num_results: Optional[int] = 10
     date_range: Optional[str] = None
     sources: Optional[List[str]] = ["sk_hynix", "samsung_semiconductor"]
+    use_site_search: Optional[bool] = False
 
 class NewsroomSearchResponse(BaseModel):
     articles: List[Dict]
     total_count: int
+    source_timings: Optional[Dict[str, Dict]] = {}
+
+def _run_scraper(scraper_class, request: NewsroomSearchRequest, **kwargs) -> List[Dict]:
+    """스크래퍼를 생성해 검색하고 리소스를 정리합니다. (스레드 풀에서 실행)"""
+    scraper = scraper_class(**kwargs)
+    try:
+        return scraper.search(
+            keyword=request.keyword,
+            num_results=request.num_results,
+            date_range=request.date_range
+        )
+    finally:
+        scraper.cleanup()
 
 @router.post("/newsroom/search", response_model=NewsroomSearchResponse)
 async def search_newsroom(request: NewsroomSearchRequest):
@@ -28,38 +45,35 @@ async def search_newsroom(request: NewsroomSearchRequest):
     """
     try:
         articles = []
+        tasks = {}
         
         if "sk_hynix" in request.sources:
-            sk_scraper = SKHynixNewsScraper()
-            try:
-                sk_articles = sk_scraper.search(
-                    keyword=request.keyword,
-                    num_results=request.num_results,
-                    date_range=request.date_range
-                )
-                articles.extend(sk_articles)
-            finally:
-                sk_scraper.cleanup()
+            tasks["sk_hynix"] = partial(
+                _run_scraper, SKHynixNewsScraper, request,
+                use_site_search=request.use_site_search
+            )
         
         if "samsung_semiconductor" in request.sources:
-            samsung_scraper = SamsungSemiconNewsScraper()
-            try:
-                samsung_articles = samsung_scraper.search(
-                    keyword=request.keyword,
-                    num_results=request.num_results,
-                    date_range=request.date_range
-                )
-                articles.extend(samsung_articles)
-            finally:
-                samsung_scraper.cleanup()
+            tasks["samsung_semiconductor"] = partial(_run_scraper, SamsungSemiconNewsScraper, request)
+        
+        # 뉴스룸별 동시 수집 (느리거나 실패한 뉴스룸은 빈 결과로 처리)
+        source_results = await SourceOrchestrator().run(tasks)
+        for source_result in source_results.values():
+            articles.extend(source_result.results)
         
         return NewsroomSearchResponse(
             articles=articles,
-            total_count=len(articles)
+            total_count=len(articles),
+            source_timings={source: result.to_dict() for source, result in source_results.items()}
         )
         
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"뉴스룸 검색 중 오류 발생: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+@router.get("/newsroom/pool/metrics")
+async def get_newsroom_pool_metrics():
+    """웹드라이버 풀 점유율 및 대여 대기 시간 메트릭"""
+    return get_driver_pool().get_metrics()
@@ -1,28 +1,20 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Union
+from functools import partial
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from ...scrapers.search_manager import SearchManager
-from ...analyzers.text_analyzer import TextAnalyzer
+from ...scrapers.search_manager import SearchManager, get_search_manager
+from ...analyzers.text_analyzer import TextAnalyzer, get_text_analyzer
 from ...analyzers.topic_modeling import TopicModeler
+from ...analyzers.model_registry import get_model_registry
 from ...services.search_service import GoogleSearchService, NaverSearchService
 from ...utils.storage import save_search_results
+from ...scrapers.source_orchestrator import SourceOrchestrator
+from ...scrapers.dedup import deduplicate
+from ...utils.search_cache import get_search_cache
+from ...utils.token_cache import get_token_cache
 
 router = APIRouter()
 
-# 의존성 주입을 위한 함수
-def get_search_manager():
-    from dotenv import load_dotenv
-    import os
-    
-    load_dotenv()
-    
-    return SearchManager(
-        google_api_key=os.getenv('GOOGLE_API_KEY'),
-        google_cx=os.getenv('GOOGLE_CX'),
-        naver_client_id=os.getenv('NAVER_CLIENT_ID'),
-        naver_client_secret=os.getenv('NAVER_CLIENT_SECRET')
-    )
-
 # 요청 모델
 class SearchRequest(BaseModel):
     keyword: str
@@ -34,16 +26,43 @@ class SearchRequest(BaseModel):
 class AnalyzeRequest(BaseModel):
     texts: List[str]
 
+class SimilarityRequest(BaseModel):
+    texts: List[str]
+    metric: Optional[str] = "jaccard"  # jaccard, cosine
+    top_k: Optional[int] = None  # 지정하면 전체 행렬 대신 텍스트별 상위 k개만 반환
+
 class TopicModelingRequest(BaseModel):
     texts: List[str]
     num_topics: Optional[int] = 5
     passes: Optional[int] = 10
+    backend: Optional[str] = "single"  # single, multicore
+    workers: Optional[int] = None
+    model_name: Optional[str] = None  # 지정하면 학습된 모델을 저장소에 저장
+
+class TopicSweepRequest(BaseModel):
+    texts: List[str]
+    min_topics: Optional[int] = 2
+    max_topics: Optional[int] = 30
+    alphas: Optional[List[Union[str, float]]] = ["symmetric"]
+    passes: Optional[int] = 10
+    patience: Optional[int] = 3
+    workers: Optional[int] = None
+
+class TopicInferRequest(BaseModel):
+    texts: List[str]
+    version: Optional[int] = None
+
+class TopicUpdateRequest(BaseModel):
+    texts: List[str]
+    passes: Optional[int] = 1
+    version: Optional[int] = None
 
 # 응답 모델
 class SearchResponse(BaseModel):
     results: List[Dict]
     total_count: int
     saved_files: Optional[List[str]] = []
+    source_timings: Optional[Dict[str, Dict]] = {}
 
 class AnalysisResponse(BaseModel):
     total_texts: int
@@ -55,6 +74,13 @@ class AnalysisResponse(BaseModel):
 class TopicModelingResponse(BaseModel):
     topics: List[dict]
     evaluation: dict
+    model_version: Optional[str] = None
+
+class TopicSweepResponse(BaseModel):
+    topics: List[dict]
+    best: dict
+    curve: List[dict]
+    stopped_early: bool
 
 # 엔드포인트
 @router.post("/search", response_model=SearchResponse)
@@ -71,37 +97,42 @@ async def search(request: SearchRequest):
     try:
         results = []
         saved_files = []
+        tasks = {}
         
         if "google" in request.sources:
-            google_service = GoogleSearchService()
-            google_results = await google_service.search(
+            tasks["google"] = partial(
+                GoogleSearchService().search,
                 keyword=request.keyword,
                 num_results=request.num_results,
                 date_range=request.date_range
             )
-            results.extend(google_results)
-            
-            if request.save_to_file and google_results:
-                filepath = save_search_results(google_results, "google", request.keyword)
-                saved_files.append(filepath)
         
         if "naver" in request.sources:
-            naver_service = NaverSearchService()
-            naver_results = await naver_service.search(
+            tasks["naver"] = partial(
+                NaverSearchService().search,
                 keyword=request.keyword,
                 num_results=request.num_results,
                 date_range=request.date_range
             )
-            results.extend(naver_results)
+        
+        # 출처별 동시 검색 (느리거나 실패한 출처는 빈 결과로 처리)
+        source_results = await SourceOrchestrator().run(tasks)
+        
+        for source, source_result in source_results.items():
+            results.extend(source_result.results)
             
-            if request.save_to_file and naver_results:
-                filepath = save_search_results(naver_results, "naver", request.keyword)
+            if request.save_to_file and source_result.results:
+                filepath = save_search_results(source_result.results, source, request.keyword)
                 saved_files.append(filepath)
         
+        # 출처 간 중복 기사 병합
+        results = deduplicate(results)
+        
         return SearchResponse(
             results=results,
             total_count=len(results),
-            saved_files=saved_files if request.save_to_file else []
+            saved_files=saved_files if request.save_to_file else [],
+            source_timings={source: result.to_dict() for source, result in source_results.items()}
         )
         
     except Exception as e:
@@ -110,21 +141,46 @@ async def search(request: SearchRequest):
             detail=f"검색 중 오류 발생: {str(e)}"
         )
 
+@router.get("/search/cache/stats")
+async def get_search_cache_stats():
+    """출처별 검색 캐시 적중률 및 절약한 API 호출 수"""
+    return get_search_cache().get_stats()
+
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_texts(request: AnalyzeRequest):
     """텍스트를 분석합니다."""
     try:
-        analyzer = TextAnalyzer()
-        results = analyzer.analyze_texts(request.texts)
+        results = get_text_analyzer().analyze_texts(request.texts)
         return AnalysisResponse(**results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/similarity")
+async def text_similarity(request: SimilarityRequest):
+    """여러 텍스트 간의 유사도 행렬 또는 텍스트별 상위 k개 유사 텍스트를 계산합니다."""
+    try:
+        analyzer = get_text_analyzer()
+        if request.top_k:
+            neighbors = analyzer.get_most_similar(request.texts, request.top_k, request.metric)
+            return {'neighbors': [
+                [{'index': index, 'score': score} for index, score in row] for row in neighbors
+            ]}
+        return {'matrix': analyzer.get_similarity_matrix(request.texts, request.metric).tolist()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/analyze/cache/stats")
+async def get_token_cache_stats():
+    """형태소 분석 캐시 적중률"""
+    return get_token_cache().get_stats()
+
 @router.post("/topic-modeling", response_model=TopicModelingResponse)
 async def topic_modeling(request: TopicModelingRequest):
     """토픽 모델링을 수행합니다."""
     try:
-        modeler = TopicModeler()
+        modeler = TopicModeler(backend=request.backend, workers=request.workers)
         modeler.prepare_corpus(request.texts)
         modeler.train_model(
             num_topics=request.num_topics,
@@ -134,9 +190,70 @@ async def topic_modeling(request: TopicModelingRequest):
         topics = modeler.get_topics()
         evaluation = modeler.evaluate_model()
         
+        model_version = None
+        if request.model_name:
+            model_version = get_model_registry().save(
+                request.model_name, modeler, {'evaluation': evaluation}
+            )
+        
         return TopicModelingResponse(
             topics=topics,
-            evaluation=evaluation
+            evaluation=evaluation,
+            model_version=model_version
         )
+    except ValueError as e:
+        # 잘못된 모델 이름 등
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/topic-modeling/sweep", response_model=TopicSweepResponse)
+def topic_modeling_sweep(request: TopicSweepRequest):
+    """
+    토픽 수/alpha 조합을 탐색하여 coherence가 가장 높은 모델의 토픽을 반환합니다.
+    탐색은 수 분이 걸리므로 이벤트 루프를 막지 않도록 스레드풀에서 실행되는 동기 핸들러로 둡니다.
+    """
+    try:
+        modeler = TopicModeler(workers=request.workers)
+        modeler.prepare_corpus(request.texts)
+        result = modeler.sweep_topics(
+            topic_range=range(request.min_topics, request.max_topics + 1),
+            alphas=request.alphas,
+            passes=request.passes,
+            patience=request.patience
+        )
+        
+        return TopicSweepResponse(
+            topics=modeler.get_topics(),
+            best=result['best'],
+            curve=result['curve'],
+            stopped_early=result['stopped_early']
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/topic-models")
+async def list_topic_models():
+    """저장된 토픽 모델 버전 목록"""
+    return get_model_registry().list_models()
+
+@router.post("/topic-models/{name}/infer")
+async def infer_topics(name: str, request: TopicInferRequest):
+    """저장된 모델로 새 문서들의 토픽 분포를 계산합니다."""
+    try:
+        return {'distributions': get_model_registry().infer(name, request.texts, request.version)}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/topic-models/{name}/update")
+async def update_topic_model(name: str, request: TopicUpdateRequest):
+    """저장된 모델에 새 문서를 추가 학습하여 새 버전으로 저장합니다."""
+    try:
+        version = get_model_registry().update(name, request.texts, request.passes, request.version)
+        return {'model_version': version}
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -4,11 +4,12 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import nbformat
 from nbformat.v4 import new_notebook, new_markdown_cell, new_code_cell
-from tests.text_preprocessing import TextPreprocessor
+from tests.text_preprocessing import get_preprocessor
+from src.analyzers.cooccurrence import keyword_cooccurrence
+from src.analyzers.ngram_counter import NgramCounter
+from src.analyzers.keyword_trends import keyword_trend_report, keyword_trends
 import pandas as pd
 import numpy as np
-from collections import Counter
-from nltk import bigrams
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -17,7 +18,7 @@ class NotebookProcessor:
         self.notebook_path = Path(notebook_path)
         self.notebook = None
         self.cells = []
-        self.text_preprocessor = TextPreprocessor()
+        self.text_preprocessor = get_preprocessor()
         self.load_notebook()
 
     def load_notebook(self) -> None:
@@ -109,70 +110,60 @@ class NotebookProcessor:
 
     def analyze_keyword_frequency(self, df: pd.DataFrame) -> Dict[str, int]:
         """키워드별 등장 빈도를 분석합니다."""
-        keyword_counts = {}
-        for category, keywords in self.text_preprocessor.domain_keywords.items():
-            for keyword in keywords:
-                count = sum(1 for content in df['processed_content'] if keyword in content)
-                if count > 0:
-                    keyword_counts[keyword] = count
-        return keyword_counts
+        return self.text_preprocessor.keyword_matcher.document_frequency(df['processed_content'])
 
     def analyze_yearly_keywords(self, df: pd.DataFrame) -> pd.DataFrame:
         """연도별 키워드 등장 추이를 분석합니다."""
-        yearly_keywords = pd.DataFrame()
-        for category, keywords in self.text_preprocessor.domain_keywords.items():
-            for keyword in keywords:
-                yearly_count = df.groupby('year')['processed_content'].apply(
-                    lambda x: sum(1 for content in x if keyword in content)
-                )
-                yearly_keywords[f'{category}_{keyword}'] = yearly_count
-        return yearly_keywords
+        counts, _ = keyword_trends(df, self.text_preprocessor.keyword_matcher, period='year')
+        return pd.DataFrame({
+            f'{category}_{keyword}': counts[keyword]
+            for category, keywords in self.text_preprocessor.domain_keywords.items()
+            for keyword in keywords
+        })
+
+    def analyze_keyword_trends(self, df: pd.DataFrame, period: str = 'year', by: Optional[List[str]] = None,
+                               rolling_window: Optional[int] = 3, date_column: str = 'date') -> Dict[str, pd.DataFrame]:
+        """
+        기간(year/quarter/month)별, 선택적으로 출처 등 그룹별 키워드 추이를 분석합니다.
+        문서 수, 문서 비율, 이동 평균, 증가율 표를 반환합니다.
+        """
+        return keyword_trend_report(
+            df, self.text_preprocessor.keyword_matcher, period=period, date_column=date_column,
+            by=by or (), rolling_window=rolling_window
+        )
 
     def analyze_bigrams(self, texts: List[str], top_n: int = 20) -> pd.DataFrame:
         """2-gram 분석을 수행합니다."""
-        all_bigrams = []
+        counter = NgramCounter(n_range=(2, 2))
         for text in texts:
-            words = text.split()
-            all_bigrams.extend(list(bigrams(words)))
-        bigram_freq = Counter(all_bigrams)
-        
-        bigram_df = pd.DataFrame(bigram_freq.most_common(top_n), columns=['bigram', 'count'])
-        bigram_df['bigram'] = bigram_df['bigram'].apply(lambda x: ' '.join(x))
-        return bigram_df
-
-    def analyze_yearly_bigrams(self, df: pd.DataFrame, top_n: int = 5) -> Dict[int, pd.DataFrame]:
-        """연도별 2-gram 분석을 수행합니다."""
-        yearly_bigrams = {}
-        for year in df['year'].unique():
-            year_texts = df[df['year'] == year]['processed_content']
-            year_bigrams = []
-            for text in year_texts:
-                words = text.split()
-                year_bigrams.extend(list(bigrams(words)))
-            bigram_freq = Counter(year_bigrams)
-            
-            top_bigrams = pd.DataFrame(bigram_freq.most_common(top_n), columns=['bigram', 'count'])
-            top_bigrams['bigram'] = top_bigrams['bigram'].apply(lambda x: ' '.join(x))
-            yearly_bigrams[year] = top_bigrams
-        return yearly_bigrams
+            counter.add(text.split())
+        return pd.DataFrame(counter.most_common(top_n), columns=['bigram', 'count'])
+
+    def analyze_yearly_bigrams(self, df: pd.DataFrame, top_n: int = 5, mode: str = 'exact') -> Dict[int, pd.DataFrame]:
+        """
+        연도별 2-gram 분석을 수행합니다. 문서를 한 번만 읽어 모든 연도를 함께 셉니다.
+        문서가 매우 많으면 mode='sketch' 로 고정 메모리에서 상위 2-gram을 추정합니다.
+        """
+        counter = NgramCounter(n_range=(2, 2), mode=mode, top_k=max(top_n * 20, 100))
+        counter.add_dataframe(df, group_columns=('year',))
+        return {
+            year: pd.DataFrame(counter.most_common(top_n, group=('year', year)), columns=['bigram', 'count'])
+            for year in df['year'].unique()
+        }
 
-    def analyze_keyword_correlation(self, df: pd.DataFrame) -> pd.DataFrame:
-        """키워드 간 상관관계를 분석합니다."""
+    def analyze_keyword_correlation(self, df: pd.DataFrame, window: str = 'document', measure: str = 'count',
+                                    text_column: str = 'processed_content') -> pd.DataFrame:
+        """
+        키워드 간 상관관계(동시 출현)를 분석합니다.
+        window 가 'paragraph'/'sentence' 이면 문장 구분이 남아 있는 컬럼을 text_column 으로 지정해야 합니다.
+        measure 는 'count', 'pmi', 'npmi' 중 하나입니다.
+        """
         all_domain_keywords = [
             keyword 
             for keywords in self.text_preprocessor.domain_keywords.values() 
             for keyword in keywords
         ]
-        
-        keyword_matrix = pd.DataFrame(0, index=all_domain_keywords, columns=all_domain_keywords)
-        for text in df['processed_content']:
-            words = set(text.split())
-            for i, keyword1 in enumerate(all_domain_keywords):
-                for keyword2 in all_domain_keywords[i+1:]:
-                    if keyword1 in words and keyword2 in words:
-                        keyword_matrix.loc[keyword1, keyword2] += 1
-                        keyword_matrix.loc[keyword2, keyword1] += 1
-        return keyword_matrix
+        return keyword_cooccurrence(df[text_column], all_domain_keywords, window=window, measure=measure)
 
     def plot_keyword_frequency(self, keyword_counts: Dict[str, int], figsize: Tuple[int, int] = (15, 8)) -> None:
         """키워드 등장 빈도를 시각화합니다."""
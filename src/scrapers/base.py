@@ -2,6 +2,15 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from datetime import datetime
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+class IncompleteSearchError(Exception):
+    """페이지 요청 중 오류로 검색이 중단됨. 그때까지 수집한 결과를 results 에 담습니다."""
+    
+    def __init__(self, message: str, results: List[Dict]):
+        super().__init__(message)
+        self.results = results
+
 class BaseScraper(ABC):
     """기본 스크래퍼 클래스"""
     
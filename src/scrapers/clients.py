@@ -0,0 +1,31 @@
+import threading
+from typing import Any, Dict
+from googleapiclient.discovery import build
+
+_google_services: Dict[str, Any] = {}
+_google_lock = threading.Lock()
+
+def get_google_service(api_key: str):
+    """
+    API 키별 Custom Search 클라이언트를 한 번만 생성하여 재사용합니다.
+    라이브러리에 포함된 discovery 문서를 사용하므로 네트워크 요청이 없습니다.
+
+    Args:
+        api_key (str): Google API 키
+
+    Returns:
+        googleapiclient.discovery.Resource: customsearch v1 클라이언트
+    """
+    service = _google_services.get(api_key)
+    if service is None:
+        with _google_lock:
+            service = _google_services.get(api_key)
+            if service is None:
+                service = build(
+                    "customsearch", "v1",
+                    developerKey=api_key,
+                    static_discovery=True,
+                    cache_discovery=False
+                )
+                _google_services[api_key] = service
+    return service
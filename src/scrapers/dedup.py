@@ -0,0 +1,209 @@
+import re
+import html
+import hashlib
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# URL에서 제거할 추적용 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'from', 'cmpid', 'spm', '_ga', 'ito'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# 결과 레코드에서 URL을 찾을 필드 (앞쪽이 우선, Naver의 원문 링크 우선)
+URL_FIELDS = ('original_link', 'link', 'url')
+
+_TAGS = re.compile(r'<[^>]+>')
+_NON_WORD = re.compile(r'[^\w]+')
+
+SIMHASH_BITS = 64
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 문서를 가리키는 URL이 같은 문자열이 되도록 정규화합니다.
+    (소문자 호스트, www./m. 접두어 제거, 추적 파라미터/프래그먼트 제거, 파라미터 정렬)
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규화된 URL (빈 값이면 빈 문자열)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+def normalize_text(text: str) -> str:
+    """HTML 태그/엔티티와 기호를 제거하고 소문자로 변환합니다."""
+    text = html.unescape(_TAGS.sub(' ', text or ""))
+    return _NON_WORD.sub(' ', text.lower()).strip()
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    문자 n-gram 기반 64비트 SimHash를 계산합니다. 비슷한 문장은 해밍 거리가 작습니다.
+
+    Args:
+        text (str): 정규화된 텍스트
+        shingle_size (int): 문자 n-gram 길이
+
+    Returns:
+        int: 64비트 지문
+    """
+    compact = text.replace(' ', '')
+    if len(compact) <= shingle_size:
+        shingles = [compact]
+    else:
+        shingles = [compact[i:i + shingle_size] for i in range(len(compact) - shingle_size + 1)]
+
+    values = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little') for s in shingles),
+        dtype=np.uint64, count=len(shingles)
+    )
+    # 각 비트 위치에서 1인 n-gram이 절반을 넘으면 지문의 해당 비트를 1로 설정
+    bits = np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+
+    fingerprint = 0
+    for bit in np.flatnonzero(majority):
+        fingerprint |= 1 << int(bit)
+    return fingerprint
+
+class ResultDeduplicator:
+    """
+    검색 결과를 스트리밍으로 받아 중복을 병합합니다.
+    정규화된 URL이 같거나, 제목+요약의 SimHash 해밍 거리가 기준 이하이면 같은 기사로 봅니다.
+    SimHash는 밴드별 해시 테이블로 후보를 찾으므로 결과 수에 비례하는 시간이 걸립니다.
+    """
+
+    def __init__(self, max_distance: int = 3, bands: int = 4, min_text_length: int = 10):
+        """
+        Args:
+            max_distance (int): 같은 기사로 볼 최대 해밍 거리 (bands 보다 작아야 누락 없음)
+            bands (int): SimHash를 나눌 밴드 수
+            min_text_length (int): 유사도 비교를 할 최소 텍스트 길이 (짧으면 URL로만 비교)
+        """
+        self.max_distance = max_distance
+        self.bands = bands
+        self.band_bits = SIMHASH_BITS // bands
+        self.min_text_length = min_text_length
+
+        self.records: List[Dict] = []
+        self._by_url: Dict[str, int] = {}
+        self._band_tables: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._fingerprints: List[Optional[int]] = []
+
+    def add(self, result: Dict) -> Tuple[Dict, bool]:
+        """
+        결과 하나를 추가합니다.
+
+        Args:
+            result (Dict): 검색 결과 (title, link/url, snippet, date, source ...)
+
+        Returns:
+            Tuple[Dict, bool]: (병합된 레코드, 새 기사 여부)
+        """
+        urls = [canonicalize_url(result.get(field, '')) for field in URL_FIELDS]
+        urls = [url for url in urls if url]
+
+        index = next((self._by_url[url] for url in urls if url in self._by_url), None)
+
+        fingerprint = None
+        text = normalize_text(f"{result.get('title', '')} {result.get('snippet', '')}")
+        if len(text) >= self.min_text_length:
+            fingerprint = simhash(text)
+            if index is None:
+                index = self._find_similar(fingerprint)
+
+        if index is not None:
+            record = self.records[index]
+            self._merge(record, result)
+            for url in urls:
+                self._by_url.setdefault(url, index)
+            return record, False
+
+        index = len(self.records)
+        record = dict(result)
+        record['sources'] = [result['source']] if result.get('source') else []
+        record['links'] = [result[field] for field in URL_FIELDS if result.get(field)][:1]
+        self.records.append(record)
+        self._fingerprints.append(fingerprint)
+
+        for url in urls:
+            self._by_url.setdefault(url, index)
+        if fingerprint is not None:
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                self._band_tables[band].setdefault(key, []).append(index)
+        return record, True
+
+    def extend(self, results: Iterable[Dict]) -> None:
+        for result in results:
+            self.add(result)
+
+    def results(self) -> List[Dict]:
+        """병합된 결과를 처음 등장한 순서대로 반환합니다."""
+        return list(self.records)
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        mask = (1 << self.band_bits) - 1
+        return [(fingerprint >> (band * self.band_bits)) & mask for band in range(self.bands)]
+
+    def _find_similar(self, fingerprint: int) -> Optional[int]:
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            for index in self._band_tables[band].get(key, []):
+                if bin(fingerprint ^ self._fingerprints[index]).count('1') <= self.max_distance:
+                    return index
+        return None
+
+    @staticmethod
+    def _merge(record: Dict, result: Dict) -> None:
+        """중복 결과의 메타데이터를 기존 레코드에 합칩니다."""
+        source = result.get('source')
+        if source and source not in record['sources']:
+            record['sources'].append(source)
+
+        link = next((result[field] for field in URL_FIELDS if result.get(field)), None)
+        if link and link not in record['links']:
+            record['links'].append(link)
+
+        for key, value in result.items():
+            if key in ('source', 'sources', 'links'):
+                continue
+            current = record.get(key)
+            if not current:
+                record[key] = value
+            elif key in ('snippet', 'content') and isinstance(value, str) and len(value) > len(current):
+                # 더 긴 요약/본문을 사용
+                record[key] = value
+
+def deduplicate(results: Iterable[Dict], max_distance: int = 3) -> List[Dict]:
+    """
+    여러 출처의 검색 결과에서 중복 기사를 병합합니다.
+
+    Args:
+        results (Iterable[Dict]): 검색 결과
+        max_distance (int): 같은 기사로 볼 SimHash 최대 해밍 거리
+
+    Returns:
+        List[Dict]: 중복이 병합된 결과 (sources, links 필드 추가)
+    """
+    deduplicator = ResultDeduplicator(max_distance=max_distance)
+    deduplicator.extend(results)
+    return deduplicator.results()
@@ -0,0 +1,291 @@
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+from .base import USER_AGENT
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """크롬드라이버 경로 (프로세스당 한 번만 설치 확인)"""
+    return ChromeDriverManager().install()
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """헤드리스 크롬 웹드라이버 생성"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+    return webdriver.Chrome(
+        service=Service(_chromedriver_path()),
+        options=chrome_options
+    )
+
+class DriverPoolTimeout(TimeoutError):
+    """제한 시간 내에 웹드라이버를 대여하지 못한 경우"""
+
+class PooledDriver:
+    """풀에서 대여되는 웹드라이버 래퍼"""
+
+    def __init__(self, driver, wait_timeout: int = 20):
+        self.driver = driver
+        self.wait = WebDriverWait(driver, wait_timeout)
+        self.pages_loaded = 0
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+    def get(self, url: str) -> None:
+        """페이지를 로드하고 로드 횟수를 기록합니다."""
+        self.record_page()
+        self.driver.get(url)
+
+    def record_page(self) -> None:
+        """드라이버 재활용 판단을 위해 페이지 로드 횟수를 증가시킵니다."""
+        self.pages_loaded += 1
+        self.last_used_at = time.monotonic()
+
+class DriverPool:
+    """헤드리스 크롬 웹드라이버 풀"""
+
+    def __init__(
+        self,
+        max_size: int = 2,
+        max_pages: int = 200,
+        lease_timeout: float = 60.0,
+        health_check_interval: float = 30.0,
+        wait_timeout: int = 20,
+        driver_factory: Optional[Callable] = None
+    ):
+        """
+        Args:
+            max_size (int): 동시에 유지할 최대 드라이버 수
+            max_pages (int): 드라이버 재생성 전까지 허용할 페이지 로드 수
+            lease_timeout (float): 드라이버 대여 대기 제한 시간(초)
+            health_check_interval (float): 유휴 드라이버 재검사 간격(초)
+            wait_timeout (int): WebDriverWait 제한 시간(초)
+            driver_factory (Optional[Callable]): 드라이버 생성 함수
+        """
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.lease_timeout = lease_timeout
+        self.health_check_interval = health_check_interval
+        self.wait_timeout = wait_timeout
+        self.driver_factory = driver_factory or create_chrome_driver
+
+        self._cond = threading.Condition()
+        self._idle: List[PooledDriver] = []
+        self._total = 0
+        self._closed = False
+
+        # 메트릭
+        self._created = 0
+        self._recycled = 0
+        self._leases = 0
+        self._lease_timeouts = 0
+        self._lease_wait_total = 0.0
+        self._lease_wait_max = 0.0
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        드라이버를 미리 생성해 둡니다.
+
+        Args:
+            count (Optional[int]): 생성할 드라이버 수 (기본값: max_size)
+
+        Returns:
+            int: 새로 생성된 드라이버 수
+        """
+        count = self.max_size if count is None else min(count, self.max_size)
+        created = 0
+
+        while True:
+            with self._cond:
+                if self._closed or self._total >= count:
+                    break
+                self._total += 1
+
+            try:
+                pooled = self._create()
+            except Exception as e:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                logging.error(f"웹드라이버 워밍업 중 오류: {str(e)}")
+                break
+
+            with self._cond:
+                self._idle.append(pooled)
+                self._cond.notify()
+            created += 1
+
+        return created
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        드라이버를 대여합니다.
+
+        Args:
+            timeout (Optional[float]): 대기 제한 시간(초)
+
+        Returns:
+            PooledDriver: 대여된 드라이버
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            pooled = None
+            with self._cond:
+                while not self._idle and self._total >= self.max_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._lease_timeouts += 1
+                        raise DriverPoolTimeout(f"{timeout}초 내에 웹드라이버를 대여하지 못했습니다.")
+                    self._cond.wait(remaining)
+
+                if self._closed:
+                    raise RuntimeError("웹드라이버 풀이 종료되었습니다.")
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    self._total += 1
+
+            if pooled is None:
+                try:
+                    pooled = self._create()
+                except Exception:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+            elif (time.monotonic() - pooled.last_used_at > self.health_check_interval
+                  and not self._is_healthy(pooled)):
+                self._discard(pooled)
+                continue
+
+            self._record_lease(time.monotonic() - started)
+            return pooled
+
+    def release(self, pooled: PooledDriver) -> None:
+        """
+        대여한 드라이버를 반납합니다. 비정상이거나 사용 한도를 넘은 드라이버는 폐기합니다.
+
+        Args:
+            pooled (PooledDriver): 반납할 드라이버
+        """
+        if self._closed or pooled.pages_loaded >= self.max_pages or not self._reset(pooled):
+            self._discard(pooled)
+            return
+
+        pooled.last_used_at = time.monotonic()
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """with 문으로 드라이버를 대여/반납합니다."""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def close(self) -> None:
+        """풀의 모든 유휴 드라이버를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+
+        for pooled in idle:
+            self._discard(pooled)
+
+    def get_metrics(self) -> Dict:
+        """풀 점유율과 대여 대기 시간 메트릭을 반환합니다."""
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                'max_size': self.max_size,
+                'size': self._total,
+                'in_use': self._total - idle,
+                'idle': idle,
+                'occupancy': (self._total - idle) / self.max_size if self.max_size else 0.0,
+                'created': self._created,
+                'recycled': self._recycled,
+                'leases': self._leases,
+                'lease_timeouts': self._lease_timeouts,
+                'lease_wait_avg_ms': (self._lease_wait_total / self._leases * 1000) if self._leases else 0.0,
+                'lease_wait_max_ms': self._lease_wait_max * 1000
+            }
+
+    def _create(self) -> PooledDriver:
+        """새 드라이버를 생성합니다."""
+        pooled = PooledDriver(self.driver_factory(), self.wait_timeout)
+        with self._cond:
+            self._created += 1
+        return pooled
+
+    def _discard(self, pooled: PooledDriver) -> None:
+        """드라이버를 종료하고 풀에서 제거합니다."""
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logging.warning(f"웹드라이버 종료 중 오류: {str(e)}")
+
+        with self._cond:
+            self._total -= 1
+            self._recycled += 1
+            self._cond.notify()
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """드라이버가 응답하는지 확인합니다."""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """추가로 열린 창을 닫고 드라이버가 정상인지 확인합니다."""
+        try:
+            handles = pooled.driver.window_handles
+            for handle in handles[1:]:
+                pooled.driver.switch_to.window(handle)
+                pooled.driver.close()
+            pooled.driver.switch_to.window(handles[0])
+        except Exception:
+            return False
+        return self._is_healthy(pooled)
+
+    def _record_lease(self, waited: float) -> None:
+        with self._cond:
+            self._leases += 1
+            self._lease_wait_total += waited
+            self._lease_wait_max = max(self._lease_wait_max, waited)
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+def get_driver_pool() -> DriverPool:
+    """프로세스 공용 웹드라이버 풀을 반환합니다."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = DriverPool(
+                    max_size=int(os.getenv('NEWSROOM_DRIVER_POOL_SIZE', '2')),
+                    max_pages=int(os.getenv('NEWSROOM_DRIVER_MAX_PAGES', '200'))
+                )
+    return _pool
@@ -0,0 +1,102 @@
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+class HostThrottle:
+    """호스트별 동시 요청 수 제한과 요청 간 최소 간격(politeness delay)을 관리합니다."""
+
+    def __init__(self, max_per_host: int = 4, delay: float = 0.2):
+        """
+        Args:
+            max_per_host (int): 호스트당 최대 동시 요청 수
+            delay (float): 같은 호스트에 대한 요청 시작 간 최소 간격(초)
+        """
+        self.max_per_host = max_per_host
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        """요청 전송 구간을 감싸 호스트별 제한을 적용합니다."""
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_slot.get(host, now))
+                self._next_slot[host] = start_at + self.delay
+
+            wait = start_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+class ArticleFetchQueue:
+    """목록 크롤링 중 발견한 기사의 본문을 병렬로 수집하는 작업 큐"""
+
+    def __init__(self, fetch: Callable[[str], str], max_workers: int = 8):
+        """
+        Args:
+            fetch (Callable[[str], str]): 기사 URL을 받아 본문을 반환하는 함수
+            max_workers (int): 동시 수집 작업 수 (0이면 호출 스레드에서 순차 수집)
+        """
+        self.fetch = fetch
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+        self._pending: List[Tuple[Dict, Future]] = []
+
+    def submit(self, item: Dict, content: Optional[str] = None) -> None:
+        """
+        기사 메타데이터를 큐에 추가합니다.
+
+        Args:
+            item (Dict): 'url' 키를 포함한 기사 메타데이터
+            content (Optional[str]): 이미 알고 있는 본문 (지정하면 수집하지 않음)
+        """
+        if content is not None:
+            future = Future()
+            future.set_result(content)
+        elif self._executor is not None:
+            future = self._executor.submit(self.fetch, item['url'])
+        else:
+            future = Future()
+            try:
+                future.set_result(self.fetch(item['url']))
+            except Exception as e:
+                future.set_exception(e)
+        self._pending.append((item, future))
+
+    def drain(self) -> Iterator[Tuple[Dict, Future]]:
+        """제출 순서대로 (기사 메타데이터, 완료된 Future)를 반환합니다."""
+        pending, self._pending = self._pending, []
+        for item, future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+            yield item, future
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def close(self) -> None:
+        """작업 스레드를 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,39 +1,102 @@
-from typing import List, Dict, Optional
-from googleapiclient.discovery import build
-from .base import BaseScraper
+import threading
+from functools import partial
+from typing import List, Dict, Optional, Iterator, Tuple
+from googleapiclient.http import build_http
+from .base import BaseScraper, IncompleteSearchError
+from .clients import get_google_service
+from .pagination import build_pages, iter_pages
+from ..utils.search_cache import SearchCache
 
 class GoogleSearchScraper(BaseScraper):
     """구글 검색 API를 사용하는 스크래퍼"""
     
-    def __init__(self, api_key: str, cx: str):
+    PAGE_SIZE = 10      # Google API는 한 번에 최대 10개 결과만 반환
+    MAX_RESULTS = 99    # start + num 은 100을 넘을 수 없음 (마지막 페이지는 start=91, num=9)
+    
+    def __init__(self, api_key: str, cx: str, max_concurrency: int = 4,
+                 cache: Optional[SearchCache] = None):
         """
         Args:
             api_key (str): Google API 키
             cx (str): Custom Search Engine ID
+            max_concurrency (int): 동시에 요청할 최대 페이지 수
+            cache (Optional[SearchCache]): 검색 결과 캐시 (None이면 항상 API 호출)
         """
-        self.service = build("customsearch", "v1", developerKey=api_key)
+        self.service = get_google_service(api_key)
         self.cx = cx
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        # httplib2.Http는 스레드 안전하지 않으므로 스레드마다 따로 사용
+        self._local = threading.local()
     
     def search(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> List[Dict]:
         try:
-            # 검색 쿼리 구성
-            query = {
-                'q': keyword,
-                'cx': self.cx,
-                'num': min(num_results, 10),  # Google API는 한 번에 최대 10개 결과만 반환
-                'dateRestrict': date_range if date_range else None
-            }
-            
-            # 검색 실행
-            result = self.service.cse().list(**query).execute()
+            if self.cache is None:
+                return self._search(keyword, num_results, date_range)[0]
             
-            # 결과 처리
-            items = result.get('items', [])
-            return self._process_results(items)
-            
-        except Exception as e:
+            params = {'cx': self.cx, 'keyword': keyword, 'num_results': num_results, 'date_range': date_range}
+            return self.cache.get_or_fetch('google', params, partial(self._search, keyword, num_results, date_range))
+        except IncompleteSearchError as e:
+            # 일부 페이지만 받은 결과는 캐시하지 않고 이번 요청에만 반환
             print(f"Error in Google search: {str(e)}")
-            return []
+            return e.results
+    
+    def _search(self, keyword: str, num_results: int, date_range: Optional[str]) -> Tuple[List[Dict], int]:
+        """
+        API를 호출하여 검색 결과를 수집합니다.
+        
+        Returns:
+            Tuple[List[Dict], int]: (검색 결과, 페이지 요청 수)
+        
+        Raises:
+            IncompleteSearchError: 페이지 요청이 실패한 경우 (그때까지의 결과 포함)
+        """
+        results = []
+        api_calls = 0
+        try:
+            for page in self.iter_pages(keyword, num_results, date_range):
+                results.extend(page)
+                api_calls += 1
+        except Exception as e:
+            raise IncompleteSearchError(str(e), results[:num_results]) from e
+        return results[:num_results], api_calls
+    
+    def iter_pages(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        검색 결과를 페이지 단위로 반환합니다. 페이지는 동시에 요청되며 순서대로 전달됩니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            num_results (int): 반환할 결과 수 (최대 99)
+            date_range (Optional[str]): 검색 기간 (예: 'd1', 'w1', 'm1', 'y1')
+            
+        Yields:
+            List[Dict]: 페이지별 검색 결과
+        """
+        pages = build_pages(num_results, self.PAGE_SIZE, self.MAX_RESULTS)
+        fetch_page = partial(self._fetch_page, keyword, date_range)
+        for items in iter_pages(fetch_page, pages, self.max_concurrency):
+            yield self._process_results(items)
+    
+    def _fetch_page(self, keyword: str, date_range: Optional[str], start: int, num: int) -> List[Dict]:
+        """한 페이지의 원본 검색 결과를 요청합니다."""
+        query = {
+            'q': keyword,
+            'cx': self.cx,
+            'num': num,
+            'start': start,
+            'dateRestrict': date_range if date_range else None
+        }
+        result = self.service.cse().list(**query).execute(http=self._http())
+        return result.get('items', [])
+    
+    def _http(self):
+        """현재 스레드 전용 HTTP 객체를 반환합니다."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = build_http()
+            self._local.http = http
+        return http
     
     def _process_results(self, items: List[Dict]) -> List[Dict]:
         """검색 결과를 처리합니다."""
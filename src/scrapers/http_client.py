@@ -0,0 +1,48 @@
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .base import USER_AGENT
+
+DEFAULT_TIMEOUT = 10
+
+def create_http_session(pool_maxsize: int = 20, retries: int = 2) -> requests.Session:
+    """
+    커넥션 풀과 재시도 정책이 설정된 HTTP 세션을 생성합니다.
+
+    Args:
+        pool_maxsize (int): 호스트당 유지할 최대 커넥션 수
+        retries (int): 일시적 오류 시 재시도 횟수
+
+    Returns:
+        requests.Session: HTTP 세션
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
+    })
+    return session
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """프로세스 공용 HTTP 세션을 반환합니다."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_http_session()
+    return _session
@@ -1,21 +1,83 @@
-from typing import List, Dict, Optional
-import requests
-from .base import BaseScraper
+from functools import partial
+from typing import List, Dict, Optional, Iterator, Tuple
+from .base import BaseScraper, IncompleteSearchError
+from .http_client import DEFAULT_TIMEOUT, get_http_session
+from .pagination import build_pages, iter_pages
+from ..utils.search_cache import SearchCache
 
 class NaverSearchScraper(BaseScraper):
     """네이버 검색 API를 사용하는 스크래퍼"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    PAGE_SIZE = 100     # Naver API는 한 번에 최대 100개 결과 반환
+    MAX_RESULTS = 1000  # start 는 최대 1000
+    
+    def __init__(self, client_id: str, client_secret: str, max_concurrency: int = 4,
+                 cache: Optional[SearchCache] = None):
         """
         Args:
             client_id (str): Naver API Client ID
             client_secret (str): Naver API Client Secret
+            max_concurrency (int): 동시에 요청할 최대 페이지 수
+            cache (Optional[SearchCache]): 검색 결과 캐시 (None이면 항상 API 호출)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.session = get_http_session()
     
     def search(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> List[Dict]:
+        try:
+            if self.cache is None:
+                return self._search(keyword, num_results, date_range)[0]
+            
+            params = {'keyword': keyword, 'num_results': num_results, 'date_range': date_range}
+            return self.cache.get_or_fetch('naver', params, partial(self._search, keyword, num_results, date_range))
+        except IncompleteSearchError as e:
+            # 일부 페이지만 받은 결과는 캐시하지 않고 이번 요청에만 반환
+            print(f"Error in Naver search: {str(e)}")
+            return e.results
+    
+    def _search(self, keyword: str, num_results: int, date_range: Optional[str]) -> Tuple[List[Dict], int]:
+        """
+        API를 호출하여 검색 결과를 수집합니다.
+        
+        Returns:
+            Tuple[List[Dict], int]: (검색 결과, 페이지 요청 수)
+        
+        Raises:
+            IncompleteSearchError: 페이지 요청이 실패한 경우 (그때까지의 결과 포함)
+        """
+        results = []
+        api_calls = 0
+        try:
+            for page in self.iter_pages(keyword, num_results, date_range):
+                results.extend(page)
+                api_calls += 1
+        except Exception as e:
+            raise IncompleteSearchError(str(e), results[:num_results]) from e
+        return results[:num_results], api_calls
+    
+    def iter_pages(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        검색 결과를 페이지 단위로 반환합니다. 페이지는 동시에 요청되며 순서대로 전달됩니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            num_results (int): 반환할 결과 수 (최대 1000)
+            date_range (Optional[str]): 검색 기간 (Naver API는 기간 검색을 지원하지 않아 무시됨)
+            
+        Yields:
+            List[Dict]: 페이지별 검색 결과
+        """
+        pages = build_pages(num_results, self.PAGE_SIZE, self.MAX_RESULTS)
+        fetch_page = partial(self._fetch_page, keyword)
+        for items in iter_pages(fetch_page, pages, self.max_concurrency):
+            yield self._process_results(items)
+    
+    def _fetch_page(self, keyword: str, start: int, display: int) -> List[Dict]:
+        """한 페이지의 원본 검색 결과를 요청합니다."""
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
@@ -23,21 +85,14 @@ class NaverSearchScraper(BaseScraper):
         
         params = {
             'query': keyword,
-            'display': min(num_results, 100),  # Naver API는 한 번에 최대 100개 결과 반환
-            'start': 1,
+            'display': display,
+            'start': start,
             'sort': 'date'
         }
         
-        try:
-            response = requests.get(self.base_url, headers=headers, params=params)
-            response.raise_for_status()
-            
-            results = response.json()
-            return self._process_results(results.get('items', []))
-            
-        except Exception as e:
-            print(f"Error in Naver search: {str(e)}")
-            return []
+        response = self.session.get(self.base_url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get('items', [])
     
     def _process_results(self, items: List[Dict]) -> List[Dict]:
         """검색 결과를 처리합니다."""
@@ -46,6 +101,7 @@ class NaverSearchScraper(BaseScraper):
             processed_results.append({
                 'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
                 'link': item.get('link', ''),
+                'original_link': item.get('originallink', ''),
                 'snippet': item.get('description', '').replace('<b>', '').replace('</b>', ''),
                 'date': self._format_date(item.get('pubDate', '')),
                 'source': 'naver'
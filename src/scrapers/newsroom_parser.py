@@ -0,0 +1,106 @@
+import re
+from typing import List, Dict
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+_WHITESPACE = re.compile(r'\s+')
+
+def _text(element) -> str:
+    """요소의 텍스트를 브라우저 렌더링과 같이 공백 정리하여 반환합니다."""
+    if element is None:
+        return ""
+    return _WHITESPACE.sub(' ', element.get_text()).strip()
+
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
+def parse_skhynix_list(html: str, base_url: str) -> List[Dict]:
+    """
+    SK하이닉스 뉴스룸 목록 페이지에서 기사 메타데이터를 추출합니다.
+
+    Args:
+        html (str): 목록 페이지 HTML
+        base_url (str): 상대 경로 변환에 사용할 기본 URL
+
+    Returns:
+        List[Dict]: 기사 메타데이터 리스트 (title, url, date, category, tags)
+    """
+    items = []
+    for article in _soup(html).find_all("article"):
+        title_element = article.select_one("h2.tit a")
+        if title_element is None or not title_element.get("href"):
+            continue
+
+        items.append({
+            'title': _text(title_element),
+            'url': urljoin(base_url, title_element["href"]),
+            'date': _text(article.select_one("span.date")),
+            'category': ' '.join(_text(a) for a in article.select("div.category a")),
+            'tags': [_text(a) for a in article.select("ul.tags li a")]
+        })
+    return items
+
+def parse_skhynix_article(html: str) -> str:
+    """
+    SK하이닉스 뉴스룸 기사 페이지에서 본문을 추출합니다.
+
+    Args:
+        html (str): 기사 페이지 HTML
+
+    Returns:
+        str: 본문 (추출 실패 시 빈 문자열)
+    """
+    content_container = _soup(html).select_one("div.post-contents")
+    if content_container is None:
+        return ""
+
+    content_texts = []
+    for p in content_container.find_all("p"):
+        text = _text(p)
+        if text and not text.startswith('* '):
+            content_texts.append(text)
+    return '\n'.join(content_texts)
+
+def parse_samsung_list(html: str, base_url: str) -> List[Dict]:
+    """
+    삼성반도체 뉴스룸 카테고리 페이지에서 기사 메타데이터를 추출합니다.
+
+    Args:
+        html (str): 카테고리 페이지 HTML
+        base_url (str): 상대 경로 변환에 사용할 기본 URL
+
+    Returns:
+        List[Dict]: 기사 메타데이터 리스트 (title, url, date, category, description)
+    """
+    items = []
+    for article in _soup(html).select("ul.article_list > li.article_item"):
+        link_element = article.find("a")
+        title_element = article.select_one("p.title")
+        if link_element is None or title_element is None or not link_element.get("href"):
+            continue
+
+        items.append({
+            'title': _text(title_element),
+            'url': urljoin(base_url, link_element["href"]),
+            'date': _text(article.select_one("span.date")),
+            'category': _text(article.select_one("span.category")),
+            'description': _text(article.select_one("p.desc"))
+        })
+    return items
+
+def parse_samsung_article(html: str) -> str:
+    """
+    삼성반도체 뉴스룸 기사 페이지에서 본문을 추출합니다.
+
+    Args:
+        html (str): 기사 페이지 HTML
+
+    Returns:
+        str: 본문 (추출 실패 시 빈 문자열)
+    """
+    content_container = _soup(html).select_one("div.content_view > div.content_desc")
+    if content_container is None:
+        return ""
+
+    content_texts = [_text(p) for p in content_container.find_all("p")]
+    return '\n'.join(text for text in content_texts if text)
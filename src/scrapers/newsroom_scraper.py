@@ -1,116 +1,391 @@
+from abc import abstractmethod
 from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import quote
 import time
 import logging
+import requests
 from datetime import datetime
 from .base import BaseScraper
+from .driver_pool import DriverPool, get_driver_pool
+from .http_client import DEFAULT_TIMEOUT, get_http_session
+from .fetch_queue import ArticleFetchQueue, HostThrottle
+from .relevance_filter import RelevanceFilter, build_relevance_filter, parse_article_date
+from ..utils.crawl_state import CrawlStateStore, get_crawl_state_store
+from .newsroom_parser import (
+    parse_skhynix_list, parse_skhynix_article,
+    parse_samsung_list, parse_samsung_article
+)
 
 class NewsroomScraper(BaseScraper):
     """뉴스룸 스크래퍼 기본 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool: Optional[DriverPool] = None,
+        engine: str = "http",
+        max_workers: int = 8,
+        max_per_host: int = 4,
+        politeness_delay: float = 0.2,
+        crawl_state: Optional[CrawlStateStore] = None,
+        incremental: bool = False,
+        relevance_filter: Optional[RelevanceFilter] = None
+    ):
+        """
+        Args:
+            pool (Optional[DriverPool]): 웹드라이버를 대여할 풀 (기본값: 공용 풀)
+            engine (str): 페이지 수집 방식 ('http': 정적 HTML 우선, 실패 시 Selenium / 'selenium': Selenium만 사용)
+            max_workers (int): 기사 본문 동시 수집 작업 수
+            max_per_host (int): 호스트당 최대 동시 요청 수
+            politeness_delay (float): 같은 호스트에 대한 요청 간 최소 간격(초)
+            crawl_state (Optional[CrawlStateStore]): 수집 상태 저장소 (기본값: 공용 저장소)
+            incremental (bool): 이전 전체 크롤링 범위에 포함된 기사를 만나면 다음 페이지를 탐색하지 않음
+            relevance_filter (Optional[RelevanceFilter]): 본문 수집 전 적용할 필터 (기본값: 키워드/기간 필터)
+        """
+        if engine not in ("http", "selenium"):
+            raise ValueError(f"지원하지 않는 수집 방식입니다: {engine}")
+        
+        self.pool = pool or get_driver_pool()
+        self.engine = engine
+        self.session = get_http_session()
+        self.max_workers = max_workers
+        self.throttle = HostThrottle(max_per_host, politeness_delay)
+        self.crawl_state = crawl_state or get_crawl_state_store()
+        self.incremental = incremental
+        self.relevance_filter = relevance_filter
+        self.lease = None
         self.driver = None
         self.wait = None
         self.articles = []
-        self._setup_driver()
+        self.seen_urls = set()
+        self.skipped = False  # 필터링/오류로 저장하지 않은 기사가 있는지 여부
+        
+        if self.engine == "selenium":
+            self._setup_driver()
     
     def _setup_driver(self):
-        """웹드라이버 설정"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        """풀에서 웹드라이버 대여"""
+        self.lease = self.pool.acquire()
+        self.driver = self.lease.driver
+        self.wait = self.lease.wait
+    
+    def _ensure_driver(self):
+        """Selenium 경로가 필요할 때만 웹드라이버를 대여"""
+        if self.lease is None:
+            self._setup_driver()
+    
+    def _load_page(self, url: str):
+        """대여한 드라이버로 페이지 로드"""
+        self._ensure_driver()
+        self.lease.get(url)
+    
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        정적 HTML을 가져옵니다.
+        
+        Returns:
+            Optional[str]: HTML (404이면 빈 문자열, 요청 실패 시 None)
+        """
+        try:
+            with self.throttle.slot(url):
+                response = self.session.get(url, timeout=DEFAULT_TIMEOUT)
+        except requests.RequestException as e:
+            logging.warning(f"HTTP 요청 중 오류: {url} ({str(e)})")
+            return None
+        
+        if response.status_code == 404:
+            return ""
+        if not response.ok:
+            logging.warning(f"HTTP 응답 오류: {url} ({response.status_code})")
+            return None
+        return response.text
+    
+    def _fetch_list(self, url: str) -> List[Dict]:
+        """목록 페이지의 기사 메타데이터 수집 (정적 파싱 결과가 없으면 Selenium 사용)"""
+        if self.engine == "http":
+            html = self._fetch_html(url)
+            if html == "":
+                return []
+            if html:
+                items = self._parse_list(html)
+                if items:
+                    return items
+            logging.info(f"정적 파싱 결과가 없어 Selenium으로 재시도: {url}")
+        
+        return self._collect_list_with_driver(url)
+    
+    def _get_article_content(self, url: str) -> str:
+        """기사 내용 추출 (정적 파싱 결과가 없으면 Selenium 사용)"""
+        if self.engine == "http":
+            content = self._get_article_content_static(url)
+            if content:
+                return content
+        
+        return self._get_article_content_with_driver(url)
+    
+    def _get_article_content_static(self, url: str) -> str:
+        """정적 HTML에서 기사 내용 추출 (실패 시 빈 문자열)"""
+        html = self._fetch_html(url)
+        return self._parse_article(html) if html else ""
+    
+    def _create_fetch_queue(self) -> ArticleFetchQueue:
+        """
+        기사 본문 수집 큐를 생성합니다.
+        Selenium은 드라이버 하나를 공유하므로 호출 스레드에서 순차적으로 수집합니다.
+        """
+        if self.engine == "http":
+            return ArticleFetchQueue(self._get_article_content_static, self.max_workers)
+        return ArticleFetchQueue(self._get_article_content_with_driver, max_workers=0)
+    
+    def _get_relevance_filter(self, keyword: str, date_range: Optional[str]) -> RelevanceFilter:
+        """본문 수집 전 적용할 필터 (지정된 필터가 없으면 검색 조건으로 구성)"""
+        if self.relevance_filter is not None:
+            return self.relevance_filter
+        return build_relevance_filter(keyword, date_range)
+    
+    def _is_duplicate(self, item: Dict) -> bool:
+        """
+        이번 크롤링에서 이미 본 기사인지 확인합니다.
+        탐색 중 새 기사가 올라와 목록이 밀리면 같은 기사가 다음 페이지에 다시 나옵니다.
+        """
+        if item['url'] in self.seen_urls:
+            return True
+        self.seen_urls.add(item['url'])
+        return False
+    
+    def _enqueue_article(self, queue: ArticleFetchQueue, item: Dict) -> bool:
+        """
+        기사를 본문 수집 큐에 추가합니다. 이미 수집한 기사는 저장된 본문을 사용합니다.
+        
+        Returns:
+            bool: 이전 전체 크롤링 범위에 포함된 기사인지 여부 (True이면 이보다 오래된 기사는 모두 저장되어 있음)
+        """
+        known = self.crawl_state.get_article(self.source, item['url'])
+        item['cached'] = known is not None
+        queue.submit(item, content=known['content'] if known else None)
+        return item['cached'] and self._is_covered(item)
+    
+    def _is_covered(self, item: Dict) -> bool:
+        """
+        이전 전체 크롤링에서 이 기사 이하 날짜의 기사를 모두 저장했는지 확인합니다.
+        키워드/기간/개수 조건으로 일부만 수집한 크롤링은 범위로 기록되지 않으므로 다음 페이지를 계속 탐색합니다.
+        """
+        state = self.crawl_state.get_crawl_state(self.source)
+        covered_until = parse_article_date(state['full_crawl_date']) if state and state['full_crawl_date'] else None
+        date = parse_article_date(item.get('date', ''))
+        return covered_until is not None and date is not None and date <= covered_until
+    
+    def _save_crawl_state(self, reached_end: bool = False):
+        """
+        새로 수집한 기사와 크롤링 시각을 저장소에 기록
+        
+        Args:
+            reached_end (bool): 목록 끝 또는 이전 전체 크롤링 범위까지 탐색했는지 여부
+        """
+        fresh_articles = [
+            article for article in self.articles
+            if not article['cached'] and article['content'] != "내용 추출 실패"
+        ]
+        if fresh_articles:
+            self.crawl_state.save_articles(self.source, fresh_articles)
         
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
+        # 건너뛴 기사 없이 끝까지 저장한 경우에만 전체 수집 범위로 기록
+        failed = any(article['content'] == "내용 추출 실패" for article in self.articles)
+        dates = [article['date'] for article in self.articles if article['date']]
+        self.crawl_state.record_crawl(
+            self.source,
+            max(dates) if dates else None,
+            full=reached_end and not self.skipped and not failed
         )
-        self.wait = WebDriverWait(self.driver, 20)
+    
+    def _drain_fetch_queue(self, queue: ArticleFetchQueue):
+        """
+        수집이 끝난 기사를 순서대로 반환합니다. 정적 추출에 실패한 기사는 Selenium으로 재시도합니다.
+        
+        Yields:
+            Tuple[Dict, str]: (기사 메타데이터, 본문)
+        """
+        for item, future in queue.drain():
+            if future.exception() is not None:
+                logging.error(f"기사 처리 중 오류: {str(future.exception())}")
+                self.skipped = True
+                continue
+            
+            content = future.result()
+            if not content:
+                logging.info(f"정적 본문 추출 실패로 Selenium으로 재시도: {item['url']}")
+                content = self._get_article_content_with_driver(item['url'])
+            yield item, content
+    
+    @abstractmethod
+    def _parse_list(self, html: str) -> List[Dict]:
+        """정적 HTML 목록 페이지에서 기사 메타데이터를 추출합니다."""
+        pass
+    
+    @abstractmethod
+    def _parse_article(self, html: str) -> str:
+        """정적 HTML 기사 페이지에서 본문을 추출합니다."""
+        pass
+    
+    @abstractmethod
+    def _collect_list_with_driver(self, url: str) -> List[Dict]:
+        """Selenium으로 목록 페이지의 기사 메타데이터를 수집합니다."""
+        pass
+    
+    @abstractmethod
+    def _get_article_content_with_driver(self, url: str) -> str:
+        """Selenium으로 기사 본문을 추출합니다."""
+        pass
     
     def cleanup(self):
-        """리소스 정리"""
-        if self.driver:
-            self.driver.quit()
+        """리소스 정리 (웹드라이버를 풀에 반납)"""
+        if self.lease:
+            self.pool.release(self.lease)
+            self.lease = None
             self.driver = None
+            self.wait = None
 
 class SKHynixNewsScraper(NewsroomScraper):
     """SK하이닉스 뉴스룸 스크래퍼"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, pool: Optional[DriverPool] = None, engine: str = "http", use_site_search: bool = False, **kwargs):
+        """
+        Args:
+            use_site_search (bool): 전체 목록 대신 뉴스룸 자체 검색 결과를 탐색
+        """
+        super().__init__(pool, engine, **kwargs)
+        self.source = 'sk_hynix'
         self.base_url = "https://news.skhynix.co.kr"
+        self.use_site_search = use_site_search
+    
+    def _get_relevance_filter(self, keyword: str, date_range: Optional[str]) -> RelevanceFilter:
+        """뉴스룸 자체 검색은 본문까지 검색하므로 키워드 조건 없이 기간 필터만 적용"""
+        if self.use_site_search and keyword and self.relevance_filter is None:
+            return build_relevance_filter("", date_range)
+        return super()._get_relevance_filter(keyword, date_range)
     
     def search(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> List[Dict]:
         try:
             current_page = 1
             encoded_keyword = quote(keyword)
+            relevance_filter = self._get_relevance_filter(keyword, date_range)
+            reached_end = False
             
-            while len(self.articles) < num_results:
-                if current_page == 1:
-                    url = f"{self.base_url}/all/"
-                else:
-                    url = f"{self.base_url}/all/page/{current_page}/"
-                
-                self.driver.get(url)
-                time.sleep(3)
-                
-                articles = self.driver.find_elements(By.TAG_NAME, "article")
-                if not articles:
-                    break
-                
-                for article in articles:
-                    if len(self.articles) >= num_results:
+            with self._create_fetch_queue() as queue:
+                while len(self.articles) + len(queue) < num_results:
+                    if self.use_site_search and keyword:
+                        if current_page == 1:
+                            url = f"{self.base_url}/?s={encoded_keyword}&type=newsroom"
+                        else:
+                            url = f"{self.base_url}/page/{current_page}/?s={encoded_keyword}&type=newsroom"
+                    elif current_page == 1:
+                        url = f"{self.base_url}/all/"
+                    else:
+                        url = f"{self.base_url}/all/page/{current_page}/"
+                    
+                    items = self._fetch_list(url)
+                    if not items:
+                        reached_end = True
                         break
                     
-                    try:
-                        title_element = article.find_element(By.CSS_SELECTOR, "h2.tit a")
-                        title = title_element.text.strip()
-                        url = title_element.get_attribute("href")
+                    reached_covered = False
+                    exhausted = False
+                    for item in items:
+                        if len(self.articles) + len(queue) >= num_results:
+                            break
                         
-                        # 기사 내용 가져오기
-                        content = self._get_article_content(url)
+                        # 검색 기간을 벗어난 기사부터는 더 볼 필요 없음 (최신순 목록)
+                        if relevance_filter.is_exhausted(item):
+                            exhausted = True
+                            break
                         
-                        # 날짜 정보 가져오기
-                        try:
-                            date_element = article.find_element(By.CSS_SELECTOR, "span.date")
-                            date = date_element.text.strip()
-                        except:
-                            date = ""
+                        # 앞 페이지에서 본 기사는 건너뜀
+                        if self._is_duplicate(item):
+                            continue
                         
-                        self.articles.append({
-                            'title': title,
-                            'url': url,
-                            'content': content,
-                            'date': date,
-                            'source': 'sk_hynix'
-                        })
+                        # 관련 없는 기사는 본문을 수집하지 않음
+                        if not relevance_filter.accepts(item):
+                            self.skipped = True
+                            continue
                         
-                    except Exception as e:
-                        logging.error(f"기사 처리 중 오류: {str(e)}")
-                        continue
+                        # 기사 본문은 목록 크롤링과 병렬로 수집 (이미 수집한 기사는 저장된 본문 사용)
+                        reached_covered |= self._enqueue_article(queue, item)
+                    
+                    # 증분 수집: 이전 전체 크롤링 범위 이후 기사는 모두 저장되어 있음
+                    if self.incremental and reached_covered:
+                        reached_end = True
+                        break
+                    if exhausted:
+                        break
+                    
+                    current_page += 1
                 
-                current_page += 1
+                for item, content in self._drain_fetch_queue(queue):
+                    self.articles.append({
+                        'title': item['title'],
+                        'url': item['url'],
+                        'content': content,
+                        'date': item['date'],
+                        'category': item.get('category', ''),
+                        'tags': item.get('tags', []),
+                        'source': 'sk_hynix',
+                        'cached': item['cached']
+                    })
             
+            # 자체 검색 결과는 전체 목록이 아니므로 전체 수집 범위로 기록하지 않음
+            self._save_crawl_state(reached_end and not self.use_site_search)
             return self.articles
             
         except Exception as e:
             logging.error(f"검색 중 오류: {str(e)}")
             return []
     
-    def _get_article_content(self, url: str) -> str:
-        """기사 내용 추출"""
+    def _parse_list(self, html: str) -> List[Dict]:
+        return parse_skhynix_list(html, self.base_url)
+    
+    def _parse_article(self, html: str) -> str:
+        return parse_skhynix_article(html)
+    
+    def _collect_list_with_driver(self, url: str) -> List[Dict]:
+        """Selenium으로 목록 페이지의 기사 메타데이터 수집"""
+        self._load_page(url)
+        time.sleep(3)
+        
+        items = []
+        for article in self.driver.find_elements(By.TAG_NAME, "article"):
+            try:
+                title_element = article.find_element(By.CSS_SELECTOR, "h2.tit a")
+                
+                # 날짜 정보 가져오기
+                try:
+                    date = article.find_element(By.CSS_SELECTOR, "span.date").text.strip()
+                except:
+                    date = ""
+                
+                category_elements = article.find_elements(By.CSS_SELECTOR, "div.category a")
+                tag_elements = article.find_elements(By.CSS_SELECTOR, "ul.tags li a")
+                
+                items.append({
+                    'title': title_element.text.strip(),
+                    'url': title_element.get_attribute("href"),
+                    'date': date,
+                    'category': ' '.join(element.text.strip() for element in category_elements),
+                    'tags': [element.text.strip() for element in tag_elements]
+                })
+            except Exception as e:
+                logging.error(f"기사 처리 중 오류: {str(e)}")
+                continue
+        
+        return items
+    
+    def _get_article_content_with_driver(self, url: str) -> str:
+        """Selenium으로 기사 내용 추출"""
         try:
+            self._ensure_driver()
             main_window = self.driver.current_window_handle
             self.driver.execute_script(f"window.open('{url}', '_blank');")
+            self.lease.record_page()
             time.sleep(2)
             
             new_window = [handle for handle in self.driver.window_handles if handle != main_window][0]
@@ -146,8 +421,10 @@ class SKHynixNewsScraper(NewsroomScraper):
 class SamsungSemiconNewsScraper(NewsroomScraper):
     """삼성반도체 뉴스룸 스크래퍼"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, pool: Optional[DriverPool] = None, engine: str = "http", **kwargs):
+        super().__init__(pool, engine, **kwargs)
+        self.source = 'samsung_semiconductor'
+        self.base_url = "https://news.samsungsemiconductor.com"
         self.categories = [
             {
                 "name": "프레스센터",
@@ -165,92 +442,145 @@ class SamsungSemiconNewsScraper(NewsroomScraper):
     
     def search(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> List[Dict]:
         try:
-            for category in self.categories:
-                if len(self.articles) >= num_results:
-                    break
+            relevance_filter = self._get_relevance_filter(keyword, date_range)
+            reached_end = True
+            
+            with self._create_fetch_queue() as queue:
+                for category in self.categories:
+                    if len(self.articles) + len(queue) >= num_results:
+                        reached_end = False
+                        break
+                    
+                    reached_end &= self._collect_articles_from_category(
+                        category["name"],
+                        category["url"],
+                        relevance_filter,
+                        num_results - len(self.articles) - len(queue),
+                        queue
+                    )
                 
-                self._collect_articles_from_category(
-                    category["name"],
-                    category["url"],
-                    keyword,
-                    num_results - len(self.articles)
-                )
+                for item, content in self._drain_fetch_queue(queue):
+                    self.articles.append({
+                        'title': item['title'],
+                        'url': item['url'],
+                        'content': content,
+                        'date': item['date'],
+                        'category': item['category'],
+                        'description': item['description'],
+                        'source': 'samsung_semiconductor',
+                        'cached': item['cached']
+                    })
             
+            self._save_crawl_state(reached_end)
             return self.articles
             
         except Exception as e:
             logging.error(f"검색 중 오류: {str(e)}")
             return []
     
-    def _collect_articles_from_category(self, category_name: str, category_url: str, keyword: str, remaining_count: int):
-        """카테고리별 기사 수집"""
+    def _collect_articles_from_category(self, category_name: str, category_url: str, relevance_filter: RelevanceFilter, remaining_count: int, queue: ArticleFetchQueue) -> bool:
+        """
+        카테고리별 기사 수집 (본문 수집 작업을 큐에 추가)
+        
+        Returns:
+            bool: 카테고리 목록 끝 또는 이전 전체 크롤링 범위까지 탐색했는지 여부
+        """
         current_page = 1
+        collected = 0
         
-        while len(self.articles) < remaining_count:
+        while collected < remaining_count:
             if current_page == 1:
                 page_url = category_url
             else:
                 page_url = f"{category_url}page/{current_page}/"
             
-            self.driver.get(page_url)
-            time.sleep(2)
-            
             try:
-                articles = self.driver.find_elements(By.CSS_SELECTOR, "ul.article_list > li.article_item")
-                if not articles:
-                    break
+                items = self._fetch_list(page_url)
+                if not items:
+                    return True
                 
-                for article in articles:
-                    if len(self.articles) >= remaining_count:
+                reached_covered = False
+                exhausted = False
+                for item in items:
+                    if collected >= remaining_count:
                         break
                     
-                    try:
-                        title = article.find_element(By.CSS_SELECTOR, "p.title").text.strip()
-                        
-                        # 키워드 필터링
-                        if keyword.lower() not in title.lower():
-                            continue
-                        
-                        link_element = article.find_element(By.TAG_NAME, "a")
-                        url = link_element.get_attribute("href")
-                        date = article.find_element(By.CSS_SELECTOR, "span.date").text.strip()
-                        
-                        try:
-                            category = article.find_element(By.CSS_SELECTOR, "span.category").text.strip()
-                        except:
-                            category = ""
-                        
-                        try:
-                            desc = article.find_element(By.CSS_SELECTOR, "p.desc").text.strip()
-                        except:
-                            desc = ""
-                        
-                        content = self._get_article_content(url)
-                        
-                        self.articles.append({
-                            'title': title,
-                            'url': url,
-                            'content': content,
-                            'date': date,
-                            'category': category,
-                            'description': desc,
-                            'source': 'samsung_semiconductor'
-                        })
-                        
-                    except Exception as e:
-                        logging.error(f"기사 처리 중 오류: {str(e)}")
+                    # 검색 기간을 벗어난 기사부터는 더 볼 필요 없음 (최신순 목록)
+                    if relevance_filter.is_exhausted(item):
+                        exhausted = True
+                        break
+                    
+                    # 앞 페이지나 다른 카테고리에서 본 기사는 건너뜀
+                    if self._is_duplicate(item):
+                        continue
+                    
+                    # 키워드/기간 필터링
+                    if not relevance_filter.accepts(item):
+                        self.skipped = True
                         continue
+                    
+                    reached_covered |= self._enqueue_article(queue, item)
+                    collected += 1
+                
+                # 증분 수집: 이전 전체 크롤링 범위 이후 기사는 모두 저장되어 있음
+                if self.incremental and reached_covered:
+                    return True
+                if exhausted:
+                    break
                 
                 current_page += 1
                 
             except Exception as e:
                 logging.error(f"페이지 처리 중 오류: {str(e)}")
                 break
+        
+        return False
     
-    def _get_article_content(self, url: str) -> str:
-        """기사 내용 추출"""
+    def _parse_list(self, html: str) -> List[Dict]:
+        return parse_samsung_list(html, self.base_url)
+    
+    def _parse_article(self, html: str) -> str:
+        return parse_samsung_article(html)
+    
+    def _collect_list_with_driver(self, url: str) -> List[Dict]:
+        """Selenium으로 카테고리 페이지의 기사 메타데이터 수집"""
+        self._load_page(url)
+        time.sleep(2)
+        
+        items = []
+        for article in self.driver.find_elements(By.CSS_SELECTOR, "ul.article_list > li.article_item"):
+            try:
+                title = article.find_element(By.CSS_SELECTOR, "p.title").text.strip()
+                link_element = article.find_element(By.TAG_NAME, "a")
+                date = article.find_element(By.CSS_SELECTOR, "span.date").text.strip()
+                
+                try:
+                    category = article.find_element(By.CSS_SELECTOR, "span.category").text.strip()
+                except:
+                    category = ""
+                
+                try:
+                    desc = article.find_element(By.CSS_SELECTOR, "p.desc").text.strip()
+                except:
+                    desc = ""
+                
+                items.append({
+                    'title': title,
+                    'url': link_element.get_attribute("href"),
+                    'date': date,
+                    'category': category,
+                    'description': desc
+                })
+            except Exception as e:
+                logging.error(f"기사 처리 중 오류: {str(e)}")
+                continue
+        
+        return items
+    
+    def _get_article_content_with_driver(self, url: str) -> str:
+        """Selenium으로 기사 내용 추출"""
         try:
-            self.driver.get(url)
+            self._load_page(url)
             time.sleep(2)
             
             content_container = self.wait.until(
@@ -264,4 +594,4 @@ class SamsungSemiconNewsScraper(NewsroomScraper):
             
         except Exception as e:
             logging.error(f"본문 추출 중 오류: {str(e)}")
-            return "내용 추출 실패" 
\ No newline at end of file
+            return "내용 추출 실패"
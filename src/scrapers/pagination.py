@@ -0,0 +1,61 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
+
+def build_pages(num_results: int, page_size: int, max_results: int) -> List[Tuple[int, int]]:
+    """
+    요청 결과 수를 (시작 위치, 개수) 페이지 목록으로 나눕니다. 시작 위치는 1부터 셉니다.
+
+    Args:
+        num_results (int): 요청한 결과 수
+        page_size (int): API 한 번에 받을 수 있는 최대 결과 수
+        max_results (int): API가 허용하는 최대 결과 수
+
+    Returns:
+        List[Tuple[int, int]]: (start, count) 리스트
+    """
+    num_results = max(0, min(num_results, max_results))
+    return [
+        (start, min(page_size, num_results - start + 1))
+        for start in range(1, num_results + 1, page_size)
+    ]
+
+def iter_pages(
+    fetch_page: Callable[[int, int], List],
+    pages: List[Tuple[int, int]],
+    max_concurrency: int = 4
+) -> Iterator[List]:
+    """
+    여러 페이지를 동시에 요청하고 페이지 순서대로 결과를 반환합니다.
+    결과가 요청보다 적은 페이지가 나오면 마지막 페이지로 보고 나머지 요청을 취소합니다.
+
+    Args:
+        fetch_page (Callable[[int, int], List]): (start, count)를 받아 결과 리스트를 반환하는 함수
+        pages (List[Tuple[int, int]]): 요청할 페이지 목록
+        max_concurrency (int): 동시에 진행할 최대 요청 수
+
+    Yields:
+        List: 페이지별 결과
+    """
+    if not pages:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(pages)))
+    try:
+        pending = deque()
+        next_page = 0
+
+        while pending or next_page < len(pages):
+            while next_page < len(pages) and len(pending) < max_concurrency:
+                start, count = pages[next_page]
+                pending.append((count, executor.submit(fetch_page, start, count)))
+                next_page += 1
+
+            count, future = pending.popleft()
+            items = future.result()
+            yield items
+
+            if len(items) < count:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+DATE_FORMATS = ["%Y.%m.%d", "%Y/%m/%d", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]
+
+DATE_RANGE_UNITS = {
+    'd': 1,
+    'w': 7,
+    'm': 30,
+    'y': 365
+}
+
+def parse_article_date(date_str: str) -> Optional[datetime]:
+    """목록 페이지의 날짜 문자열을 datetime으로 변환합니다. (실패 시 None)"""
+    date_str = (date_str or "").strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+def date_range_cutoff(date_range: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    검색 기간 문자열을 기준 시각으로 변환합니다.
+
+    Args:
+        date_range (Optional[str]): 검색 기간 (예: 'd1', 'w1', 'm1', 'y1')
+        now (Optional[datetime]): 기준 현재 시각
+
+    Returns:
+        Optional[datetime]: 이 시각 이전 기사는 제외 (기간이 없거나 형식이 잘못되면 None)
+    """
+    if not date_range or date_range[0] not in DATE_RANGE_UNITS or not date_range[1:].isdigit():
+        return None
+    now = now or datetime.now()
+    days = DATE_RANGE_UNITS[date_range[0]] * int(date_range[1:])
+    return (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+class RelevanceFilter(ABC):
+    """본문 수집 전에 목록 페이지 메타데이터로 기사를 거르는 필터"""
+
+    @abstractmethod
+    def accepts(self, item: Dict) -> bool:
+        """기사 본문을 수집할지 여부를 반환합니다."""
+        pass
+
+    def is_exhausted(self, item: Dict) -> bool:
+        """
+        최신순 목록에서 이 기사 이후로는 조건을 만족하는 기사가 없는지 여부를 반환합니다.
+        True이면 다음 페이지를 탐색하지 않습니다.
+        """
+        return False
+
+class KeywordFilter(RelevanceFilter):
+    """제목/요약/카테고리/태그에 키워드가 포함된 기사만 통과"""
+
+    def __init__(self, keyword: str, fields: Iterable[str] = ('title', 'description', 'category', 'tags')):
+        """
+        Args:
+            keyword (str): 검색 키워드 (공백으로 구분된 단어가 모두 포함되어야 통과)
+            fields (Iterable[str]): 검사할 메타데이터 필드
+        """
+        self.terms = [term.lower() for term in keyword.split()]
+        self.fields = list(fields)
+
+    def accepts(self, item: Dict) -> bool:
+        if not self.terms:
+            return True
+
+        values = []
+        for field in self.fields:
+            value = item.get(field)
+            if isinstance(value, (list, tuple)):
+                values.extend(value)
+            elif value:
+                values.append(value)
+        text = ' '.join(values).lower()
+
+        return all(term in text for term in self.terms)
+
+class TagFilter(RelevanceFilter):
+    """지정한 태그 중 하나라도 달린 기사만 통과"""
+
+    def __init__(self, tags: Iterable[str]):
+        self.tags = {tag.lstrip('#').lower() for tag in tags}
+
+    def accepts(self, item: Dict) -> bool:
+        item_tags = {tag.lstrip('#').lower() for tag in item.get('tags', [])}
+        return bool(self.tags & item_tags)
+
+class DateRangeFilter(RelevanceFilter):
+    """기준 시각 이후 기사만 통과 (날짜를 알 수 없는 기사는 통과)"""
+
+    def __init__(self, cutoff: datetime):
+        self.cutoff = cutoff
+
+    def accepts(self, item: Dict) -> bool:
+        date = parse_article_date(item.get('date', ''))
+        return date is None or date >= self.cutoff
+
+    def is_exhausted(self, item: Dict) -> bool:
+        date = parse_article_date(item.get('date', ''))
+        return date is not None and date < self.cutoff
+
+class CompositeFilter(RelevanceFilter):
+    """모든 필터를 통과한 기사만 통과"""
+
+    def __init__(self, filters: List[RelevanceFilter]):
+        self.filters = filters
+
+    def accepts(self, item: Dict) -> bool:
+        return all(f.accepts(item) for f in self.filters)
+
+    def is_exhausted(self, item: Dict) -> bool:
+        return any(f.is_exhausted(item) for f in self.filters)
+
+def build_relevance_filter(
+    keyword: str,
+    date_range: Optional[str] = None,
+    tags: Optional[Iterable[str]] = None,
+    fields: Iterable[str] = ('title', 'description', 'category', 'tags')
+) -> RelevanceFilter:
+    """
+    검색 조건으로 기본 필터를 구성합니다.
+
+    Args:
+        keyword (str): 검색 키워드
+        date_range (Optional[str]): 검색 기간 (예: 'd1', 'w1', 'm1', 'y1')
+        tags (Optional[Iterable[str]]): 필수 태그 목록
+        fields (Iterable[str]): 키워드를 검사할 메타데이터 필드
+
+    Returns:
+        RelevanceFilter: 구성된 필터
+    """
+    filters: List[RelevanceFilter] = [KeywordFilter(keyword, fields)]
+    if tags:
+        filters.append(TagFilter(tags))
+
+    cutoff = date_range_cutoff(date_range)
+    if cutoff is not None:
+        filters.append(DateRangeFilter(cutoff))
+
+    return CompositeFilter(filters)
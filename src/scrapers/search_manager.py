@@ -1,6 +1,12 @@
+import os
+import threading
 from typing import List, Dict, Optional
+from functools import partial
 from .google_search import GoogleSearchScraper
 from .naver_search import NaverSearchScraper
+from .source_orchestrator import SourceOrchestrator, SourceResult
+from .dedup import ResultDeduplicator
+from ..utils.search_cache import get_search_cache
 
 class SearchManager:
     """검색 API들을 관리하는 클래스"""
@@ -13,8 +19,28 @@ class SearchManager:
             naver_client_id (str): Naver API Client ID
             naver_client_secret (str): Naver API Client Secret
         """
-        self.google_scraper = GoogleSearchScraper(google_api_key, google_cx)
-        self.naver_scraper = NaverSearchScraper(naver_client_id, naver_client_secret)
+        # 같은 검색 조건은 사용자 간에 캐시된 결과를 공유
+        cache = get_search_cache()
+        self.google_scraper = GoogleSearchScraper(google_api_key, google_cx, cache=cache)
+        self.naver_scraper = NaverSearchScraper(naver_client_id, naver_client_secret, cache=cache)
+        self.orchestrator = SourceOrchestrator()
+    
+    def search_sources(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> Dict[str, SourceResult]:
+        """
+        모든 검색 API를 동시에 호출하고 출처별 결과와 소요 시간을 반환합니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            num_results (int): 각 API에서 반환할 결과 수
+            date_range (Optional[str]): 검색 기간
+            
+        Returns:
+            Dict[str, SourceResult]: 출처별 검색 결과 (시간 초과/오류 출처는 빈 결과)
+        """
+        return self.orchestrator.run_sync({
+            'google': partial(self.google_scraper.search, keyword, num_results, date_range),
+            'naver': partial(self.naver_scraper.search, keyword, num_results, date_range)
+        })
     
     def search_all(self, keyword: str, num_results: int = 10, date_range: Optional[str] = None) -> List[Dict]:
         """
@@ -26,19 +52,36 @@ class SearchManager:
             date_range (Optional[str]): 검색 기간
             
         Returns:
-            List[Dict]: 통합된 검색 결과 리스트
+            List[Dict]: 중복이 병합된 통합 검색 결과 리스트 (sources, links 필드 포함)
         """
-        results = []
+        deduplicator = ResultDeduplicator()
         
-        # 구글 검색
-        google_results = self.google_scraper.search(keyword, num_results, date_range)
-        results.extend(google_results)
-        
-        # 네이버 검색
-        naver_results = self.naver_scraper.search(keyword, num_results, date_range)
-        results.extend(naver_results)
+        # 구글/네이버 동시 검색 후 같은 기사는 하나로 병합
+        for source_result in self.search_sources(keyword, num_results, date_range).values():
+            deduplicator.extend(source_result.results)
+        results = deduplicator.results()
         
         # 날짜순으로 정렬
         results.sort(key=lambda x: x.get('date', ''), reverse=True)
         
         return results
+
+_manager: Optional[SearchManager] = None
+_manager_lock = threading.Lock()
+
+def get_search_manager() -> SearchManager:
+    """환경 변수(.env)의 API 키로 생성한 프로세스 공용 SearchManager를 반환합니다."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                from dotenv import load_dotenv
+                load_dotenv()
+                
+                _manager = SearchManager(
+                    google_api_key=os.getenv('GOOGLE_API_KEY'),
+                    google_cx=os.getenv('GOOGLE_CX'),
+                    naver_client_id=os.getenv('NAVER_CLIENT_ID'),
+                    naver_client_secret=os.getenv('NAVER_CLIENT_SECRET')
+                )
+    return _manager
@@ -0,0 +1,139 @@
+import time
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# 출처별 기본 제한 시간(초)
+DEFAULT_SOURCE_TIMEOUTS = {
+    'google': 15.0,
+    'naver': 15.0,
+    'sk_hynix': 120.0,
+    'samsung_semiconductor': 120.0
+}
+
+@dataclass
+class SourceResult:
+    """출처별 검색 결과와 소요 시간"""
+    source: str
+    results: List[Any] = field(default_factory=list)
+    status: str = "ok"  # ok, timeout, error
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """응답에 포함할 출처별 요약 정보"""
+        return {
+            'status': self.status,
+            'elapsed_ms': round(self.elapsed * 1000, 1),
+            'count': len(self.results),
+            'error': self.error
+        }
+
+class SourceOrchestrator:
+    """여러 검색 출처를 동시에 실행하고 출처별 제한 시간을 적용합니다."""
+
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, float]] = None,
+        default_timeout: float = 30.0,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """
+        Args:
+            timeouts (Optional[Dict[str, float]]): 출처별 제한 시간(초)
+            default_timeout (float): 제한 시간이 지정되지 않은 출처에 적용할 값(초)
+            executor (Optional[ThreadPoolExecutor]): 블로킹 스크래퍼를 실행할 스레드 풀
+        """
+        self.timeouts = dict(DEFAULT_SOURCE_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.default_timeout = default_timeout
+        self.executor = executor or get_source_executor()
+
+    def _timeout_for(self, source: str) -> float:
+        return self.timeouts.get(source, self.default_timeout)
+
+    async def run(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, SourceResult]:
+        """
+        출처별 작업을 동시에 실행합니다. 코루틴 함수는 이벤트 루프에서,
+        일반 함수는 스레드 풀에서 실행됩니다.
+
+        Args:
+            tasks (Dict[str, Callable[[], Any]]): 출처 이름 -> 결과 리스트를 반환하는 함수
+
+        Returns:
+            Dict[str, SourceResult]: 출처별 결과 (tasks 순서 유지, 실패/시간 초과 시 빈 결과)
+        """
+        loop = asyncio.get_running_loop()
+
+        async def run_one(source: str, task: Callable[[], Any]) -> SourceResult:
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(task):
+                    awaitable = task()
+                else:
+                    awaitable = loop.run_in_executor(self.executor, task)
+                results = await asyncio.wait_for(awaitable, self._timeout_for(source))
+                return SourceResult(source, list(results or []), "ok", time.perf_counter() - started)
+            except asyncio.TimeoutError:
+                logging.warning(f"{source} 검색 시간 초과 ({self._timeout_for(source)}초)")
+                return SourceResult(source, [], "timeout", time.perf_counter() - started,
+                                    f"{self._timeout_for(source)}초 내에 응답하지 않았습니다.")
+            except Exception as e:
+                logging.error(f"{source} 검색 중 오류: {str(e)}")
+                return SourceResult(source, [], "error", time.perf_counter() - started, str(e))
+
+        outcomes = await asyncio.gather(*(run_one(source, task) for source, task in tasks.items()))
+        return {outcome.source: outcome for outcome in outcomes}
+
+    def run_sync(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, SourceResult]:
+        """
+        이벤트 루프 밖에서 출처별 블로킹 작업을 동시에 실행합니다.
+
+        Args:
+            tasks (Dict[str, Callable[[], Any]]): 출처 이름 -> 결과 리스트를 반환하는 함수
+
+        Returns:
+            Dict[str, SourceResult]: 출처별 결과 (tasks 순서 유지, 실패/시간 초과 시 빈 결과)
+        """
+        started = time.perf_counter()
+        futures = {source: self.executor.submit(self._timed, task) for source, task in tasks.items()}
+
+        outcomes = {}
+        for source, future in futures.items():
+            remaining = self._timeout_for(source) - (time.perf_counter() - started)
+            done, _ = wait([future], timeout=max(remaining, 0))
+            if not done:
+                logging.warning(f"{source} 검색 시간 초과 ({self._timeout_for(source)}초)")
+                outcomes[source] = SourceResult(source, [], "timeout", time.perf_counter() - started,
+                                                f"{self._timeout_for(source)}초 내에 응답하지 않았습니다.")
+                continue
+
+            try:
+                results, elapsed = future.result()
+                outcomes[source] = SourceResult(source, list(results or []), "ok", elapsed)
+            except Exception as e:
+                logging.error(f"{source} 검색 중 오류: {str(e)}")
+                outcomes[source] = SourceResult(source, [], "error", time.perf_counter() - started, str(e))
+        return outcomes
+
+    @staticmethod
+    def _timed(task: Callable[[], Any]):
+        started = time.perf_counter()
+        results = task()
+        return results, time.perf_counter() - started
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_source_executor() -> ThreadPoolExecutor:
+    """블로킹 스크래퍼 실행용 공용 스레드 풀을 반환합니다."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="source")
+    return _executor
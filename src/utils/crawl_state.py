@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+def content_hash(content: str) -> str:
+    """본문 내용의 해시값을 반환합니다."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class CrawlStateStore:
+    """뉴스룸 크롤링 상태 저장소 (출처별 수집 URL, 본문 해시, 마지막 수집 시각, 전체 수집 범위)"""
+
+    def __init__(self, path: str = os.path.join("data", "newsroom", "crawl_state.db")):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (':memory:' 사용 가능)
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                source TEXT NOT NULL,
+                url TEXT NOT NULL,
+                title TEXT,
+                date TEXT,
+                content TEXT,
+                content_hash TEXT,
+                fetched_at TEXT,
+                PRIMARY KEY (source, url)
+            );
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                source TEXT PRIMARY KEY,
+                last_crawl_at TEXT,
+                newest_date TEXT,
+                full_crawl_date TEXT
+            );
+        """)
+        self._conn.commit()
+
+    def get_article(self, source: str, url: str) -> Optional[Dict]:
+        """
+        이미 수집한 기사를 조회합니다.
+
+        Args:
+            source (str): 기사 출처
+            url (str): 기사 URL
+
+        Returns:
+            Optional[Dict]: 저장된 기사 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, date, content, content_hash, fetched_at FROM seen_articles "
+                "WHERE source = ? AND url = ?",
+                (source, url)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {
+            'url': url,
+            'title': row[0],
+            'date': row[1],
+            'content': row[2],
+            'content_hash': row[3],
+            'fetched_at': row[4]
+        }
+
+    def save_articles(self, source: str, articles: Iterable[Dict]) -> None:
+        """
+        수집한 기사를 저장합니다.
+
+        Args:
+            source (str): 기사 출처
+            articles (Iterable[Dict]): url, title, date, content를 포함한 기사 목록
+        """
+        fetched_at = datetime.now().isoformat()
+        rows = [
+            (source, article['url'], article.get('title', ''), article.get('date', ''),
+             article['content'], content_hash(article['content']), fetched_at)
+            for article in articles
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles "
+                "(source, url, title, date, content, content_hash, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_crawl_state(self, source: str) -> Optional[Dict]:
+        """
+        출처별 마지막 수집 시각, 가장 최근 기사 날짜, 전체 수집 범위를 반환합니다.
+        full_crawl_date 이하 날짜의 기사는 모두 저장되어 있습니다. (전체 수집한 적이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_crawl_at, newest_date, full_crawl_date FROM crawl_state WHERE source = ?",
+                (source,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {'source': source, 'last_crawl_at': row[0], 'newest_date': row[1], 'full_crawl_date': row[2]}
+
+    def record_crawl(self, source: str, newest_date: Optional[str] = None, full: bool = False) -> None:
+        """
+        크롤링 완료 시각과 가장 최근 기사 날짜를 기록합니다.
+
+        Args:
+            source (str): 기사 출처
+            newest_date (Optional[str]): 이번 크롤링에서 본 가장 최근 기사 날짜
+            full (bool): 목록 끝(또는 이전 전체 수집 범위)까지 건너뛴 기사 없이 모두 저장했는지 여부
+        """
+        state = self.get_crawl_state(source)
+        full_crawl_date = newest_date if full else None
+        if state and state['full_crawl_date'] and (not full_crawl_date or state['full_crawl_date'] > full_crawl_date):
+            full_crawl_date = state['full_crawl_date']
+        if state and state['newest_date'] and (not newest_date or state['newest_date'] > newest_date):
+            newest_date = state['newest_date']
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl_state (source, last_crawl_at, newest_date, full_crawl_date) "
+                "VALUES (?, ?, ?, ?)",
+                (source, datetime.now().isoformat(), newest_date, full_crawl_date)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+_store: Optional[CrawlStateStore] = None
+_store_lock = threading.Lock()
+
+def get_crawl_state_store() -> CrawlStateStore:
+    """프로세스 공용 크롤링 상태 저장소를 반환합니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CrawlStateStore(
+                    os.getenv('NEWSROOM_CRAWL_STATE_PATH', os.path.join("data", "newsroom", "crawl_state.db"))
+                )
+    return _store
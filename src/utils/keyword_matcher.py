@@ -0,0 +1,149 @@
+from collections import Counter, deque
+from typing import Dict, Iterable, List, NamedTuple, Set
+
+class KeywordMatch(NamedTuple):
+    """텍스트에서 찾은 키워드 위치"""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤 기반 다중 키워드 검색기.
+    카테고리별 키워드 목록으로 한 번만 만들어 두면, 문서를 한 번 훑어서 모든 키워드의 위치를 찾습니다.
+    (키워드 수와 관계없이 문서 길이에 비례하는 시간, 대소문자 구분)
+    """
+
+    def __init__(self, keywords_by_category: Dict[str, Iterable[str]]):
+        """
+        Args:
+            keywords_by_category (Dict[str, Iterable[str]]): 카테고리 -> 키워드 리스트
+                (같은 키워드가 여러 카테고리에 있으면 카테고리마다 결과가 나옴)
+        """
+        self.keywords: List[str] = []
+        self._categories: List[List[str]] = []
+        index: Dict[str, int] = {}
+        for category, keywords in keywords_by_category.items():
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                if keyword not in index:
+                    index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self._categories.append([])
+                if category not in self._categories[index[keyword]]:
+                    self._categories[index[keyword]].append(category)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._build()
+
+    def _build(self) -> None:
+        # 1) 키워드 트라이
+        for keyword_id, keyword in enumerate(self.keywords):
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(keyword_id)
+
+        # 2) 너비 우선으로 실패 링크를 만들고, 실패 링크 쪽 출력(접미사 키워드)을 합침
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+
+    def _iter_ids(self, text: str):
+        """(키워드 번호, 끝 위치) 를 겹치는 것까지 모두 반환"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword_id in output[node]:
+                yield keyword_id, position + 1
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        텍스트에 등장하는 모든 키워드를 찾습니다. 겹치는 키워드(예: HBM, HBM3E)도 모두 포함됩니다.
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            List[KeywordMatch]: (키워드, 카테고리, 시작, 끝) 리스트 (끝 위치 순)
+        """
+        matches = []
+        for keyword_id, end in self._iter_ids(text):
+            keyword = self.keywords[keyword_id]
+            for category in self._categories[keyword_id]:
+                matches.append(KeywordMatch(keyword, category, end - len(keyword), end))
+        return matches
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """
+        텍스트에 한 번 이상 등장하는 키워드 집합을 반환합니다. (`keyword in text` 와 같은 기준)
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            Set[str]: 키워드 집합
+        """
+        return {self.keywords[keyword_id] for keyword_id, _ in self._iter_ids(text)}
+
+    def document_frequency(self, texts: Iterable[str]) -> Dict[str, int]:
+        """
+        키워드별로 등장하는 문서 수를 셉니다.
+
+        Args:
+            texts (Iterable[str]): 텍스트 리스트
+
+        Returns:
+            Dict[str, int]: 키워드 -> 문서 수 (등장한 키워드만, 키워드 등록 순서)
+        """
+        counts = Counter()
+        for text in texts:
+            counts.update(self.keywords_in(text))
+        return {keyword: counts[keyword] for keyword in self.keywords if counts[keyword]}
+
+    def isolate(self, text: str) -> str:
+        """
+        키워드 앞뒤에 공백을 넣어 형태소 분석기가 키워드를 한 단어로 보도록 합니다.
+        겹치는 키워드는 왼쪽에서부터 가장 긴 것을 우선합니다.
+
+        Args:
+            text (str): 원문
+
+        Returns:
+            str: 키워드가 공백으로 분리된 텍스트
+        """
+        spans = sorted(
+            ((end - len(self.keywords[keyword_id]), end) for keyword_id, end in self._iter_ids(text)),
+            key=lambda span: (span[0], -span[1])
+        )
+        parts = []
+        position = 0
+        for start, end in spans:
+            if start < position:
+                continue
+            parts.append(text[position:start])
+            parts.append(f" {text[start:end]} ")
+            position = end
+        parts.append(text[position:])
+        return ''.join(parts)
@@ -0,0 +1,39 @@
+import os
+import threading
+from typing import Iterable, List, Optional
+from kiwipiepy import Kiwi
+
+_kiwi: Optional[Kiwi] = None
+_kiwi_lock = threading.Lock()
+
+def get_kiwi() -> Kiwi:
+    """
+    프로세스 공용 Kiwi 형태소 분석기를 반환합니다. 모델은 처음 호출될 때 한 번만 로드됩니다.
+    내부 스레드 수는 환경 변수 KIWI_NUM_WORKERS 로 지정합니다. (기본값: CPU 코어 수)
+
+    Returns:
+        Kiwi: 형태소 분석기
+    """
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                num_workers = int(os.getenv("KIWI_NUM_WORKERS", str(os.cpu_count() or 1)))
+                _kiwi = Kiwi(num_workers=num_workers)
+    return _kiwi
+
+def tokenize_many(texts: Iterable[str], kiwi: Optional[Kiwi] = None) -> List[list]:
+    """
+    여러 텍스트를 한 번에 형태소 분석합니다. Kiwi 내부 스레드 풀에서 병렬로 처리됩니다.
+
+    Args:
+        texts (Iterable[str]): 분석할 텍스트
+        kiwi (Optional[Kiwi]): 사용할 분석기 (기본값: 공용 분석기)
+
+    Returns:
+        List[list]: 텍스트별 최적 분석 결과 토큰 리스트 (analyze(text)[0][0] 과 동일)
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    return list((kiwi or get_kiwi()).tokenize(texts))
@@ -0,0 +1,273 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 출처별 캐시 유지 시간(초). 최신순 정렬인 네이버는 짧게 유지
+DEFAULT_CACHE_TTLS = {
+    'google': 3600,
+    'naver': 600
+}
+
+class CacheBackend(ABC):
+    """검색 결과 캐시 저장소"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """저장된 값을 반환합니다. (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """값을 ttl초 동안 저장합니다."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+class LRUCacheBackend(CacheBackend):
+    """프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            max_entries (int): 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            clock (Callable[[], float]): 현재 시각 함수
+        """
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, self.clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+class RedisCacheBackend(CacheBackend):
+    """여러 프로세스/서버가 공유하는 Redis 캐시"""
+
+    def __init__(self, client, prefix: str = "search_cache:"):
+        """
+        Args:
+            client: redis.Redis 호환 클라이언트 (get/set/delete)
+            prefix (str): 키 접두어
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+class SearchCache:
+    """
+    외부 검색 API 응답 캐시.
+    유지 시간이 지난 결과도 stale 구간 동안은 즉시 반환하고 백그라운드에서 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 600,
+        stale_ratio: float = 1.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            backend (Optional[CacheBackend]): 캐시 저장소 (기본값: 프로세스 내 LRU)
+            ttls (Optional[Dict[str, float]]): 출처별 유지 시간(초)
+            default_ttl (float): 유지 시간이 지정되지 않은 출처에 적용할 값(초)
+            stale_ratio (float): 유지 시간 대비 stale 결과를 반환할 추가 구간 비율
+            clock (Callable[[], float]): 현재 시각 함수
+        """
+        self.backend = backend or LRUCacheBackend(clock=clock)
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.default_ttl = default_ttl
+        self.stale_ratio = stale_ratio
+        self.clock = clock
+
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def make_key(self, source: str, params: Dict[str, Any]) -> str:
+        """출처와 검색 조건으로 캐시 키를 만듭니다."""
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{source}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get_or_fetch(
+        self,
+        source: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Tuple[List[Dict], int]]
+    ) -> List[Dict]:
+        """
+        캐시된 결과를 반환하거나, 없으면 API를 호출하고 결과를 저장합니다.
+
+        Args:
+            source (str): 검색 출처 (google, naver ...)
+            params (Dict[str, Any]): 검색 조건 (keyword, num_results, date_range ...)
+            fetch (Callable[[], Tuple[List[Dict], int]]): 실제 API 호출 함수 (검색 결과, 페이지 요청 수)를 반환
+
+        Returns:
+            List[Dict]: 검색 결과
+        """
+        key = self.make_key(source, params)
+        ttl = self.ttls.get(source, self.default_ttl)
+
+        entry = self._load(key)
+        if entry is not None:
+            age = self.clock() - entry['stored_at']
+            # 캐시된 결과를 받는 데 들었던 페이지 요청 수만큼 할당량을 아낌
+            self._count(source, 'api_calls_saved', entry.get('api_calls', 1))
+            if age < ttl:
+                self._count(source, 'hits')
+                return entry['results']
+
+            # 유지 시간이 지났으면 이전 결과를 반환하고 백그라운드에서 갱신
+            self._count(source, 'stale_hits')
+            self._refresh_in_background(source, key, ttl, fetch)
+            return entry['results']
+
+        self._count(source, 'misses')
+        return self._fetch_and_store(source, key, ttl, fetch)
+
+    def invalidate(self, source: str, params: Dict[str, Any]) -> None:
+        self.backend.delete(self.make_key(source, params))
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        출처별 캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Dict]: 출처 -> hits, stale_hits, misses, refreshes, api_calls, api_calls_saved, hit_rate
+            (api_calls, api_calls_saved 는 검색 횟수가 아닌 페이지 요청 수)
+        """
+        with self._lock:
+            stats = {}
+            for source, counts in self._stats.items():
+                served = counts['hits'] + counts['stale_hits']
+                requests = served + counts['misses']
+                stats[source] = dict(
+                    counts,
+                    hit_rate=round(served / requests, 4) if requests else 0.0
+                )
+            return stats
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _load(self, key: str) -> Optional[Dict]:
+        try:
+            value = self.backend.get(key)
+            return json.loads(value) if value else None
+        except Exception as e:
+            logging.error(f"검색 캐시 조회 중 오류: {str(e)}")
+            return None
+
+    def _fetch_and_store(self, source: str, key: str, ttl: float, fetch: Callable[[], Tuple[List[Dict], int]]) -> List[Dict]:
+        results, api_calls = fetch()
+        self._count(source, 'api_calls', api_calls)
+
+        # 빈 결과는 캐시하지 않음 (페이지 요청 오류는 예외로 전달되어 저장되지 않음)
+        if results:
+            entry = {'stored_at': self.clock(), 'results': results, 'api_calls': api_calls}
+            try:
+                self.backend.set(key, json.dumps(entry, ensure_ascii=False, default=str),
+                                 ttl * (1 + self.stale_ratio))
+            except Exception as e:
+                logging.error(f"검색 캐시 저장 중 오류: {str(e)}")
+        return results
+
+    def _refresh_in_background(self, source: str, key: str, ttl: float, fetch: Callable[[], Tuple[List[Dict], int]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._count(source, 'refreshes')
+                self._fetch_and_store(source, key, ttl, fetch)
+            except Exception as e:
+                logging.error(f"검색 캐시 갱신 중 오류: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+    def _count(self, source: str, name: str, amount: int = 1) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(
+                source,
+                {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'api_calls': 0, 'api_calls_saved': 0}
+            )
+            counts[name] += amount
+
+def create_cache_backend() -> CacheBackend:
+    """
+    환경 변수 REDIS_HOST 가 설정되어 있고 연결되면 Redis, 아니면 프로세스 내 LRU 캐시를 사용합니다.
+
+    Returns:
+        CacheBackend: 캐시 저장소
+    """
+    redis_host = os.getenv("REDIS_HOST")
+    if redis_host:
+        try:
+            import redis
+            client = redis.Redis(host=redis_host, port=int(os.getenv("REDIS_PORT", "6379")))
+            client.ping()
+            return RedisCacheBackend(client)
+        except Exception as e:
+            logging.warning(f"Redis 캐시를 사용할 수 없어 메모리 캐시를 사용합니다: {str(e)}")
+    return LRUCacheBackend(max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024")))
+
+_cache: Optional[SearchCache] = None
+_cache_lock = threading.Lock()
+
+def get_search_cache() -> SearchCache:
+    """프로세스 공용 검색 캐시를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SearchCache(create_cache_backend())
+    return _cache
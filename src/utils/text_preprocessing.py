@@ -1,13 +1,27 @@
 import re
-from typing import List, Set
-from kiwipiepy import Kiwi
+import hashlib
+from typing import List, Set, Optional
+import kiwipiepy
+from .kiwi_registry import get_kiwi, tokenize_many
+from .token_cache import TokenCache, get_token_cache
+
+# 특수문자와 숫자를 한 번에 공백으로 치환 (연속 공백은 split/join 으로 정리)
+_NON_TEXT = re.compile(r'[^\w\s]|\d')
 
 class TextPreprocessor:
     """텍스트 전처리를 수행하는 클래스"""
     
-    def __init__(self):
-        self.kiwi = Kiwi()
+    # 전처리 규칙이 바뀌면 올려서 이전 토큰 캐시를 사용하지 않도록 함
+    PREPROCESS_VERSION = 1
+    
+    def __init__(self, token_cache: Optional[TokenCache] = None):
+        """
+        Args:
+            token_cache (Optional[TokenCache]): 형태소 분석 결과 캐시 (기본값: 공용 캐시)
+        """
+        self.kiwi = get_kiwi()
         self.stop_words = self._load_stop_words()
+        self.token_cache = token_cache or get_token_cache()
     
     def _load_stop_words(self) -> Set[str]:
         """불용어 목록을 로드합니다."""
@@ -29,22 +43,21 @@ class TextPreprocessor:
         Returns:
             str: 전처리된 텍스트
         """
-        # 소문자 변환
-        text = text.lower()
-        
-        # 특수문자 제거
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # 숫자 제거
-        text = re.sub(r'\d+', ' ', text)
-        
-        # 여러 공백을 하나로 변환
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 앞뒤 공백 제거
-        text = text.strip()
+        # 소문자 변환 후 특수문자/숫자 제거, 공백 정리
+        return ' '.join(_NON_TEXT.sub(' ', text.lower()).split())
+    
+    def preprocess_many(self, texts: List[str]) -> List[str]:
+        """
+        여러 텍스트를 전처리합니다.
         
-        return text
+        Args:
+            texts (List[str]): 전처리할 텍스트 리스트
+            
+        Returns:
+            List[str]: 전처리된 텍스트 리스트
+        """
+        sub = _NON_TEXT.sub
+        return [' '.join(sub(' ', text.lower()).split()) for text in texts]
     
     def tokenize(self, text: str) -> List[str]:
         """
@@ -56,19 +69,55 @@ class TextPreprocessor:
         Returns:
             List[str]: 토큰 리스트
         """
-        # 텍스트 전처리
-        text = self.preprocess(text)
-        
-        # 형태소 분석
-        result = self.kiwi.analyze(text)
+        return self.tokenize_many([text])[0]
+    
+    def tokenize_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        여러 텍스트를 한 번에 토큰화합니다. 이전에 분석한 텍스트는 캐시된 결과를 사용합니다.
         
-        # 명사, 동사, 형용사만 추출
-        tokens = []
-        for token in result[0][0]:
-            if token.tag.startswith(('NN', 'VV', 'VA')) and token.form not in self.stop_words:
-                tokens.append(token.form)
+        Args:
+            texts (List[str]): 토큰화할 텍스트 리스트
+            
+        Returns:
+            List[List[str]]: 텍스트별 토큰 리스트
+        """
+        return self.token_cache.get_many(self._cache_namespace('tokens', True), texts, self._compute_tokens)
+    
+    def morphemes_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        여러 텍스트를 전처리 후 형태소 분석하여 품사 구분 없이 전체 형태소를 반환합니다.
+        이전에 분석한 텍스트는 캐시된 결과를 사용합니다.
         
-        return tokens
+        Args:
+            texts (List[str]): 분석할 텍스트 리스트
+            
+        Returns:
+            List[List[str]]: 텍스트별 형태소 리스트
+        """
+        return self.token_cache.get_many(self._cache_namespace('morphemes', False), texts, self._compute_morphemes)
+    
+    def _compute_tokens(self, texts: List[str]) -> List[List[str]]:
+        processed_texts = self.preprocess_many(texts)
+        return [self._select_tokens(tokens) for tokens in tokenize_many(processed_texts, self.kiwi)]
+    
+    def _compute_morphemes(self, texts: List[str]) -> List[List[str]]:
+        processed_texts = self.preprocess_many(texts)
+        return [[token.form for token in tokens] for tokens in tokenize_many(processed_texts, self.kiwi)]
+    
+    def _cache_namespace(self, kind: str, uses_stop_words: bool) -> str:
+        """토큰 캐시 네임스페이스 (전처리 버전, 분석기 버전, 불용어 목록에 따라 달라짐)"""
+        parts = [kind, f"v{self.PREPROCESS_VERSION}", f"kiwi-{kiwipiepy.__version__}"]
+        if uses_stop_words:
+            stop_words = '\n'.join(sorted(self.stop_words))
+            parts.append(hashlib.sha256(stop_words.encode('utf-8')).hexdigest()[:16])
+        return ':'.join(parts)
+    
+    def _select_tokens(self, tokens) -> List[str]:
+        """명사, 동사, 형용사 중 불용어가 아닌 토큰만 추출합니다."""
+        return [
+            token.form for token in tokens
+            if token.tag.startswith(('NN', 'VV', 'VA')) and token.form not in self.stop_words
+        ]
     
     def remove_stop_words(self, tokens: List[str]) -> List[str]:
         """
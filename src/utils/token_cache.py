@@ -0,0 +1,175 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+class TokenCache:
+    """
+    형태소 분석 결과 캐시.
+    키는 (네임스페이스, 원문)의 해시이며, 네임스페이스에는 전처리 설정과 분석기 버전이 들어갑니다.
+    설정이 바뀌면 키가 달라지므로 이전 결과는 사용되지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 20000, path: Optional[str] = None):
+        """
+        Args:
+            max_entries (int): 메모리에 유지할 최대 문서 수
+            path (Optional[str]): SQLite 파일 경로 (None이면 메모리 캐시만 사용)
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+        self._conn = None
+        if path:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS tokens (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    tokens TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tokens_namespace ON tokens (namespace)")
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> str:
+        return hashlib.sha256(f"{namespace}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_many(
+        self,
+        namespace: str,
+        texts: List[str],
+        compute: Callable[[List[str]], List[List[str]]]
+    ) -> List[List[str]]:
+        """
+        텍스트별 토큰을 캐시에서 찾고, 없는 텍스트만 모아 한 번에 계산합니다.
+
+        Args:
+            namespace (str): 전처리 설정/분석기 버전을 나타내는 문자열
+            texts (List[str]): 원문 리스트
+            compute (Callable[[List[str]], List[List[str]]]): 캐시에 없는 원문들의 토큰을 계산하는 함수
+
+        Returns:
+            List[List[str]]: 텍스트별 토큰 리스트 (입력 순서 유지)
+        """
+        keys = [self.make_key(namespace, text) for text in texts]
+        found: Dict[str, List[str]] = {}
+        missing: Dict[str, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                tokens = self._entries.get(key)
+                if tokens is not None:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    found[key] = tokens
+                else:
+                    missing[key] = text
+
+            if missing and self._conn is not None:
+                for key, tokens in self._load(list(missing)).items():
+                    self._stats['disk_hits'] += 1
+                    found[key] = tokens
+                    self._remember(key, tokens)
+                    del missing[key]
+            self._stats['misses'] += len(missing)
+
+        if missing:
+            computed = compute(list(missing.values()))
+            with self._lock:
+                for key, tokens in zip(missing, computed):
+                    found[key] = tokens
+                    self._remember(key, tokens)
+                if self._conn is not None:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO tokens (key, namespace, tokens) VALUES (?, ?, ?)",
+                        [(key, namespace, json.dumps(found[key], ensure_ascii=False)) for key in missing]
+                    )
+                    self._conn.commit()
+
+        return [list(found[key]) for key in keys]
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        캐시를 비웁니다. 메모리 캐시는 전체를, 디스크 캐시는 지정한 네임스페이스만 삭제합니다.
+
+        Args:
+            namespace (Optional[str]): 삭제할 네임스페이스 (None이면 전체)
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                if namespace is None:
+                    self._conn.execute("DELETE FROM tokens")
+                else:
+                    self._conn.execute("DELETE FROM tokens WHERE namespace = ?", (namespace,))
+                self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict: hits, disk_hits, misses, hit_rate, size, max_entries
+        """
+        with self._lock:
+            served = self._stats['hits'] + self._stats['disk_hits']
+            requests = served + self._stats['misses']
+            return dict(
+                self._stats,
+                hit_rate=round(served / requests, 4) if requests else 0.0,
+                size=len(self._entries),
+                max_entries=self.max_entries
+            )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _remember(self, key: str, tokens: List[str]) -> None:
+        self._entries[key] = tokens
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, List[str]]:
+        loaded = {}
+        # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나누어 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self._conn.execute(
+                f"SELECT key, tokens FROM tokens WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            loaded.update((key, json.loads(tokens)) for key, tokens in rows)
+        return loaded
+
+_cache: Optional[TokenCache] = None
+_cache_lock = threading.Lock()
+
+def get_token_cache() -> TokenCache:
+    """
+    프로세스 공용 토큰 캐시를 반환합니다.
+    환경 변수 TOKEN_CACHE_PATH 가 설정되면 SQLite 파일에도 저장합니다.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TokenCache(
+                    max_entries=int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "20000")),
+                    path=os.getenv("TOKEN_CACHE_PATH") or None
+                )
+    return _cache
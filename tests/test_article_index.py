@@ -0,0 +1,98 @@
+import numpy as np
+from src.analyzers.article_index import ArticleIndex
+
+VOCABULARY = ["hbm", "메모리", "파운드리", "수율", "배터리"]
+
+def bag_of_words_encoder(texts):
+    """테스트용 임베딩: 단어 포함 여부를 정규화한 벡터"""
+    vectors = np.array([[float(word in text.lower()) for word in VOCABULARY] for text in texts], dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+ARTICLES = {
+    1: "SK하이닉스가 HBM 메모리 신제품을 공개했다. 고대역폭 메모리 시장 공략에 나선다.",
+    2: "SK하이닉스가 HBM 메모리 신제품을 공개했다. 고대역폭 메모리 시장 공략에 나선다!",
+    3: "삼성전자 파운드리 수율 개선 소식",
+    4: "HBM 메모리 수요 증가로 SK하이닉스 실적 개선",
+    5: "전기차 배터리 공급 계약 체결"
+}
+
+def build_index(path=None):
+    index = ArticleIndex(path=path, encoder=bag_of_words_encoder, embed_batch_size=2)
+    for article_id, text in ARTICLES.items():
+        index.add(article_id, text)
+    index.flush()
+    return index
+
+def test_near_duplicates_and_related():
+    index = build_index()
+    assert [article_id for article_id, _ in index.near_duplicates(ARTICLES[1], exclude=1)] == [2]
+
+    related = index.related(article_id=4, k=2)
+    assert {article_id for article_id, _ in related} == {1, 2}
+    assert 4 not in [article_id for article_id, _ in index.related(article_id=4, k=10)]
+
+    assert index.related(text="파운드리 수율", k=1)[0][0] == 3
+
+def test_index_persists_to_disk(tmp_path):
+    index = build_index(str(tmp_path))
+    index.save()
+
+    reloaded = ArticleIndex(path=str(tmp_path), encoder=bag_of_words_encoder)
+    assert len(reloaded) == 5
+    assert reloaded.related(article_id=5, k=1) == index.related(article_id=5, k=1)
+    assert [i for i, _ in reloaded.near_duplicates(ARTICLES[2], exclude=2)] == [1]
+
+    reloaded.add(6, "HBM 메모리 증설")
+    reloaded.flush()
+    assert reloaded.related(text="HBM 메모리", k=1)[0][1] > 0.99
+
+def test_add_does_not_embed_in_caller(tmp_path):
+    calls = []
+    def recording_encoder(texts):
+        calls.append(len(texts))
+        return bag_of_words_encoder(texts)
+
+    index = ArticleIndex(path=str(tmp_path), encoder=recording_encoder, embed_batch_size=100)
+    index.add(1, ARTICLES[1])
+    assert calls == []
+
+    # 임베딩되지 않은 기사도 저장 후 다시 불러오면 백그라운드에서 계산
+    index.save()
+    reloaded = ArticleIndex(path=str(tmp_path), encoder=recording_encoder)
+    reloaded.flush()
+    assert reloaded.related(text="HBM 메모리", k=1)[0][0] == 1
+
+def test_related_searches_only_embedded_articles():
+    calls = []
+    def recording_encoder(texts):
+        calls.append(len(texts))
+        return bag_of_words_encoder(texts)
+
+    index = ArticleIndex(path=None, encoder=recording_encoder, embed_batch_size=100)
+    index.add(1, ARTICLES[1])
+    index.add(4, ARTICLES[4])
+
+    # 질의 텍스트만 임베딩하고 쌓인 기사는 요청 스레드에서 계산하지 않음
+    assert index.related(text="HBM 메모리", k=2) == []
+    assert calls == [1]
+
+    # 배치 크기에 못 미친 나머지도 백필 후 백그라운드에서 계산
+    index.backfill([(3, ARTICLES[3])])
+    index.flush()
+    assert calls == [1, 3]
+    assert {article_id for article_id, _ in index.related(text="HBM 메모리", k=2)} == {1, 4}
+
+def test_related_top_k_is_taken_over_allowed_ids():
+    index = build_index()
+    related = index.related(article_id=4, k=2, allowed_ids=[3, 4, 5])
+    assert {article_id for article_id, _ in related} == {3, 5}
+    assert index.related(article_id=4, k=2, allowed_ids=[4]) == []
+
+def test_backfill_skips_indexed_articles():
+    index = build_index()
+    added = index.backfill([(1, ARTICLES[1]), (6, "HBM 메모리 증설"), (7, "배터리 공장 착공")])
+    index.flush()
+    assert added == 2
+    assert len(index) == 7
+    assert index.related(text="배터리", k=2)[0][0] in {5, 7}
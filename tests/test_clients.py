@@ -0,0 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
+from src.scrapers import clients, search_manager
+
+def test_google_service_is_built_once_per_key(monkeypatch):
+    calls = []
+
+    def fake_build(*args, **kwargs):
+        calls.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(clients, "build", fake_build)
+    monkeypatch.setattr(clients, "_google_services", {})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        services = list(executor.map(lambda _: clients.get_google_service("key"), range(32)))
+
+    assert len(calls) == 1
+    assert calls[0]['static_discovery'] is True
+    assert all(service is services[0] for service in services)
+    assert clients.get_google_service("other") is not services[0]
+
+def test_search_manager_is_shared(monkeypatch):
+    monkeypatch.setattr(clients, "build", lambda *args, **kwargs: object())
+    monkeypatch.setattr(clients, "_google_services", {})
+    monkeypatch.setattr(search_manager, "_manager", None)
+
+    assert search_manager.get_search_manager() is search_manager.get_search_manager()
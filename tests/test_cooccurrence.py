@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from src.analyzers.cooccurrence import (
+    build_incidence_matrix, cooccurrence_matrix, keyword_cooccurrence, pmi_matrix, split_windows
+)
+
+KEYWORDS = ['HBM', 'DRAM', 'CEO', 'AI', 'HBM']
+TEXTS = [
+    "HBM DRAM 양산",
+    "CEO AI 전략 HBM",
+    "DRAM 가격 DRAM",
+    "관련 없음",
+]
+
+def brute_force_counts(texts, keywords):
+    keywords = list(dict.fromkeys(keywords))
+    counts = np.zeros((len(keywords), len(keywords)), dtype=int)
+    for text in texts:
+        words = set(text.split())
+        for i, first in enumerate(keywords):
+            for j, second in enumerate(keywords):
+                if i != j and first in words and second in words:
+                    counts[i, j] += 1
+    return counts
+
+def test_counts_match_pairwise_scan():
+    table = keyword_cooccurrence(TEXTS, KEYWORDS)
+    assert list(table.index) == ['HBM', 'DRAM', 'CEO', 'AI']
+    assert (table.values == brute_force_counts(TEXTS, KEYWORDS)).all()
+
+def test_diagonal_of_cooccurrence_is_unit_frequency():
+    incidence, vocabulary = build_incidence_matrix(TEXTS, KEYWORDS)
+    assert incidence.shape == (4, 4)
+    assert cooccurrence_matrix(incidence).diagonal().tolist() == [2, 2, 1, 1]
+
+def test_sentence_window_only_counts_pairs_in_same_sentence():
+    texts = ["HBM DRAM 발표. CEO 인터뷰", "AI\nHBM"]
+    assert split_windows(texts[0], 'sentence') == ["HBM DRAM 발표.", "CEO 인터뷰"]
+    table = keyword_cooccurrence(texts, KEYWORDS, window='sentence')
+    assert table.loc['HBM', 'DRAM'] == 1
+    assert table.loc['HBM', 'CEO'] == 0
+    assert table.loc['AI', 'HBM'] == 0
+    assert keyword_cooccurrence(texts, KEYWORDS).loc['AI', 'HBM'] == 1
+
+def test_npmi_bounds():
+    incidence, _ = build_incidence_matrix(TEXTS, KEYWORDS)
+    counts = cooccurrence_matrix(incidence)
+    npmi = pmi_matrix(counts, incidence.shape[0], normalized=True).toarray()
+    # CEO 와 AI 는 항상 함께 나오므로 1
+    assert npmi[2, 3] == pytest.approx(1.0)
+    assert (npmi <= 1.0 + 1e-6).all() and (npmi >= -1.0 - 1e-6).all()
+    pmi = pmi_matrix(counts, incidence.shape[0]).toarray()
+    assert pmi[0, 1] == pytest.approx(np.log((1 / 4) / (2 / 4 * 2 / 4)))
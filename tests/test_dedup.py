@@ -0,0 +1,35 @@
+from src.scrapers.dedup import canonicalize_url, simhash, normalize_text, deduplicate
+
+def test_canonicalize_url_strips_tracking_and_mobile_host():
+    assert canonicalize_url("http://m.example.com/news/1/?utm_source=naver&id=3&fbclid=x#top") \
+        == "https://example.com/news/1?id=3"
+    assert canonicalize_url("https://www.Example.com/news/1?b=2&a=1") \
+        == canonicalize_url("https://example.com/news/1/?a=1&b=2")
+    assert canonicalize_url("") == ""
+
+def test_simhash_is_close_for_near_duplicates():
+    a = simhash(normalize_text("SK하이닉스, 세계 최초 HBM4 12단 샘플 공급 시작"))
+    b = simhash(normalize_text("[속보] SK하이닉스, 세계 최초 HBM4 12단 샘플 공급 시작"))
+    c = simhash(normalize_text("삼성전자 파운드리 2나노 공정 수율 개선 발표"))
+    assert bin(a ^ b).count('1') < bin(a ^ c).count('1')
+
+def test_deduplicate_merges_sources_by_url_and_text():
+    results = [
+        {'title': "SK하이닉스 HBM4 양산", 'link': "https://n.news.naver.com/article/001/1",
+         'original_link': "https://www.etnews.com/2025/1?utm_source=naver", 'snippet': "짧은 요약",
+         'date': "2025-03-01", 'source': 'naver'},
+        {'title': "SK하이닉스 HBM4 양산 - 전자신문", 'link': "https://etnews.com/2025/1",
+         'snippet': "SK하이닉스가 HBM4 양산을 시작했다는 더 긴 요약", 'date': "", 'source': 'google'},
+        {'title': "삼성전자, &quot;HBM3E 12단&quot; 공급 확대", 'link': "https://a.com/1",
+         'snippet': "삼성전자가 엔비디아에 HBM3E 12단 제품 공급을 확대한다", 'source': 'naver'},
+        {'title': "삼성전자 \"HBM3E 12단\" 공급 확대", 'link': "https://b.com/2",
+         'snippet': "삼성전자가 엔비디아에 HBM3E 12단 제품 공급을 확대한다", 'source': 'google'},
+    ]
+
+    merged = deduplicate(results)
+
+    assert len(merged) == 2
+    assert merged[0]['sources'] == ['naver', 'google']
+    assert merged[0]['snippet'] == "SK하이닉스가 HBM4 양산을 시작했다는 더 긴 요약"
+    assert merged[0]['date'] == "2025-03-01"
+    assert merged[1]['links'] == ["https://a.com/1", "https://b.com/2"]
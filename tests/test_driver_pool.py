@@ -0,0 +1,65 @@
+import pytest
+from src.scrapers.driver_pool import DriverPool, DriverPoolTimeout
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.crashed = False
+        self.window_handles = ["main"]
+        self.switch_to = self
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+@pytest.fixture
+def pool():
+    pool = DriverPool(max_size=2, max_pages=3, lease_timeout=0.1, driver_factory=FakeDriver)
+    yield pool
+    pool.close()
+
+def test_warm_up_creates_idle_drivers(pool):
+    assert pool.warm_up() == 2
+    metrics = pool.get_metrics()
+    assert metrics['size'] == 2
+    assert metrics['idle'] == 2
+    assert metrics['in_use'] == 0
+
+def test_lease_reuses_driver(pool):
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        assert second is first
+    assert pool.get_metrics()['created'] == 1
+
+def test_acquire_times_out_when_pool_exhausted(pool):
+    pool.acquire()
+    pool.acquire()
+    with pytest.raises(DriverPoolTimeout):
+        pool.acquire()
+    assert pool.get_metrics()['lease_timeouts'] == 1
+    assert pool.get_metrics()['occupancy'] == 1.0
+
+def test_driver_recycled_after_max_pages(pool):
+    with pool.lease() as pooled:
+        for _ in range(3):
+            pooled.get("https://example.com")
+    assert pooled.driver.quit_called
+    assert pool.get_metrics()['size'] == 0
+
+def test_crashed_driver_is_discarded(pool):
+    with pool.lease() as pooled:
+        pooled.driver.crashed = True
+    assert pooled.driver.quit_called
+    with pool.lease() as replacement:
+        assert replacement is not pooled
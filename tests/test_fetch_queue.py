@@ -0,0 +1,64 @@
+import time
+import threading
+from src.scrapers.fetch_queue import ArticleFetchQueue, HostThrottle
+
+def test_results_keep_submission_order():
+    def fetch(url):
+        # 뒤에 제출한 작업이 먼저 끝나도록 지연
+        time.sleep(0.05 if url.endswith("/0") else 0.0)
+        return f"content of {url}"
+
+    with ArticleFetchQueue(fetch, max_workers=4) as queue:
+        for i in range(5):
+            queue.submit({'url': f"https://example.com/{i}"})
+        results = [(item['url'], future.result()) for item, future in queue.drain()]
+
+    assert [url for url, _ in results] == [f"https://example.com/{i}" for i in range(5)]
+    assert results[0][1] == "content of https://example.com/0"
+
+def test_failed_fetch_is_reported_per_item():
+    def fetch(url):
+        if url.endswith("/bad"):
+            raise ValueError("boom")
+        return "ok"
+
+    with ArticleFetchQueue(fetch, max_workers=0) as queue:
+        queue.submit({'url': "https://example.com/good"})
+        queue.submit({'url': "https://example.com/bad"})
+        outcomes = [future.exception() is None for _, future in queue.drain()]
+
+    assert outcomes == [True, False]
+
+def test_host_throttle_caps_concurrency_per_host():
+    throttle = HostThrottle(max_per_host=2, delay=0.0)
+    active = {'example.com': 0, 'other.com': 0}
+    peak = {'example.com': 0, 'other.com': 0}
+    lock = threading.Lock()
+
+    def fetch(url):
+        host = url.split('/')[2]
+        with throttle.slot(url):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+        return ""
+
+    with ArticleFetchQueue(fetch, max_workers=8) as queue:
+        for i in range(6):
+            queue.submit({'url': f"https://example.com/{i}"})
+            queue.submit({'url': f"https://other.com/{i}"})
+        list(queue.drain())
+
+    assert peak['example.com'] == 2
+    assert peak['other.com'] == 2
+
+def test_host_throttle_spaces_requests():
+    throttle = HostThrottle(max_per_host=4, delay=0.05)
+    started = time.monotonic()
+    for _ in range(3):
+        with throttle.slot("https://example.com/"):
+            pass
+    assert time.monotonic() - started >= 0.1
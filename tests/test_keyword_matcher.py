@@ -0,0 +1,36 @@
+from src.utils.keyword_matcher import KeywordMatch, KeywordMatcher
+
+KEYWORDS = {
+    'semiconductor': ['HBM', 'HBM3', 'HBM3E', 'D램', '3D DRAM', 'DRAM'],
+    'companies': ['SK하이닉스', '삼성전자'],
+    'leadership': ['CEO', '혁신'],
+    'exploitation': ['CEO'],
+}
+
+TEXTS = [
+    "SK하이닉스 CEO가 HBM3E 와 3D DRAM 혁신을 발표",
+    "삼성전자 D램 가격",
+    "관련 키워드 없음",
+    "HBMHBM3",
+]
+
+def brute_force_frequency(texts):
+    keywords = list(dict.fromkeys(k for values in KEYWORDS.values() for k in values))
+    return {k: sum(1 for text in texts if k in text) for k in keywords if any(k in text for text in texts)}
+
+def test_find_all_reports_overlapping_matches_with_offsets_and_categories():
+    matches = KeywordMatcher(KEYWORDS).find_all("CEO HBM3E")
+    assert KeywordMatch('HBM', 'semiconductor', 4, 7) in matches
+    assert KeywordMatch('HBM3E', 'semiconductor', 4, 9) in matches
+    assert {m.category for m in matches if m.keyword == 'CEO'} == {'leadership', 'exploitation'}
+    for match in matches:
+        assert "CEO HBM3E"[match.start:match.end] == match.keyword
+
+def test_document_frequency_matches_substring_scan():
+    assert KeywordMatcher(KEYWORDS).document_frequency(TEXTS) == brute_force_frequency(TEXTS)
+
+def test_isolate_pads_leftmost_longest_keyword():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert matcher.isolate("HBM3E양산") == " HBM3E 양산"
+    assert matcher.isolate("3D DRAM") == " 3D DRAM "
+    assert matcher.isolate("없음") == "없음"
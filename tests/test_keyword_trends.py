@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.analyzers.keyword_trends import build_match_matrix, growth_rate, keyword_trend_report, keyword_trends
+from src.utils.keyword_matcher import KeywordMatcher
+
+MATCHER = KeywordMatcher({'semiconductor': ['HBM', 'DRAM'], 'leadership': ['CEO', '혁신']})
+
+DF = pd.DataFrame({
+    'date': ['2022-01-10', '2022-05-03', '2023-02-01', '2023-11-20', '2024-03-15', None],
+    'source': ['naver', 'google', 'naver', 'naver', 'google', 'naver'],
+    'processed_content': [
+        "HBM DRAM 양산", "CEO 혁신 HBM", "HBM 투자", "CEO 발표", "DRAM HBM 혁신", "HBM",
+    ],
+})
+
+def test_match_matrix_marks_documents_once_per_keyword():
+    matrix, keywords = build_match_matrix(["HBM HBM CEO", np.nan, ""], MATCHER)
+    assert keywords == ['HBM', 'DRAM', 'CEO', '혁신']
+    assert matrix.toarray().tolist() == [[1, 0, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+def test_yearly_counts_match_per_keyword_groupby():
+    df = DF.assign(year=pd.to_datetime(DF['date']).dt.year)
+    counts, documents = keyword_trends(df, MATCHER)
+    for keyword in MATCHER.keywords:
+        expected = df.groupby('year')['processed_content'].apply(lambda x: sum(keyword in t for t in x))
+        assert counts[keyword].tolist() == expected.tolist()
+    assert documents.tolist() == [2, 2, 1]
+
+def test_quarter_by_source_with_rolling_and_growth():
+    report = keyword_trend_report(DF, MATCHER, period='quarter', by=['source'], rolling_window=2)
+    counts = report['counts']
+    assert counts.index.names == ['source', 'quarter']
+    assert counts.loc[('naver', pd.Period('2023Q1')), 'HBM'] == 1
+    assert report['share'].loc[('google', pd.Period('2024Q1')), 'HBM'] == 1.0
+    # 문서가 없는 분기는 0으로 채워 2022Q1 ~ 2024Q1 전체 기간으로 계산
+    naver_rolling = report['rolling'].loc['naver', 'HBM']
+    assert list(naver_rolling.index) == list(pd.period_range('2022Q1', '2024Q1', freq='Q'))
+    assert naver_rolling.tolist() == [1.0, 0.5, 0.0, 0.0, 0.5, 0.5, 0.0, 0.0, 0.0]
+    growth = report['growth']
+    # 그룹의 첫 기간, 0에서 시작하는 기간은 NaN
+    assert np.isnan(growth.loc[('naver', pd.Period('2022Q1')), 'HBM'])
+    assert np.isnan(growth.loc[('naver', pd.Period('2023Q1')), 'HBM'])
+    assert growth.loc[('naver', pd.Period('2022Q2')), 'HBM'] == pytest.approx(-1.0)
+    assert growth.loc[('naver', pd.Period('2023Q2')), 'HBM'] == pytest.approx(-1.0)
+
+def test_missing_years_are_filled_before_growth():
+    counts = pd.DataFrame({'HBM': [4, 2]}, index=pd.Index([2021, 2023], name='year'))
+    growth = growth_rate(counts)['HBM']
+    assert list(growth.index) == [2021, 2022, 2023]
+    assert growth.loc[2022] == pytest.approx(-1.0)
+    assert np.isnan(growth.loc[2023])
+
+def test_growth_rate_is_nan_after_zero():
+    counts = pd.DataFrame({'HBM': [0, 3, 6]}, index=pd.Index([2021, 2022, 2023], name='year'))
+    growth = growth_rate(counts)['HBM']
+    assert np.isnan(growth.iloc[1])
+    assert growth.iloc[2] == pytest.approx(1.0)
@@ -0,0 +1,37 @@
+from src.utils.kiwi_registry import get_kiwi, tokenize_many
+from src.utils.text_preprocessing import TextPreprocessor
+from src.analyzers.text_analyzer import TextAnalyzer
+
+TEXTS = [
+    "SK하이닉스가 HBM4 샘플을 고객사에 공급했다",
+    "삼성전자는 파운드리 공정 수율을 개선했다고 밝혔다",
+    ""
+]
+
+def test_analyzers_share_one_kiwi():
+    analyzer = TextAnalyzer()
+    assert analyzer.kiwi is get_kiwi()
+    assert analyzer.preprocessor.kiwi is get_kiwi()
+
+def test_batch_tokenize_matches_single_analyze():
+    kiwi = get_kiwi()
+    batched = tokenize_many(TEXTS)
+    assert [[t.form for t in tokens] for tokens in batched] == \
+        [[t.form for t in kiwi.analyze(text)[0][0]] for text in TEXTS]
+
+def test_preprocessor_tokenize_many_matches_tokenize():
+    preprocessor = TextPreprocessor()
+    assert preprocessor.tokenize_many(TEXTS) == [preprocessor.tokenize(text) for text in TEXTS]
+
+def test_tokenize_uses_cache_and_stop_words_change_invalidates():
+    from src.utils.token_cache import TokenCache
+    cache = TokenCache(path=":memory:")
+    preprocessor = TextPreprocessor(token_cache=cache)
+
+    first = preprocessor.tokenize_many(TEXTS[:2])
+    assert preprocessor.tokenize_many(TEXTS[:2]) == first
+    assert cache.get_stats()['hits'] == 2
+
+    preprocessor.add_stop_words(["공급"])
+    assert "공급" not in preprocessor.tokenize(TEXTS[0])
+    assert cache.get_stats()['misses'] == 3
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from src.analyzers.topic_modeling import TopicModeler
+from src.analyzers.model_registry import ModelRegistry
+
+TEXTS = [
+    "SK하이닉스가 HBM4 샘플을 고객사에 공급했다",
+    "삼성전자는 파운드리 공정 수율을 개선했다고 밝혔다",
+    "SK하이닉스 HBM 매출이 크게 늘었다"
+]
+
+def train(texts):
+    modeler = TopicModeler()
+    modeler.prepare_corpus(texts)
+    modeler.train_model(num_topics=2, passes=1)
+    return modeler
+
+def test_save_and_infer_with_memory_mapped_model(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.save("news", train(TEXTS * 3)) == "news/v1"
+
+    loaded = registry.load("news")
+    assert isinstance(loaded.model.expElogbeta, np.memmap)
+    assert registry.load("news") is loaded
+
+    distributions = registry.infer("news", ["SK하이닉스 HBM 공급 확대"])
+    assert len(distributions) == 1
+    assert abs(sum(topic['probability'] for topic in distributions[0]) - 1.0) < 0.05
+
+def test_update_creates_new_version_from_previous_model(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    registry.save("news", train(TEXTS * 3))
+
+    assert registry.update("news", ["삼성전자 HBM 공급 계약"]) == "news/v2"
+    versions = registry.list_models()
+    assert [meta['version'] for meta in versions] == [1, 2]
+    assert versions[1]['parent_version'] == 1
+    assert registry.load("news").model.num_topics == 2
+
+def test_unknown_or_invalid_model_name(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    with pytest.raises(KeyError):
+        registry.load("missing")
+    with pytest.raises(ValueError):
+        registry.load("../etc")
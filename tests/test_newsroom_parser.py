@@ -0,0 +1,152 @@
+from pathlib import Path
+import pytest
+from src.scrapers.newsroom_parser import (
+    parse_skhynix_list, parse_skhynix_article,
+    parse_samsung_list, parse_samsung_article
+)
+from src.scrapers.newsroom_scraper import SKHynixNewsScraper
+from src.scrapers.driver_pool import DriverPool
+from src.utils.crawl_state import CrawlStateStore
+
+FIXTURES = Path(__file__).parent / "fixtures" / "newsroom"
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+def test_parse_skhynix_list():
+    items = parse_skhynix_list(load_fixture("skhynix_list.html"), "https://news.skhynix.co.kr")
+    assert len(items) == 2
+    assert items[0]['title'].startswith("[2025 신임임원 인터뷰 5편]")
+    assert items[0]['url'] == "https://news.skhynix.co.kr/2025-new-executive-interview-5/"
+    assert items[0]['date'] == "2025.01.21"
+    assert items[0]['category'] == "기업문화"
+    assert items[0]['tags'] == ["#HBM", "#리더십"]
+    # 상대 경로는 절대 URL로 변환
+    assert items[1]['url'] == "https://news.skhynix.co.kr/press-2024-newsroom-review/"
+
+def test_parse_skhynix_article_skips_footnotes():
+    content = parse_skhynix_article(load_fixture("skhynix_article.html"))
+    lines = content.split('\n')
+    assert len(lines) == 3
+    assert "HBM사업기획을 총괄하는 최연소 임원으로 선임하며 업계의 주목을" in lines[1]
+    assert not any(line.startswith('* ') for line in lines)
+
+def test_parse_samsung_list():
+    items = parse_samsung_list(load_fixture("samsung_list.html"), "https://news.samsungsemiconductor.com")
+    assert len(items) == 2
+    assert items[0]['title'] == "삼성전자, 업계 최초 36GB HBM3E 12H D램 개발"
+    assert items[0]['category'] == "프레스센터"
+    assert items[0]['date'] == "2024/02/27"
+    assert items[1]['url'] == "https://news.samsungsemiconductor.com/kr/삼성전자-ddr5-양산/"
+    assert items[1]['description'] == ""
+
+def test_parse_samsung_article():
+    content = parse_samsung_article(load_fixture("samsung_article.html"))
+    assert content.split('\n') == [
+        "삼성전자가 업계 최초로 24Gb D램 칩을 TSV 기술로 12단까지 적층한 HBM3E 12H를 개발했다.",
+        "HBM3E 12H는 초당 최대 1,280GB의 대역폭과 현존 최대 용량인 36GB를 제공한다."
+    ]
+
+def test_parse_returns_empty_for_unrelated_html():
+    assert parse_skhynix_list("<html><body></body></html>", "https://news.skhynix.co.kr") == []
+    assert parse_skhynix_article("<html><body></body></html>") == ""
+
+class FakeResponse:
+    def __init__(self, text: str = "", status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        if url in self.pages:
+            return FakeResponse(load_fixture(self.pages[url]))
+        return FakeResponse(status_code=404)
+
+SKHYNIX_PAGES = {
+    "https://news.skhynix.co.kr/all/": "skhynix_list.html",
+    "https://news.skhynix.co.kr/all/page/2/": "skhynix_list.html",
+    "https://news.skhynix.co.kr/2025-new-executive-interview-5/": "skhynix_article.html",
+    "https://news.skhynix.co.kr/press-2024-newsroom-review/": "skhynix_article.html"
+}
+
+def no_driver():
+    raise AssertionError("Selenium 드라이버가 생성되면 안 됩니다.")
+
+def create_skhynix_scraper(session, crawl_state, **kwargs):
+    scraper = SKHynixNewsScraper(
+        pool=DriverPool(driver_factory=no_driver),
+        crawl_state=crawl_state,
+        politeness_delay=0.0,
+        **kwargs
+    )
+    scraper.session = session
+    return scraper
+
+def test_skhynix_search_uses_static_html_without_driver():
+    scraper = create_skhynix_scraper(FakeSession(SKHYNIX_PAGES), CrawlStateStore(":memory:"))
+
+    articles = scraper.search("SK하이닉스", num_results=3)
+    scraper.cleanup()
+
+    # 2페이지는 1페이지와 같은 기사이므로 다시 반환하지 않음
+    assert [article['url'] for article in articles] == [
+        "https://news.skhynix.co.kr/2025-new-executive-interview-5/",
+        "https://news.skhynix.co.kr/press-2024-newsroom-review/"
+    ]
+    assert articles[0]['source'] == 'sk_hynix'
+    assert articles[0]['content'].startswith("SK하이닉스가 2025년 신임임원 인사를")
+    assert scraper.lease is None
+
+def test_incremental_search_keeps_paging_until_full_crawl_range():
+    crawl_state = CrawlStateStore(":memory:")
+    first = create_skhynix_scraper(FakeSession(SKHYNIX_PAGES), crawl_state)
+    first.search("SK하이닉스", num_results=2)
+    state = crawl_state.get_crawl_state('sk_hynix')
+    assert state['newest_date'] == "2025.01.21"
+    # 개수 제한으로 목록 끝까지 보지 않았으므로 전체 수집 범위가 아님
+    assert state['full_crawl_date'] is None
+
+    session = FakeSession(SKHYNIX_PAGES)
+    second = create_skhynix_scraper(session, crawl_state, incremental=True)
+    articles = second.search("SK하이닉스", num_results=10)
+
+    # 이미 수집한 기사는 본문을 다시 받지 않지만, 이전 크롤링이 보지 않은 다음 페이지는 계속 탐색
+    assert session.requested == [
+        "https://news.skhynix.co.kr/all/",
+        "https://news.skhynix.co.kr/all/page/2/",
+        "https://news.skhynix.co.kr/all/page/3/"
+    ]
+    assert [article['cached'] for article in articles] == [True, True]
+    assert articles[0]['content'].startswith("SK하이닉스가 2025년 신임임원 인사를")
+    assert crawl_state.get_crawl_state('sk_hynix')['full_crawl_date'] == "2025.01.21"
+
+    # 전체 수집 범위에 닿으면 다음 페이지를 탐색하지 않음
+    session = FakeSession(SKHYNIX_PAGES)
+    third = create_skhynix_scraper(session, crawl_state, incremental=True)
+    assert len(third.search("SK하이닉스", num_results=10)) == 2
+    assert session.requested == ["https://news.skhynix.co.kr/all/"]
+
+def test_irrelevant_articles_are_not_fetched():
+    session = FakeSession(SKHYNIX_PAGES)
+    scraper = create_skhynix_scraper(session, CrawlStateStore(":memory:"))
+    articles = scraper.search("HBM", num_results=1)
+
+    assert [article['url'] for article in articles] == ["https://news.skhynix.co.kr/2025-new-executive-interview-5/"]
+    assert "https://news.skhynix.co.kr/press-2024-newsroom-review/" not in session.requested
+
+def test_site_search_keeps_results_matched_on_body():
+    pages = {
+        **SKHYNIX_PAGES,
+        "https://news.skhynix.co.kr/?s=%EC%88%98%EC%9C%A8&type=newsroom": "skhynix_list.html"
+    }
+    scraper = create_skhynix_scraper(FakeSession(pages), CrawlStateStore(":memory:"), use_site_search=True)
+
+    # 목록 메타데이터에 키워드가 없어도 뉴스룸 검색 결과는 그대로 수집
+    articles = scraper.search("수율", num_results=2)
+    assert len(articles) == 2
@@ -0,0 +1,60 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+import pytest
+from src.analyzers.ngram_counter import CountMinSketch, NgramCounter
+
+DF = pd.DataFrame({
+    'year': [2022, 2023, 2022, 2023, 2023],
+    'source': ['naver', 'google', 'google', 'naver', 'naver'],
+    'processed_content': [
+        "sk 하이닉스 hbm 양산",
+        "hbm 양산 확대",
+        "sk 하이닉스 실적",
+        "hbm 양산 hbm 양산",
+        "",
+    ],
+})
+
+def nltk_style_bigrams(texts):
+    counts = Counter()
+    for text in texts:
+        words = text.split()
+        counts.update(zip(words, words[1:]))
+    return [(' '.join(bigram), count) for bigram, count in counts.most_common()]
+
+def test_exact_counts_overall_and_per_group_in_one_pass():
+    counter = NgramCounter().add_dataframe(DF, group_columns=('year', 'source'))
+    assert counter.most_common() == nltk_style_bigrams(DF['processed_content'])
+    assert counter.groups('year') == [2022, 2023]
+    for year in (2022, 2023):
+        texts = DF[DF['year'] == year]['processed_content']
+        assert counter.most_common(group=('year', year)) == nltk_style_bigrams(texts)
+    assert counter.most_common(1, group=('source', 'naver')) == [('hbm 양산', 3)]
+
+def test_n_range_and_min_df():
+    counter = NgramCounter(n_range=(1, 2))
+    for text in DF['processed_content']:
+        counter.add(text.split())
+    counts = dict(counter.most_common())
+    assert counts['hbm'] == 4 and counts['sk 하이닉스'] == 2
+    # 'hbm 양산' 은 3개 문서, '양산 hbm' 은 1개 문서에만 나옴
+    filtered = dict(counter.most_common(min_df=2))
+    assert 'hbm 양산' in filtered and '양산 hbm' not in filtered
+
+def test_sketch_mode_finds_heavy_hitters_with_bounded_candidates():
+    counter = NgramCounter(mode='sketch', top_k=5, width=1024)
+    for i in range(300):
+        counter.add(['hbm', '양산'] + [f'noise{i}', f'word{i}'], {'year': 2020 + i % 2})
+    top = counter.most_common(1)
+    assert top[0][0] == 'hbm 양산' and top[0][1] >= 300
+    assert counter.most_common(1, group=('year', 2021))[0][0] == 'hbm 양산'
+    assert len(counter._sketches[None].candidates) <= 10
+
+def test_count_min_sketch_never_underestimates():
+    sketch = CountMinSketch(width=64, depth=3)
+    keys = np.arange(1, 500, dtype=np.uint64)
+    sketch.add(keys, np.ones(len(keys), dtype=np.uint32))
+    assert (sketch.query(keys) >= 1).all()
+    with pytest.raises(ValueError):
+        CountMinSketch(width=100)
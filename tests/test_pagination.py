@@ -0,0 +1,84 @@
+import threading
+from src.scrapers.pagination import build_pages, iter_pages
+from src.scrapers.naver_search import NaverSearchScraper
+from src.scrapers.google_search import GoogleSearchScraper
+
+def test_build_pages_respects_page_size_and_limit():
+    assert build_pages(25, 10, 100) == [(1, 10), (11, 10), (21, 5)]
+    # Google: start + num 이 100을 넘지 않도록 마지막 페이지를 줄임
+    assert build_pages(500, 10, GoogleSearchScraper.MAX_RESULTS)[-1] == (91, 9)
+    assert len(build_pages(5000, 100, 1000)) == 10
+    assert build_pages(0, 10, 100) == []
+
+def test_iter_pages_yields_in_order_and_stops_on_short_page():
+    requested = []
+    lock = threading.Lock()
+
+    def fetch_page(start, count):
+        with lock:
+            requested.append(start)
+        if start > 20:
+            return list(range(start, start + 3))
+        return list(range(start, start + count))
+
+    pages = list(iter_pages(fetch_page, build_pages(100, 10, 100), max_concurrency=2))
+
+    assert [page[0] for page in pages] == [1, 11, 21]
+    assert len(pages[-1]) == 3
+    # 짧은 페이지 이후로는 동시 요청 한도만큼만 미리 요청됨
+    assert len(requested) <= 5
+
+class FakeResponse:
+    def __init__(self, items):
+        self.items = items
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'items': self.items}
+
+class FakeNaverSession:
+    def __init__(self, total):
+        self.total = total
+        self.params = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        self.params.append(params)
+        start, display = params['start'], params['display']
+        end = min(start + display, self.total + 1)
+        return FakeResponse([
+            {'title': f"<b>기사</b> {i}", 'link': f"https://news.example.com/{i}",
+             'description': "", 'pubDate': ""}
+            for i in range(start, end)
+        ])
+
+def test_naver_search_pages_beyond_100_results():
+    scraper = NaverSearchScraper("id", "secret")
+    scraper.session = FakeNaverSession(total=250)
+
+    results = scraper.search("HBM", num_results=500)
+
+    assert len(results) == 250
+    assert results[0]['title'] == "기사 1"
+    assert results[-1]['link'] == "https://news.example.com/250"
+    assert sorted(p['start'] for p in scraper.session.params)[:3] == [1, 101, 201]
+
+class FailingNaverSession(FakeNaverSession):
+    def get(self, url, headers=None, params=None, timeout=None):
+        if params['start'] > 100:
+            raise ConnectionError("quota exceeded")
+        return super().get(url, headers, params, timeout)
+
+def test_partial_naver_results_are_returned_but_not_cached():
+    from src.utils.search_cache import SearchCache, LRUCacheBackend
+
+    cache = SearchCache(LRUCacheBackend())
+    scraper = NaverSearchScraper("id", "secret", max_concurrency=1, cache=cache)
+    scraper.session = FailingNaverSession(total=250)
+
+    assert len(scraper.search("HBM", num_results=250)) == 100
+
+    scraper.session = FakeNaverSession(total=250)
+    assert len(scraper.search("HBM", num_results=250)) == 250
+    assert cache.get_stats()['naver']['misses'] == 2
@@ -0,0 +1,48 @@
+from datetime import datetime
+from src.scrapers.relevance_filter import (
+    KeywordFilter, TagFilter, DateRangeFilter,
+    build_relevance_filter, date_range_cutoff, parse_article_date
+)
+
+ITEM = {
+    'title': "[2025 신임임원 인터뷰 5편] SK하이닉스 HBM사업기획 최준용 부사장",
+    'date': "2025.01.21",
+    'category': "기업문화",
+    'tags': ["#HBM", "#리더십"]
+}
+
+def test_keyword_filter_matches_title_and_tags():
+    assert KeywordFilter("hbm").accepts(ITEM)
+    assert KeywordFilter("리더십 부사장").accepts(ITEM)
+    assert not KeywordFilter("DDR5").accepts(ITEM)
+    assert KeywordFilter("").accepts(ITEM)
+
+def test_tag_filter():
+    assert TagFilter(["리더십"]).accepts(ITEM)
+    assert not TagFilter(["ESG"]).accepts(ITEM)
+
+def test_parse_article_date_formats():
+    assert parse_article_date("2025.01.21") == datetime(2025, 1, 21)
+    assert parse_article_date("2024/02/27") == datetime(2024, 2, 27)
+    assert parse_article_date("날짜 정보 없음") is None
+
+def test_date_range_cutoff():
+    now = datetime(2025, 1, 31, 15, 30)
+    assert date_range_cutoff("w1", now) == datetime(2025, 1, 24)
+    assert date_range_cutoff("m1", now) == datetime(2025, 1, 1)
+    assert date_range_cutoff(None, now) is None
+    assert date_range_cutoff("x1", now) is None
+
+def test_date_range_filter_marks_older_articles_as_exhausted():
+    date_filter = DateRangeFilter(datetime(2025, 1, 1))
+    assert date_filter.accepts(ITEM)
+    assert not date_filter.is_exhausted(ITEM)
+
+    old_item = dict(ITEM, date="2024.12.27")
+    assert not date_filter.accepts(old_item)
+    assert date_filter.is_exhausted(old_item)
+
+def test_build_relevance_filter_combines_conditions():
+    relevance_filter = build_relevance_filter("HBM", tags=["리더십"])
+    assert relevance_filter.accepts(ITEM)
+    assert not relevance_filter.accepts(dict(ITEM, tags=[]))
@@ -0,0 +1,118 @@
+import time
+from src.utils.search_cache import SearchCache, LRUCacheBackend, RedisCacheBackend
+from src.scrapers import google_search
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeRedis:
+    """테스트용 Redis 대체 (get/set/delete, 만료 시간 무시)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode('utf-8')
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+def make_fetch(calls, results):
+    def fetch():
+        calls.append(1)
+        return list(results), 1
+    return fetch
+
+def test_lru_backend_evicts_and_expires():
+    clock = FakeClock()
+    backend = LRUCacheBackend(max_entries=2, clock=clock)
+    backend.set("a", "1", ttl=10)
+    backend.set("b", "2", ttl=10)
+    backend.get("a")
+    backend.set("c", "3", ttl=10)
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    clock.now += 11
+    assert backend.get("a") is None
+
+def test_cache_hit_avoids_api_call_and_counts_saved_quota():
+    cache = SearchCache(RedisCacheBackend(FakeRedis()), clock=FakeClock())
+    calls = []
+    params = {'keyword': "HBM", 'num_results': 10, 'date_range': None}
+
+    first = cache.get_or_fetch('google', params, make_fetch(calls, [{'title': "a"}]))
+    second = cache.get_or_fetch('google', dict(params), make_fetch(calls, [{'title': "b"}]))
+
+    assert first == second == [{'title': "a"}]
+    assert len(calls) == 1
+    stats = cache.get_stats()['google']
+    assert stats['api_calls_saved'] == 1
+    assert stats['hit_rate'] == 0.5
+
+def test_stale_entry_is_served_then_refreshed():
+    clock = FakeClock()
+    cache = SearchCache(ttls={'naver': 60}, clock=clock)
+    calls = []
+    params = {'keyword': "HBM"}
+    cache.get_or_fetch('naver', params, make_fetch(calls, [{'title': "old"}]))
+
+    clock.now += 90
+    stale = cache.get_or_fetch('naver', params, make_fetch(calls, [{'title': "new"}]))
+    assert stale == [{'title': "old"}]
+
+    for _ in range(100):
+        if len(calls) == 2 and cache.get_or_fetch('naver', params, make_fetch([], [])) == [{'title': "new"}]:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_fetch('naver', params, make_fetch(calls, [])) == [{'title': "new"}]
+    assert cache.get_stats()['naver']['refreshes'] == 1
+
+def test_empty_results_are_not_cached():
+    cache = SearchCache(clock=FakeClock())
+    calls = []
+    cache.get_or_fetch('google', {'keyword': "x"}, make_fetch(calls, []))
+    cache.get_or_fetch('google', {'keyword': "x"}, make_fetch(calls, []))
+    assert len(calls) == 2
+
+class FakeGoogleRequest:
+    def __init__(self, items):
+        self.items = items
+
+    def execute(self, http=None):
+        return {'items': self.items}
+
+class FakeGoogleService:
+    """테스트용 Custom Search 클라이언트 (cse().list(...).execute())"""
+
+    def __init__(self):
+        self.requests = []
+
+    def cse(self):
+        return self
+
+    def list(self, q, cx, num, start, dateRestrict=None):
+        self.requests.append(start)
+        return FakeGoogleRequest([{'title': f"{q} {i}", 'link': f"https://example.com/{i}"}
+                                  for i in range(start, start + num)])
+
+def test_cached_google_search_counts_saved_page_requests(monkeypatch):
+    service = FakeGoogleService()
+    monkeypatch.setattr(google_search, "get_google_service", lambda api_key: service)
+    cache = SearchCache(clock=FakeClock())
+    scraper = google_search.GoogleSearchScraper("key", "cx", cache=cache)
+
+    assert len(scraper.search("HBM", num_results=30)) == 30
+    assert len(scraper.search("HBM", num_results=30)) == 30
+
+    # 30개 결과는 10개씩 3페이지이므로 캐시 적중 한 번에 3번의 요청을 아낌
+    assert len(service.requests) == 3
+    stats = cache.get_stats()['google']
+    assert stats['api_calls'] == 3
+    assert stats['api_calls_saved'] == 3
@@ -0,0 +1,33 @@
+import numpy as np
+from src.analyzers.similarity import build_term_matrix, similarity_matrix, top_k_similar
+
+DOCS = [
+    ["hbm", "sk", "공급"],
+    ["hbm", "sk", "양산"],
+    ["파운드리", "수율"],
+    []
+]
+
+def jaccard(a, b):
+    union = set(a) | set(b)
+    return len(set(a) & set(b)) / len(union) if union else 0.0
+
+def test_jaccard_matrix_matches_pairwise_sets():
+    matrix, vocabulary = build_term_matrix(DOCS)
+    assert len(vocabulary) == 6
+    result = similarity_matrix(matrix, 'jaccard', chunk_size=3)
+    expected = np.array([[jaccard(a, b) for b in DOCS] for a in DOCS])
+    assert np.allclose(result, expected)
+
+def test_cosine_matrix_is_normalized():
+    matrix, _ = build_term_matrix(DOCS, weighting='tfidf')
+    result = similarity_matrix(matrix, 'cosine', chunk_size=2)
+    assert np.allclose(np.diag(result)[:3], 1.0)
+    assert result[0, 1] > result[0, 2] == 0.0
+
+def test_top_k_excludes_self_and_sorts_by_score():
+    matrix, _ = build_term_matrix(DOCS)
+    neighbors = top_k_similar(matrix, k=2, chunk_size=2)
+    assert neighbors[0][0] == (1, 0.5)
+    assert all(index != row for row, pairs in enumerate(neighbors) for index, _ in pairs)
+    assert all(len(pairs) == 2 for pairs in neighbors)
@@ -0,0 +1,53 @@
+import time
+import asyncio
+from src.scrapers.source_orchestrator import SourceOrchestrator
+
+def slow_source():
+    time.sleep(0.5)
+    return [{'title': 'slow'}]
+
+def fast_source():
+    return [{'title': 'fast'}]
+
+def broken_source():
+    raise RuntimeError("API down")
+
+async def async_source():
+    await asyncio.sleep(0.01)
+    return [{'title': 'async'}]
+
+def test_run_returns_partial_results_on_timeout():
+    orchestrator = SourceOrchestrator(timeouts={'slow': 0.1, 'fast': 1.0, 'broken': 1.0, 'async': 1.0})
+    started = time.perf_counter()
+    results = asyncio.run(orchestrator.run({
+        'slow': slow_source,
+        'fast': fast_source,
+        'broken': broken_source,
+        'async': async_source
+    }))
+
+    assert time.perf_counter() - started < 0.4
+    assert list(results) == ['slow', 'fast', 'broken', 'async']
+    assert results['slow'].status == "timeout"
+    assert results['fast'].results == [{'title': 'fast'}]
+    assert results['broken'].status == "error"
+    assert results['broken'].error == "API down"
+    assert results['async'].results == [{'title': 'async'}]
+
+def test_run_sync_executes_sources_concurrently():
+    def sleepy(title):
+        def task():
+            time.sleep(0.2)
+            return [{'title': title}]
+        return task
+
+    orchestrator = SourceOrchestrator(default_timeout=1.0)
+    started = time.perf_counter()
+    results = orchestrator.run_sync({'a': sleepy('a'), 'b': sleepy('b'), 'c': sleepy('c')})
+
+    assert time.perf_counter() - started < 0.5
+    assert [result.results[0]['title'] for result in results.values()] == ['a', 'b', 'c']
+    timing = results['a'].to_dict()
+    assert timing['status'] == "ok"
+    assert timing['count'] == 1
+    assert timing['elapsed_ms'] >= 200
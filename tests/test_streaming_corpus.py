@@ -0,0 +1,56 @@
+import json
+from gensim import corpora
+from src.analyzers.streaming_corpus import iter_csv_texts, iter_json_texts, iter_db_texts
+from src.analyzers.topic_modeling import TopicModeler
+
+TEXTS = [
+    "SK하이닉스가 HBM4 샘플을 고객사에 공급했다",
+    "삼성전자는 파운드리 공정 수율을 개선했다고 밝혔다",
+    "SK하이닉스 HBM 매출이 크게 늘었다"
+]
+
+def test_readers_stream_documents(tmp_path):
+    csv_path = tmp_path / "articles.csv"
+    csv_path.write_text("title,content\na," + TEXTS[0] + "\nb,\nc," + TEXTS[1] + "\n", encoding="utf-8")
+    assert list(iter_csv_texts(str(csv_path), chunksize=1)) == TEXTS[:2]
+
+    json_dir = tmp_path / "sk_hynix"
+    json_dir.mkdir()
+    (json_dir / "20250101_000000.json").write_text(
+        json.dumps([{'title': "a", 'content': TEXTS[0]}, {'title': "b", 'content': ""}], ensure_ascii=False),
+        encoding="utf-8"
+    )
+    (json_dir / "20250102_000000.json").write_text(
+        json.dumps([{'title': "c", 'content': TEXTS[2]}], ensure_ascii=False), encoding="utf-8"
+    )
+    assert list(iter_json_texts(str(json_dir))) == [TEXTS[0], TEXTS[2]]
+
+def test_db_reader_streams_news_data():
+    from sqlalchemy import create_engine, text
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE news_data (id INTEGER PRIMARY KEY, content TEXT)"))
+        for i, content in enumerate(TEXTS + [None]):
+            conn.execute(text("INSERT INTO news_data (id, content) VALUES (:id, :content)"),
+                         {'id': i, 'content': content})
+    assert list(iter_db_texts(engine, batch_size=2)) == TEXTS
+
+def test_streaming_corpus_matches_in_memory_corpus(tmp_path):
+    in_memory = TopicModeler()
+    in_memory.prepare_corpus(TEXTS)
+
+    streaming = TopicModeler()
+    streaming.prepare_corpus_streaming(iter(TEXTS), str(tmp_path / "corpus"), batch_size=2)
+
+    assert isinstance(streaming.corpus, corpora.MmCorpus)
+    assert len(streaming.corpus) == 3
+    to_words = lambda modeler: [
+        sorted((modeler.dictionary[i], c) for i, c in doc) for doc in modeler.corpus
+    ]
+    assert to_words(streaming) == to_words(in_memory)
+    assert list(streaming.tokenized_texts) == in_memory.tokenized_texts
+
+    loaded = TopicModeler()
+    loaded.load_corpus(str(tmp_path / "corpus"))
+    loaded.train_model(num_topics=2, passes=1)
+    assert len(loaded.get_topics(num_words=3)) == 2
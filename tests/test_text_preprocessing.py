@@ -0,0 +1,28 @@
+import re
+from src.utils.text_preprocessing import TextPreprocessor
+from src.utils.token_cache import TokenCache
+
+SAMPLES = [
+    "SK하이닉스, 2024년 HBM3E 양산!",
+    "  AI\t반도체\n\n수요 (전년 대비 +35%) 증가  ",
+    "snake_case 와 under_score 는 유지",
+    "ＨＢＭ　메모리…①②③ ٣ 아랍 숫자",
+    "",
+    "!!! 123 ...",
+]
+
+def legacy_preprocess(text):
+    text = text.lower()
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\d+', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+def test_preprocess_matches_previous_implementation():
+    preprocessor = TextPreprocessor(token_cache=TokenCache())
+    for text in SAMPLES:
+        assert preprocessor.preprocess(text) == legacy_preprocess(text)
+
+def test_preprocess_many_keeps_order():
+    preprocessor = TextPreprocessor(token_cache=TokenCache())
+    assert preprocessor.preprocess_many(SAMPLES) == [legacy_preprocess(text) for text in SAMPLES]
@@ -0,0 +1,39 @@
+from src.utils.token_cache import TokenCache
+
+def upper_tokens(calls):
+    def compute(texts):
+        calls.append(list(texts))
+        return [text.upper().split() for text in texts]
+    return compute
+
+def test_only_missing_texts_are_computed_once():
+    cache = TokenCache()
+    calls = []
+    assert cache.get_many("ns", ["a b", "c", "a b"], upper_tokens(calls)) == [["A", "B"], ["C"], ["A", "B"]]
+    assert cache.get_many("ns", ["c", "d"], upper_tokens(calls)) == [["C"], ["D"]]
+    assert calls == [["a b", "c"], ["d"]]
+    assert cache.get_stats()['hits'] == 1
+
+def test_namespace_separates_entries():
+    cache = TokenCache()
+    calls = []
+    cache.get_many("v1", ["a"], upper_tokens(calls))
+    cache.get_many("v2", ["a"], upper_tokens(calls))
+    assert len(calls) == 2
+
+def test_disk_store_survives_new_instance_and_evicts_memory(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    cache = TokenCache(max_entries=1, path=path)
+    cache.get_many("ns", ["a", "b"], upper_tokens([]))
+    assert cache.get_stats()['size'] == 1
+    cache.close()
+
+    calls = []
+    reopened = TokenCache(path=path)
+    assert reopened.get_many("ns", ["a", "b"], upper_tokens(calls)) == [["A"], ["B"]]
+    assert calls == []
+    assert reopened.get_stats()['disk_hits'] == 2
+
+    reopened.invalidate("ns")
+    reopened.get_many("ns", ["a"], upper_tokens(calls))
+    assert calls == [["a"]]
@@ -0,0 +1,34 @@
+import tempfile
+from src.analyzers.topic_modeling import TopicModeler
+
+TEXTS = [
+    "SK하이닉스가 HBM4 샘플을 고객사에 공급했다",
+    "삼성전자는 파운드리 공정 수율을 개선했다고 밝혔다",
+    "SK하이닉스 HBM 매출이 크게 늘었다"
+]
+
+def test_multicore_backend_reports_phase_timings():
+    modeler = TopicModeler(backend="multicore", workers=2)
+    modeler.prepare_corpus(TEXTS * 4)
+    modeler.train_model(num_topics=2, passes=1)
+    evaluation = modeler.evaluate_model(coherence='u_mass')
+
+    assert set(evaluation['timings']) == {'tokenize', 'corpus', 'train', 'perplexity', 'coherence'}
+    assert evaluation['coherence'] == evaluation['coherence']  # NaN 아님
+
+def test_sweep_topics_selects_best_model_and_stops_early(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    modeler = TopicModeler(workers=2)
+    modeler.prepare_corpus(TEXTS * 4)
+
+    result = modeler.sweep_topics(topic_range=range(2, 12), passes=1, patience=1, min_delta=1.0)
+
+    # 첫 토픽 수 이후 개선 기준을 넘지 못하므로 바로 중단
+    assert result['stopped_early']
+    assert [r['num_topics'] for r in result['curve']] == [2, 3]
+    assert result['best']['coherence'] == max(r['coherence'] for r in result['curve'])
+    assert modeler.model.num_topics == result['best']['num_topics']
+    # 임시 작업 디렉토리는 삭제되고 모델은 메모리에 남음
+    assert list(tmp_path.iterdir()) == []
+    assert 'model_path' not in result['best']
+    assert modeler.get_topics(num_words=3)
@@ -1,11 +1,19 @@
+import os
+import re
+import shutil
+import hashlib
+import logging
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from konlpy.tag import Mecab
-import re
 from collections import Counter
 from nltk import bigrams
 import nltk
-from sklearn.feature_extraction.text import CountVectorizer
+from src.utils.keyword_matcher import KeywordMatcher
+from src.analyzers.ngram_counter import NgramCounter
 
 # 도메인 키워드 정의
 domain_keywords = {
@@ -43,23 +51,102 @@ domain_keywords = {
 
 # 모든 도메인 키워드를 하나의 리스트로 통합
 all_domain_keywords = [keyword for keywords in domain_keywords.values() for keyword in keywords]
+domain_keyword_set = set(all_domain_keywords)
+
+# 도메인 키워드 검색기 (모든 키워드를 문서당 한 번에 검색)
+domain_keyword_matcher = KeywordMatcher(domain_keywords)
+
+MECAB_DIC_PATH = '/usr/local/lib/mecab/dic/mecab-ko-dic'
+USER_DIC_DIR = os.getenv('MECAB_USER_DIC_DIR', os.path.join('data', 'mecab'))
+
+def _has_final_consonant(word):
+    """마지막 글자가 한글이고 받침이 있으면 'T', 아니면 'F' (mecab-ko-dic 종성 유무 필드)"""
+    last = word[-1]
+    if '가' <= last <= '힣' and (ord(last) - ord('가')) % 28:
+        return 'T'
+    return 'F'
+
+def build_user_dictionary(keywords, output_dir=USER_DIC_DIR, dic_path=MECAB_DIC_PATH):
+    """
+    도메인 키워드를 Mecab 사용자 사전(.dic)으로 컴파일합니다.
+    결과 파일 이름에 키워드 집합의 해시가 들어가므로 키워드가 바뀌지 않으면 다시 빌드하지 않습니다.
+    Args:
+        keywords (iterable): 키워드 리스트 (공백이 들어간 키워드는 형태소 하나가 될 수 없어 제외)
+        output_dir (str): 사전 저장 디렉토리
+        dic_path (str): 시스템 사전(mecab-ko-dic) 경로
+    Returns:
+        str: 사용자 사전 경로 (mecab-dict-index 가 없거나 빌드에 실패하면 None)
+    """
+    words = sorted({keyword for keyword in keywords if keyword and ' ' not in keyword and ',' not in keyword})
+    digest = hashlib.sha1('\n'.join(words).encode('utf-8')).hexdigest()[:12]
+    user_dic = os.path.join(output_dir, f'user_dict_{digest}.dic')
+    if os.path.exists(user_dic):
+        return user_dic
+
+    indexer = shutil.which('mecab-dict-index') or next(
+        (path for path in ('/usr/local/libexec/mecab/mecab-dict-index', '/usr/libexec/mecab/mecab-dict-index')
+         if os.path.exists(path)),
+        None
+    )
+    if indexer is None:
+        logging.warning("mecab-dict-index 를 찾을 수 없어 사용자 사전 없이 분석합니다.")
+        return None
+
+    os.makedirs(output_dir, exist_ok=True)
+    # 여러 프로세스가 동시에 빌드해도 서로의 입력/출력을 덮어쓰지 않도록 프로세스별 임시 파일 사용
+    csv_path = os.path.join(output_dir, f'user_dict_{digest}.{os.getpid()}.csv')
+    # 표층형,좌문맥ID,우문맥ID,비용,품사,의미분류,종성유무,읽기,타입,첫번째품사,마지막품사,표현
+    # 문맥 ID는 비워 두면 시스템 사전의 left-id.def/right-id.def 로 채워짐
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        for word in words:
+            f.write(f"{word},,,0,NNP,*,{_has_final_consonant(word)},{word},*,*,*,*\n")
+
+    # 빌드 중인 파일을 다른 프로세스가 읽지 않도록 임시 파일에 만든 뒤 이름 변경
+    temp_dic = f'{user_dic}.{os.getpid()}.tmp'
+    try:
+        subprocess.run(
+            [indexer, '-d', dic_path, '-u', temp_dic, '-f', 'utf-8', '-t', 'utf-8', csv_path],
+            check=True, capture_output=True
+        )
+        os.replace(temp_dic, user_dic)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.error(f"Mecab 사용자 사전 빌드 중 오류 발생: {str(e)}")
+        if os.path.exists(temp_dic):
+            os.remove(temp_dic)
+        return None
+    finally:
+        os.remove(csv_path)
+    return user_dic
+
+_nltk_lock = threading.Lock()
+_nltk_ready = False
+
+def _ensure_nltk_data():
+    """NLTK 데이터(punkt)를 프로세스당 한 번만 확인/다운로드합니다."""
+    global _nltk_ready
+    with _nltk_lock:
+        if not _nltk_ready:
+            try:
+                nltk.data.find('tokenizers/punkt')
+            except LookupError:
+                nltk.download('punkt', quiet=True)
+            _nltk_ready = True
 
 class TextPreprocessor:
     def __init__(self, custom_dict_path=None):
         """
         텍스트 전처리기 초기화
+        Mecab 과 사용자 사전은 처음 형태소 분석을 할 때 불러옵니다.
         Args:
-            custom_dict_path (str): 사용자 사전 파일 경로
+            custom_dict_path (str): 컴파일된 사용자 사전(.dic) 경로
+                (None이면 domain_keywords 로 빌드, False이면 사용자 사전을 사용하지 않음)
         """
-        # 사용자 사전 생성
-        self._create_custom_dict()
-        
-        # Mecab 초기화 (사용자 사전 적용)
-        self.mecab = Mecab(dicpath='/usr/local/lib/mecab/dic/mecab-ko-dic')
-        # self.smecab = Mecab(dicpath='/usr/local/lib/mecab/dic/mecab-ko-dic', userdic='custom_dict.csv')
-        
-        # NLTK 초기화
-        nltk.download('punkt', quiet=True)
+        self.domain_keywords = domain_keywords
+        self.keyword_matcher = domain_keyword_matcher
+        self.custom_dict_path = custom_dict_path
+        self.user_dic = None
+        self._mecab = None
+        self._mecab_lock = threading.Lock()
         
         # 영어 키워드 패턴 컴파일
         self.english_pattern = re.compile(r'\b[A-Za-z]+[0-9]*[A-Za-z]*[0-9]*\b')
@@ -67,25 +154,24 @@ class TextPreprocessor:
         # 영어-한글 혼합 패턴 컴파일
         self.mixed_pattern = re.compile(r'[A-Za-z]+[가-힣]+|[가-힣]+[A-Za-z]+')
         
-        # CountVectorizer 초기화 (N-gram 추출용)
-        self.vectorizer = CountVectorizer(
-            ngram_range=(1, 2),
-            token_pattern=r'[가-힣A-Za-z0-9]+',
-            min_df=2
-        )
+        # N-gram 추출용 토큰 패턴
+        self.ngram_token_pattern = re.compile(r'[가-힣A-Za-z0-9]+')
     
-    def _create_custom_dict(self):
-        """사용자 사전 생성"""
-        custom_dict = []
-        for keyword in all_domain_keywords:
-            if ' ' in keyword:  # 복합어인 경우
-                custom_dict.append(f"{keyword},*,*,*,*,*,*,*,*,*,*,*,*,*")
-            else:  # 단일어인 경우
-                custom_dict.append(f"{keyword},*,*,*,*,*,*,*,*,*,*,*,*,*")
-        
-        # 사용자 사전 저장
-        with open('custom_dict.csv', 'w', encoding='utf-8') as f:
-            f.write('\n'.join(custom_dict))
+    @property
+    def mecab(self):
+        """사용자 사전을 적용한 Mecab (처음 사용할 때 로드)"""
+        if self._mecab is None:
+            with self._mecab_lock:
+                if self._mecab is None:
+                    _ensure_nltk_data()
+                    if self.custom_dict_path is None:
+                        self.user_dic = build_user_dictionary(all_domain_keywords)
+                    else:
+                        self.user_dic = self.custom_dict_path or None
+                    # konlpy Mecab 은 '-d <dicpath>' 로 Tagger 를 만들므로 사용자 사전 옵션을 덧붙여 전달
+                    dicpath = f'{MECAB_DIC_PATH} -u {self.user_dic}' if self.user_dic else MECAB_DIC_PATH
+                    self._mecab = Mecab(dicpath=dicpath)
+        return self._mecab
     
     def extract_english_terms(self, text):
         """영어 키워드 추출"""
@@ -113,15 +199,16 @@ class TextPreprocessor:
         for term in english_terms:
             text = text.replace(term, f" {term} ")
         
-        # 2. 도메인 키워드 보존
-        for keyword in all_domain_keywords:
-            text = text.replace(keyword, f" {keyword} ")
+        # 2. 도메인 키워드 보존 (사용자 사전이 없을 때만 공백으로 분리)
+        mecab = self.mecab
+        if self.user_dic is None:
+            text = self.keyword_matcher.isolate(text)
         
         # 3. 특수문자 제거
         text = re.sub(r'[^\w\s]', ' ', text)
         
         # 4. 형태소 분석
-        pos = self.mecab.pos(text)
+        pos = mecab.pos(text)
         
         # 5. 의미 있는 단어 추출
         words = []
@@ -132,7 +219,7 @@ class TextPreprocessor:
                 continue
             
             # 도메인 키워드는 보존
-            if word in all_domain_keywords:
+            if word in domain_keyword_set:
                 words.append(word)
                 continue
             
@@ -143,7 +230,7 @@ class TextPreprocessor:
         
         return ' '.join(words)
     
-    def extract_ngrams(self, texts, n_range=(2, 3)):
+    def extract_ngrams(self, texts, n_range=(1, 2)):
         """
         N-gram 추출 및 빈도 분석
         Args:
@@ -152,16 +239,11 @@ class TextPreprocessor:
         Returns:
             dict: N-gram 빈도
         """
-        # CountVectorizer로 N-gram 추출
-        ngram_matrix = self.vectorizer.fit_transform(texts)
-        
-        # N-gram 빈도 계산
-        ngram_freq = ngram_matrix.sum(axis=0).A1
-        ngram_features = self.vectorizer.get_feature_names_out()
-        
-        # 빈도순 정렬
-        ngram_dict = dict(zip(ngram_features, ngram_freq))
-        return dict(sorted(ngram_dict.items(), key=lambda x: x[1], reverse=True))
+        # 문서를 한 번씩 읽어 N-gram 빈도 계산 (2개 이상 문서에 나온 N-gram만, 빈도순 / 같은 빈도는 가나다순)
+        counter = NgramCounter(n_range=n_range)
+        for text in texts:
+            counter.add(self.ngram_token_pattern.findall(str(text).lower()))
+        return dict(sorted(counter.most_common(min_df=2), key=lambda x: (-x[1], x[0])))
     
     def analyze_keywords(self, texts):
         """
@@ -171,21 +253,102 @@ class TextPreprocessor:
         Returns:
             dict: 키워드 빈도
         """
-        keyword_freq = {}
-        for keyword in all_domain_keywords:
-            freq = sum(1 for text in texts if keyword in text)
-            if freq > 0:
-                keyword_freq[keyword] = freq
-        return keyword_freq
+        return self.keyword_matcher.document_frequency(texts)
     
-    def process_dataframe(self, df, text_column='content'):
+    def process_dataframe(self, df, text_column='content', workers=1, shard_size=200):
         """
         데이터프레임 전체 처리
         Args:
             df (DataFrame): 처리할 데이터프레임
             text_column (str): 텍스트 컬럼명
+            workers (int): 작업 프로세스 수 (1이면 현재 프로세스에서 처리)
+            shard_size (int): 작업 프로세스에 한 번에 넘길 행 수
+        Returns:
+            DataFrame: 처리된 데이터프레임 (행 순서 유지)
+        """
+        if workers <= 1:
+            df['processed_content'] = df[text_column].apply(self.preprocess_text)
+            return df
+        
+        with self._create_pool(workers) as executor:
+            df['processed_content'] = self._preprocess_parallel(df[text_column].tolist(), executor, shard_size)
+        return df
+    
+    def process_csv(self, csv_path, output_dir, text_column='content', chunksize=1000, workers=1, shard_size=200):
+        """
+        큰 CSV 파일을 청크 단위로 읽어 전처리하고, 청크마다 Parquet 파일(part-00000.parquet, ...)로 저장합니다.
+        이미 저장된 청크는 건너뛰므로 중단된 작업을 같은 인자로 다시 실행하면 이어서 처리합니다.
+        Args:
+            csv_path (str): CSV 파일 경로
+            output_dir (str): Parquet 파일 저장 디렉토리
+            text_column (str): 텍스트 컬럼명
+            chunksize (int): 한 번에 읽을 행 수 (바꾸면 기존 청크와 맞지 않으므로 새 디렉토리 사용)
+            workers (int): 작업 프로세스 수
+            shard_size (int): 작업 프로세스에 한 번에 넘길 행 수
         Returns:
-            DataFrame: 처리된 데이터프레임
+            list: 청크 순서대로 정렬된 Parquet 파일 경로 리스트 (pd.read_parquet(output_dir) 로 한 번에 읽을 수 있음)
         """
-        df['processed_content'] = df[text_column].apply(self.preprocess_text)
-        return df 
\ No newline at end of file
+        os.makedirs(output_dir, exist_ok=True)
+        executor = self._create_pool(workers) if workers > 1 else None
+        part_paths = []
+        try:
+            for index, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunksize)):
+                part_path = os.path.join(output_dir, f'part-{index:05d}.parquet')
+                part_paths.append(part_path)
+                if os.path.exists(part_path):
+                    continue
+                
+                texts = chunk[text_column].tolist()
+                if executor is None:
+                    chunk['processed_content'] = [self.preprocess_text(text) for text in texts]
+                else:
+                    chunk['processed_content'] = self._preprocess_parallel(texts, executor, shard_size)
+                
+                # 쓰는 도중 중단되어도 완성되지 않은 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+                temp_path = f'{part_path}.tmp'
+                chunk.to_parquet(temp_path, index=False)
+                os.replace(temp_path, part_path)
+                logging.info(f"{part_path} 저장 완료 ({len(chunk)} 행)")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return part_paths
+    
+    def _create_pool(self, workers):
+        # 사용자 사전은 현재 프로세스에서 한 번만 빌드하고, 작업 프로세스에는 완성된 사전 경로만 전달
+        self.mecab
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.user_dic,))
+    
+    @staticmethod
+    def _preprocess_parallel(texts, executor, shard_size):
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+        # executor.map 은 제출 순서대로 결과를 반환하므로 행 순서가 유지됨
+        return [processed for shard in executor.map(_preprocess_shard, shards) for processed in shard]
+
+_preprocessor = None
+_preprocessor_lock = threading.Lock()
+
+def get_preprocessor():
+    """프로세스 공용 TextPreprocessor 를 반환합니다."""
+    global _preprocessor
+    if _preprocessor is None:
+        with _preprocessor_lock:
+            if _preprocessor is None:
+                _preprocessor = TextPreprocessor()
+    return _preprocessor
+
+_worker_preprocessor = None
+
+def _init_worker(user_dic):
+    """
+    작업 프로세스 초기화: 전처리기를 만들고 Mecab 을 미리 로드
+    Args:
+        user_dic (str): 부모 프로세스가 빌드한 사용자 사전 경로 (None이면 사용자 사전 없이 분석)
+    """
+    global _worker_preprocessor
+    _worker_preprocessor = TextPreprocessor(user_dic or False)
+    _worker_preprocessor.mecab
+
+def _preprocess_shard(texts):
+    """작업 프로세스에서 텍스트 묶음을 전처리"""
+    return [_worker_preprocessor.preprocess_text(text) for text in texts]
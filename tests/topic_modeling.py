@@ -3,12 +3,12 @@ import numpy as np
 from gensim import corpora, models
 import pyLDAvis
 import pyLDAvis.gensim_models as gensimvis
-from tests.text_preprocessing import TextPreprocessor
+from tests.text_preprocessing import get_preprocessor
 
 class TopicModeler:
     def __init__(self, num_topics=3):
         self.num_topics = num_topics
-        self.preprocessor = TextPreprocessor()
+        self.preprocessor = get_preprocessor()
         
     def prepare_data(self, texts):
         """토픽 모델링을 위한 데이터 전처리"""